@@ -0,0 +1,177 @@
+"""
+ADB 화면 캡처 레이어 (UI XML + 스크린샷, 메모리 직행)
+
+기존: uiautomator dump → /sdcard 파일 → adb pull → 로컬 파일 → ET.parse
+현재: `adb exec-out` 스트림을 그대로 메모리로 받아서
+- UI XML: 청크 단위로 파서에 바로 공급 (증분 파싱), node 요소의
+  bounds / text / content-desc 속성만 남긴 경량 트리 생성
+- 스크린샷: PNG를 한 번만 디코드해 NumPy 배열로 보관 → 크롭은 배열 슬라이스
+
+캡처 종류별 전송/파싱 시간은 timings에 누적 (timing_summary()로 확인).
+"""
+
+import subprocess
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# 경량 트리에 남길 속성 (에이전트 파서가 쓰는 것만)
+KEEP_ATTRS = ('bounds', 'text', 'content-desc')
+
+_END_TAG = b'</hierarchy>'
+_CHUNK = 64 * 1024
+
+
+@dataclass
+class ScreenFrame:
+    """디코드된 스크린샷 1장 (H×W×3 uint8 RGB)"""
+    pixels: np.ndarray
+    captured_at: float
+
+    @property
+    def size(self):
+        h, w = self.pixels.shape[:2]
+        return w, h
+
+
+class _SlimTreeBuilder:
+    """XMLParser target: 요소 구조는 그대로, 속성은 KEEP_ATTRS만 보존"""
+
+    def __init__(self):
+        self._builder = ET.TreeBuilder()
+
+    def start(self, tag, attrib):
+        self._builder.start(tag, {k: attrib[k] for k in KEEP_ATTRS if k in attrib})
+
+    def end(self, tag):
+        self._builder.end(tag)
+
+    def data(self, data):
+        pass  # uiautomator XML은 텍스트 노드 없음 (들여쓰기 공백만)
+
+    def close(self):
+        return self._builder.close()
+
+
+class AdbCapture:
+    """
+    디바이스 1대의 UI/화면 캡처
+
+    Args:
+        adb_path: adb 실행 파일 경로
+        serial: 디바이스 시리얼 (None이면 adb 기본 디바이스)
+    """
+
+    def __init__(self, adb_path: str, serial: Optional[str] = None):
+        self.adb_path = adb_path
+        self.serial = serial
+        # 종류('ui' | 'screen') → [횟수, 전송 초, 파싱/디코드 초, 바이트]
+        self.timings: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0, 0])
+        self.last: Dict[str, float] = {}
+
+    def _exec_out(self, args: List[str]) -> subprocess.Popen:
+        cmd = [self.adb_path]
+        if self.serial:
+            cmd += ['-s', self.serial]
+        return subprocess.Popen(cmd + ['exec-out'] + args,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    def _record(self, kind: str, transfer: float, parse: float, size: int):
+        stat = self.timings[kind]
+        stat[0] += 1
+        stat[1] += transfer
+        stat[2] += parse
+        stat[3] += size
+        self.last = {'kind': kind, 'transfer_ms': transfer * 1000,
+                     'parse_ms': parse * 1000, 'bytes': size}
+
+    def dump_ui(self, timeout: float = 15) -> Optional[ET.Element]:
+        """
+        UI 트리 캡처 → 경량 ElementTree 루트 (실패 시 None)
+
+        uiautomator가 /dev/tty로 XML을 쓰고 끝에 안내 문구를 붙이므로
+        </hierarchy>까지만 파서에 공급한다.
+        """
+        start = time.perf_counter()
+        proc = self._exec_out(['uiautomator', 'dump', '/dev/tty'])
+        killer = threading.Timer(timeout, proc.kill)  # 응답 없으면 스트림 강제 종료
+        killer.start()
+        target = _SlimTreeBuilder()
+        parser = ET.XMLParser(target=target)
+        parse_time = 0.0
+        received = 0
+        tail = b''
+        done = False
+        try:
+            while not done:
+                chunk = proc.stdout.read1(_CHUNK)
+                if not chunk:
+                    break
+                received += len(chunk)
+                # 청크 경계에 걸친 종료 태그까지 탐지
+                window = tail + chunk
+                idx = window.find(_END_TAG)
+                if idx >= 0:
+                    chunk = chunk[:max(0, idx + len(_END_TAG) - len(tail))]
+                    done = True
+                tail = window[-len(_END_TAG):]
+                t0 = time.perf_counter()
+                parser.feed(chunk)
+                parse_time += time.perf_counter() - t0
+            if not done:
+                return None
+            t0 = time.perf_counter()
+            root = parser.close()
+            parse_time += time.perf_counter() - t0
+        except ET.ParseError:
+            return None
+        finally:
+            killer.cancel()
+            proc.kill()
+            proc.wait()
+
+        total = time.perf_counter() - start
+        self._record('ui', total - parse_time, parse_time, received)
+        return root
+
+    def screenshot(self, timeout: float = 15) -> Optional[ScreenFrame]:
+        """스크린샷 캡처 → 1회 디코드된 RGB 배열 (실패 시 None)"""
+        from PIL import Image as PILImage
+
+        start = time.perf_counter()
+        proc = self._exec_out(['screencap', '-p'])
+        try:
+            png, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return None
+        transfer = time.perf_counter() - start
+        if not png:
+            return None
+
+        t0 = time.perf_counter()
+        try:
+            with PILImage.open(BytesIO(png)) as img:
+                pixels = np.asarray(img.convert('RGB'))
+        except Exception:
+            return None
+        decode = time.perf_counter() - t0
+
+        self._record('screen', transfer, decode, len(png))
+        return ScreenFrame(pixels=pixels, captured_at=time.time())
+
+    def timing_summary(self) -> str:
+        """캡처 종류별 '횟수 / 평균 전송 / 평균 파싱 / 평균 크기' 요약"""
+        return ', '.join(
+            f"{kind} ×{int(n)} 전송 {tx / n * 1000:.0f}ms 파싱 {px / n * 1000:.0f}ms "
+            f"{size / n / 1024:.0f}KB"
+            for kind, (n, tx, px, size) in sorted(self.timings.items()) if n
+        )
@@ -0,0 +1,176 @@
+"""
+상주형 ADB 셸 세션 (LinemangaAppAgent 전용)
+
+명령마다 `adb shell <cmd>` 프로세스를 새로 띄우는 대신 `adb shell` 하나를 유지하고
+stdin/stdout 위에 프레임 프로토콜로 명령을 주고받는다.
+
+프레임: 명령 뒤에 `printf '\\n<마커> <종료코드>\\n'`을 붙여 보내고, 마커 줄이 나올 때까지
+        읽은 출력이 그 명령의 결과. (seq 번호가 들어간 마커라 출력 내용과 충돌하지 않음)
+        마커 앞에 줄바꿈을 넣어 출력이 개행 없이 끝나도 마커가 항상 줄 맨 앞에 오게 하고,
+        그 때문에 생기는 마커 직전의 빈 줄은 읽을 때 버린다.
+
+- run(cmd): 명령 1개 왕복
+- run_batch(cmds, gap): 연속 입력(스와이프 반복 등)을 한 프레임으로 묶어 1회 왕복
+  (명령 사이 대기는 디바이스 쪽 sleep으로 처리)
+- 명령 종류별 지연 시간 기록 → latency_summary()
+"""
+
+import logging
+import queue
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('crawler.adb_session')
+
+_EOF = object()
+
+
+class AdbSessionError(Exception):
+    """세션 프로세스 종료/타임아웃 (호출 측은 재시작 또는 단발 실행으로 폴백)"""
+
+
+class AdbShellSession:
+    """
+    디바이스 1대에 대한 상주 `adb shell` 프로세스
+
+    Args:
+        adb_path: adb 실행 파일 경로
+        serial: 디바이스 시리얼 (None이면 adb 기본 디바이스)
+    """
+
+    def __init__(self, adb_path: str, serial: Optional[str] = None):
+        self.adb_path = adb_path
+        self.serial = serial
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue" = queue.Queue()
+        self._seq = 0
+        self._lock = threading.Lock()
+        # 명령 종류('input swipe', 'uiautomator' 등) → [횟수, 누적 초, 최대 초]
+        self.latency: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+
+    # ===== 프로세스 관리 =====
+
+    def _base_cmd(self) -> List[str]:
+        cmd = [self.adb_path]
+        if self.serial:
+            cmd += ['-s', self.serial]
+        return cmd
+
+    def start(self):
+        """adb shell 프로세스 시작 (-T: PTY 미할당 → 에코/CRLF 없음)"""
+        self.close()
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            self._base_cmd() + ['shell', '-T'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        )
+        threading.Thread(target=self._reader, args=(self._proc, self._lines),
+                         name='adb-shell-reader', daemon=True).start()
+
+    @staticmethod
+    def _reader(proc: subprocess.Popen, lines: "queue.Queue"):
+        """stdout 줄 단위 읽기 → 큐 (프로세스 종료 시 _EOF)"""
+        for raw in iter(proc.stdout.readline, b''):
+            lines.put(raw.decode('utf-8', errors='replace').rstrip('\r\n'))
+        lines.put(_EOF)
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.write(b'exit\n')
+            self._proc.stdin.flush()
+            self._proc.wait(timeout=2)
+        except Exception:
+            self._proc.kill()
+        self._proc = None
+
+    # ===== 명령 실행 =====
+
+    def _exchange(self, script: str, timeout: float) -> str:
+        """스크립트 1프레임 전송 → 마커까지의 출력 반환"""
+        if not self.alive:
+            self.start()
+
+        self._seq += 1
+        marker = f'__ADB_FRAME_{self._seq}__'
+        try:
+            self._proc.stdin.write(f"{script}\nprintf '\\n%s %d\\n' {marker} $?\n".encode('utf-8'))
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self.close()
+            raise AdbSessionError(f"write failed: {e}")
+
+        out = []
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # 프레임 경계를 잃었으므로 세션 폐기
+                self.close()
+                raise AdbSessionError(f"timeout ({timeout}s): {script[:60]}")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is _EOF:
+                self.close()
+                raise AdbSessionError("adb shell exited")
+            if line == marker or line.startswith(marker + ' '):
+                if out and out[-1] == '':
+                    out.pop()  # 마커 앞 줄바꿈이 만든 빈 줄
+                return '\n'.join(out).strip()
+            out.append(line)
+
+    def _record(self, key: str, elapsed: float):
+        stat = self.latency[key]
+        stat[0] += 1
+        stat[1] += elapsed
+        stat[2] = max(stat[2], elapsed)
+
+    @staticmethod
+    def _latency_key(cmd: str) -> str:
+        parts = cmd.split()
+        if parts[:1] == ['input'] and len(parts) > 1:
+            return f'input {parts[1]}'
+        return parts[0] if parts else ''
+
+    def run(self, cmd: str, timeout: float = 15) -> str:
+        """명령 1개 실행 → stdout"""
+        with self._lock:
+            start = time.perf_counter()
+            out = self._exchange(cmd, timeout)
+            self._record(self._latency_key(cmd), time.perf_counter() - start)
+            return out
+
+    def run_batch(self, cmds: List[str], gap: float = 0.0, timeout: float = 30) -> str:
+        """
+        연속 명령을 한 프레임으로 실행 (1회 왕복)
+
+        Args:
+            cmds: 셸 명령 목록
+            gap: 명령 사이 디바이스 쪽 대기 초 (기존 time.sleep 간격 유지용)
+        """
+        if not cmds:
+            return ''
+        sep = f'; sleep {gap}; ' if gap > 0 else '; '
+        with self._lock:
+            start = time.perf_counter()
+            out = self._exchange(sep.join(cmds), timeout)
+            self._record(f'batch[{self._latency_key(cmds[0])}]', time.perf_counter() - start)
+            return out
+
+    def latency_summary(self) -> str:
+        """명령 종류별 '횟수 / 평균 / 최대' 요약"""
+        rows = sorted(self.latency.items(), key=lambda kv: -kv[1][1])
+        return ', '.join(
+            f"{key} ×{int(n)} avg {total / n * 1000:.0f}ms max {mx * 1000:.0f}ms"
+            for key, (n, total, mx) in rows if n
+        )
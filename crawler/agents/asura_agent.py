@@ -27,6 +27,7 @@ from playwright.async_api import Browser, Page
 logger = logging.getLogger('crawler.agents.asura')
 
 BASE_URL = 'https://asurascans.com'
+ASURA_DETAIL_BUDGET = 100  # DB 작품 상세 재수집 예산 (갱신 스케줄러 점수 순)
 
 
 class AsuraAgent:
@@ -44,6 +45,7 @@ class AsuraAgent:
             'series_details': [],    # 상세 메타데이터
             'comments': [],          # 댓글
         }
+        self.refresh_scores: Dict[str, float] = {}  # 스케줄러가 고른 작품 → 점수
 
     async def execute(self, browser: Browser,
                       phases: List[str] = None) -> Dict[str, Any]:
@@ -99,30 +101,18 @@ class AsuraAgent:
             if 'details' in phases or 'comments' in phases:
                 targets = list(self.results['series_list'])
 
-                # DB에서 상세 미수집 작품도 타겟에 추가
+                # DB 작품 중 갱신 가치가 높은 작품도 타겟에 추가 (예산 내)
                 try:
-                    from crawler.db import get_db_connection
-                    db_conn = get_db_connection()
-                    db_cur = db_conn.cursor()
-                    db_cur.execute("""
-                        SELECT title, url, thumbnail_url FROM works
-                        WHERE platform = 'asura'
-                          AND url IS NOT NULL AND url != ''
-                          AND (detail_scraped_at IS NULL
-                               OR detail_scraped_at < NOW() - INTERVAL '14 days')
-                    """)
-                    db_works = [
-                        {'title': r[0], 'url': r[1], 'thumbnail_url': r[2] or ''}
-                        for r in db_cur.fetchall()
-                    ]
-                    db_conn.close()
+                    from crawler.refresh_scheduler import plan_refreshes
+                    db_works = plan_refreshes(ASURA_DETAIL_BUDGET, (self.platform_id,))
+                    self.refresh_scores = {w['title']: w['score'] for w in db_works}
 
                     existing_urls = {s['url'] for s in targets}
                     extra = [w for w in db_works if w['url'] not in existing_urls]
                     if extra:
                         targets.extend(extra)
                         self.logger.info(
-                            f"   DB에서 미수집 작품 {len(extra)}개 추가"
+                            f"   DB에서 갱신 대상 작품 {len(extra)}개 추가"
                         )
                 except Exception as e:
                     self.logger.warning(f"   DB 미수집 작품 로드 실패: {e}")
@@ -717,12 +707,19 @@ class AsuraAgent:
 
     # ===== 데이터 저장 =====
 
-    async def save_all(self, date: str):
-        """수집한 모든 데이터를 DB에 저장"""
+    async def save_all(self, date: str) -> Dict[str, int]:
+        """
+        수집한 모든 데이터를 DB에 저장
+
+        Returns:
+            {'changed': DB에 실제로 쓴 행 수, 'skipped': 배치 지문이 같아 생략한 행 수}
+            (rankings + works 기준, 다른 에이전트의 AgentResult.changed/skipped와 동일)
+        """
         from crawler.db import (
             save_rankings, save_works_metadata, save_work_detail,
-            save_reviews, backup_to_json
+            save_reviews, backup_to_json, pop_ingest_stats
         )
+        pop_ingest_stats(self.platform_id)
 
         # 1. 랭킹 저장 (Weekly를 메인으로)
         weekly = self.results['rankings_weekly']
@@ -819,7 +816,7 @@ class AsuraAgent:
                     'favorites': detail.get('followers'),
                     'rating': detail.get('rating'),
                     'review_count': detail.get('comment_count'),
-                })
+                }, score=self.refresh_scores.get(detail['title']))
                 if saved:
                     detail_count += 1
             except Exception as e:
@@ -856,3 +853,9 @@ class AsuraAgent:
                 total_saved += saved
 
             self.logger.info(f"   💾 댓글: {total_saved}개")
+
+        ingest = pop_ingest_stats(self.platform_id)
+        self.logger.info(
+            f"   💾 DB 쓰기 {ingest['changed']} / 생략 {ingest['skipped']} (랭킹+작품)"
+        )
+        return ingest
@@ -28,6 +28,8 @@ class AgentResult:
     count: int = 0
     error: Optional[str] = None
     attempts: int = 1
+    changed: int = 0   # DB에 실제로 쓴 행 수 (rankings + works)
+    skipped: int = 0   # 배치 지문이 같아 쓰기 생략한 행 수
 
     def __post_init__(self):
         if self.data:
@@ -68,7 +70,10 @@ class CrawlerAgent(ABC):
         Returns:
             AgentResult with success status and data/error
         """
+        from crawler.db import pop_ingest_stats
+
         self.logger.info(f"Starting {self.platform_name} crawler")
+        pop_ingest_stats(self.platform_id)
 
         for attempt in range(self.max_retries):
             try:
@@ -80,16 +85,20 @@ class CrawlerAgent(ABC):
                     # Save to database
                     date = datetime.now().strftime('%Y-%m-%d')
                     await self.save(date, data)
+                    ingest = pop_ingest_stats(self.platform_id)
 
                     self.logger.info(
-                        f"✅ {self.platform_name}: {len(data)}개 작품 수집 완료"
+                        f"✅ {self.platform_name}: {len(data)}개 작품 수집 완료 "
+                        f"(DB 쓰기 {ingest['changed']} / 생략 {ingest['skipped']})"
                     )
 
                     return AgentResult(
                         success=True,
                         platform=self.platform_id,
                         data=data,
-                        attempts=attempt + 1
+                        attempts=attempt + 1,
+                        changed=ingest['changed'],
+                        skipped=ingest['skipped']
                     )
                 else:
                     raise ValueError(f"Data validation failed: {len(data)} items")
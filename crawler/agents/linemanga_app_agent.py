@@ -4,20 +4,27 @@
 특징:
 - ADB + uiautomator dump로 안드로이드 앱에서 직접 크롤링
 - 브라우저 불필요 (Playwright 미사용)
+- 동기 ADB 세션은 워커 스레드에서 실행 (다른 에이전트와 실제 병렬), 탭 단위 진행 보고
+- 디바이스 여러 대 연결 시 (성별, 탭) 그룹을 디바이스별로 분산 수집
 - 3열 그리드 레이아웃, 위치 기반 순위 결정
 - 今日の人気ランキング (총합) 페이지 크롤링
 - すべて + 장르별 탭 수집 (キャンペーン, ￥0パス 제외)
 """
 
 import asyncio
+import queue
 import shutil
 import subprocess
+import tempfile
+import threading
 import xml.etree.ElementTree as ET
 import os
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from crawler.agents.base_agent import CrawlerAgent, AgentResult
+from crawler.adb_session import AdbShellSession, AdbSessionError
+from crawler.adb_capture import AdbCapture, ScreenFrame
 
 logger = logging.getLogger('crawler.agents.linemanga_app')
 
@@ -74,12 +81,60 @@ class LinemangaAppAgent(CrawlerAgent):
         )
         self.genre_results = {}
         self.device_id = None
+        self.devices: List[str] = []     # 연결된 전체 디바이스 (샤딩 대상)
+        self._current_gender = ''
+        self.healthy = True              # 디바이스 장애 시 False (재시도 대상 제외)
+        self.adb: Optional[AdbShellSession] = None
+        self.capture: Optional[AdbCapture] = None
+        # 진행 보고: (platform_id, 완료 탭 수, 전체 탭 수, 탭 라벨, 수집 수) → None
+        # 이벤트 루프 스레드에서 호출됨 (오케스트레이터가 설정)
+        self.progress_callback: Optional[Callable[[str, int, int, str, int], None]] = None
 
     # ===== ADB 헬퍼 메서드 =====
 
+    def _session(self) -> AdbShellSession:
+        """상주 adb shell 세션 (첫 사용 시 생성)"""
+        if self.adb is None or self.adb.serial != self.device_id:
+            if self.adb is not None:
+                self.adb.close()
+            self.adb = AdbShellSession(ADB_PATH, self.device_id)
+        return self.adb
+
+    def _close_session(self):
+        """세션 종료 + 명령별 지연 시간 / 캡처 시간 로그"""
+        if self.capture is not None:
+            summary = self.capture.timing_summary()
+            if summary:
+                self.logger.info(f"  ⏱️ 캡처: {summary}")
+            self.capture = None
+        if self.adb is None:
+            return
+        summary = self.adb.latency_summary()
+        if summary:
+            self.logger.info(f"  ⏱️ ADB 지연: {summary}")
+        self.adb.close()
+        self.adb = None
+
     def _run_adb(self, cmd: str, timeout: int = 15) -> str:
-        """ADB 명령 실행"""
-        full_cmd = f'{ADB_PATH} shell {cmd}'
+        """ADB 명령 실행 (상주 세션, 실패 시 단발 프로세스로 폴백)"""
+        try:
+            return self._session().run(cmd, timeout=timeout)
+        except AdbSessionError as e:
+            self.logger.warning(f"ADB session error → 단발 실행: {e}")
+            return self._run_adb_oneshot(cmd, timeout)
+
+    def _run_adb_batch(self, cmds: List[str], gap: float = 0.0, timeout: int = 30) -> str:
+        """연속 입력 명령을 1회 왕복으로 실행 (gap: 명령 사이 디바이스 쪽 대기)"""
+        try:
+            return self._session().run_batch(cmds, gap=gap, timeout=timeout)
+        except AdbSessionError as e:
+            self.logger.warning(f"ADB session error → 단발 실행: {e}")
+            return '\n'.join(self._run_adb_oneshot(c, timeout) for c in cmds)
+
+    def _run_adb_oneshot(self, cmd: str, timeout: int = 15) -> str:
+        """ADB 명령 단발 실행 (adb shell 프로세스 1회 생성)"""
+        serial = f'-s {self.device_id} ' if self.device_id else ''
+        full_cmd = f'{ADB_PATH} {serial}shell {cmd}'
         try:
             result = subprocess.run(
                 full_cmd, shell=True, capture_output=True, text=True, timeout=timeout
@@ -93,17 +148,20 @@ class LinemangaAppAgent(CrawlerAgent):
             return ''
 
     def _check_device(self) -> bool:
-        """ADB 디바이스 연결 확인"""
+        """ADB 디바이스 연결 확인 (연결된 전체 디바이스 → self.devices, 첫 번째 → device_id)"""
         try:
             result = subprocess.run(
                 f'{ADB_PATH} devices', shell=True, capture_output=True, text=True, timeout=10
             )
             lines = result.stdout.strip().split('\n')
-            for line in lines[1:]:  # 첫 줄 "List of devices attached" 스킵
-                if '\tdevice' in line:
-                    self.device_id = line.split('\t')[0]
-                    return True
-            return False
+            # 첫 줄 "List of devices attached" 스킵, 정렬로 디바이스 순서 고정
+            self.devices = sorted(
+                line.split('\t')[0] for line in lines[1:] if '\tdevice' in line
+            )
+            if not self.devices:
+                return False
+            self.device_id = self.devices[0]
+            return True
         except Exception:
             return False
 
@@ -130,12 +188,28 @@ class LinemangaAppAgent(CrawlerAgent):
         """탭 바를 오른쪽으로 스크롤 (처음 탭으로 돌아가기)"""
         self._swipe(100, 258, 900, 258, 300)
 
-    def _dump_ui(self, local_path: str = '/tmp/lm_app_ui.xml') -> Optional[ET.Element]:
-        """UI 트리 덤프 & 파싱"""
+    def _capture(self) -> AdbCapture:
+        """UI/화면 캡처 레이어 (디바이스별)"""
+        if self.capture is None or self.capture.serial != self.device_id:
+            self.capture = AdbCapture(ADB_PATH, self.device_id)
+        return self.capture
+
+    def _dump_ui(self) -> Optional[ET.Element]:
+        """UI 트리 덤프 & 파싱 (exec-out 스트림 → 메모리, 실패 시 파일 경유 폴백)"""
+        root = self._capture().dump_ui()
+        if root is not None:
+            return root
+        return self._dump_ui_via_file()
+
+    def _dump_ui_via_file(self) -> Optional[ET.Element]:
+        """UI 트리 덤프 (기기 파일 → adb -s 기기 pull → 덤프마다 별도 임시 파일에서 파싱)"""
+        serial = f'-s {self.device_id} ' if self.device_id else ''
+        fd, local_path = tempfile.mkstemp(prefix='lm_app_ui_', suffix='.xml')
+        os.close(fd)
         try:
             self._run_adb('uiautomator dump /sdcard/ui.xml')
             subprocess.run(
-                f'{ADB_PATH} pull /sdcard/ui.xml {local_path}',
+                f'{ADB_PATH} {serial}pull /sdcard/ui.xml {local_path}',
                 shell=True, capture_output=True, timeout=10
             )
             tree = ET.parse(local_path)
@@ -143,6 +217,8 @@ class LinemangaAppAgent(CrawlerAgent):
         except Exception as e:
             self.logger.error(f"UI dump failed: {e}")
             return None
+        finally:
+            os.remove(local_path)
 
     def _find_element_bounds(self, root: ET.Element, text: str) -> Optional[Tuple[int, int, int, int]]:
         """텍스트로 UI 요소의 bounds 찾기 (공백 무시)"""
@@ -166,19 +242,12 @@ class LinemangaAppAgent(CrawlerAgent):
 
     # ===== 스크린샷 & 썸네일 =====
 
-    def _capture_screenshot(self, local_path: str = '/tmp/lm_app_screen.png'):
-        """스크린샷 캡처 → PIL Image 반환"""
-        try:
-            self._run_adb('screencap -p /sdcard/screen.png')
-            subprocess.run(
-                f'{ADB_PATH} pull /sdcard/screen.png {local_path}',
-                shell=True, capture_output=True, timeout=10
-            )
-            from PIL import Image as PILImage
-            return PILImage.open(local_path)
-        except Exception as e:
-            self.logger.warning(f"Screenshot failed: {e}")
-            return None
+    def _capture_screenshot(self) -> Optional[ScreenFrame]:
+        """스크린샷 캡처 → 1회 디코드된 RGB 배열 (같은 화면의 크롭은 모두 이 배열 공유)"""
+        frame = self._capture().screenshot()
+        if frame is None:
+            self.logger.warning("Screenshot failed")
+        return frame
 
     @staticmethod
     def _parse_bounds(bounds_str: str) -> Optional[Tuple[int, int, int, int]]:
@@ -189,7 +258,8 @@ class LinemangaAppAgent(CrawlerAgent):
         except (ValueError, IndexError):
             return None
 
-    def _parse_items_with_bounds(self, root: ET.Element) -> List[Dict[str, Any]]:
+    def _parse_items_with_bounds(self, root: ET.Element,
+                                 skip_above_y: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         XML 구조 기반으로 랭킹 아이템 파싱 (구조적 접근).
 
@@ -199,6 +269,10 @@ class LinemangaAppAgent(CrawlerAgent):
         3. 컨테이너의 첫 번째 큰 자식 View = 썸네일 bounds
         4. 컨테이너 하위 TextView 중 작품명 추출
 
+        Args:
+            skip_above_y: 컨테이너 상단이 이 y보다 위인 아이템은 제목/썸네일 탐색 생략
+                          (증분 스크롤에서 이미 수집한 행)
+
         Returns:
             [{title, thumb_bounds: (x1,y1,x2,y2), item_bounds: (x1,y1,x2,y2)}, ...]
         """
@@ -246,6 +320,10 @@ class LinemangaAppAgent(CrawlerAgent):
             if cy2 < CONTENT_TOP_Y or cy1 > CONTENT_BOTTOM_Y + 200:
                 continue
 
+            # 이미 수집한 행 스킵
+            if skip_above_y is not None and cy1 < skip_above_y:
+                continue
+
             # 썸네일 bounds: 컨테이너 직계/간접 자식 중 큰 View 찾기
             thumb_bounds = None
             self._find_thumbnail_bounds(container, container_bounds, thumb_bounds_result := [])
@@ -331,6 +409,7 @@ class LinemangaAppAgent(CrawlerAgent):
         """
         XML bounds로 정확히 크롭 → base64 data URL.
 
+        - screenshot: _capture_screenshot()의 ScreenFrame (화면당 1회 디코드)
         - thumb_bounds: (x1, y1, x2, y2) from XML UIAutomator dump
         - 상단 60%만 크롭하여 순위 번호 오버레이 제거
           (라인망가 앱은 썸네일 하단에 큰 순위 번호를 렌더링)
@@ -341,7 +420,7 @@ class LinemangaAppAgent(CrawlerAgent):
         """
         import base64
         from io import BytesIO
-        import numpy as np
+        from PIL import Image as PILImage
 
         if screenshot is None or thumb_bounds is None:
             return ''
@@ -367,16 +446,17 @@ class LinemangaAppAgent(CrawlerAgent):
             return ''
 
         try:
-            crop = screenshot.crop((x1, visible_top, x2, visible_bottom))
-            crop_rgb = crop.convert('RGB')
+            # 디코드된 화면 배열 슬라이스 (복사 없음)
+            arr = screenshot.pixels[visible_top:visible_bottom, max(x1, 0):x2]
+            if arr.size == 0:
+                return ''
 
             # 이미지 품질 검증: 단색/UI 요소 거부
-            arr = np.array(crop_rgb)
             if arr.std() < 15:
                 return ''
 
             # 150x200 리사이즈 + JPEG 압축
-            crop_resized = crop_rgb.resize((150, 200))
+            crop_resized = PILImage.fromarray(arr).resize((150, 200))
             buf = BytesIO()
             crop_resized.save(buf, format='JPEG', quality=65)
             b64 = base64.b64encode(buf.getvalue()).decode('ascii')
@@ -583,11 +663,28 @@ class LinemangaAppAgent(CrawlerAgent):
 
     # ===== 크롤링 로직 =====
 
+    @staticmethod
+    def _measure_row_height(items: List[Dict[str, Any]]) -> Optional[int]:
+        """화면 내 아이템 행 간격(px) 측정 — 행 상단 y 차이의 중앙값"""
+        tops = sorted({it['item_bounds'][1] for it in items})
+        gaps = [b - a for a, b in zip(tops, tops[1:]) if b - a > 100]
+        if not gaps:
+            return None
+        gaps.sort()
+        return gaps[len(gaps) // 2]
+
     def _collect_tab_rankings(self, max_scrolls: int = 25, max_items: int = 100) -> List[Dict[str, Any]]:
         """
-        현재 탭에서 스크롤하며 전체 랭킹 수집 (제목만 파싱).
+        현재 탭에서 스크롤하며 전체 랭킹 수집 (제목만 파싱, 증분 방식).
         썸네일은 save()에서 CDN 일괄 수집.
 
+        - 실측 행 높이로 스와이프 거리 결정: 마지막 수집 행이 콘텐츠 상단에 오도록
+          행 단위로 천천히 스와이프 (플링 없이 정확한 거리, 1행은 겹침 확인용)
+        - 직전 화면의 마지막 행보다 위에 있는 노드는 파싱 생략
+        - 겹침(이미 본 제목)이 없으면 행을 건너뛴 것이므로 1행씩 되돌려 재확인
+          (이후 스와이프 행 수를 줄임)
+        - max_items 위까지 수집되는 즉시 종료
+
         Returns:
             [{rank, title, genre, url, thumbnail_url}, ...]
         """
@@ -595,30 +692,51 @@ class LinemangaAppAgent(CrawlerAgent):
         all_titles = []
         seen_titles = set()
         no_new_count = 0
-
-        for scroll_i in range(max_scrolls + 1):
-            if scroll_i == 0:
+        row_h = None          # 실측 행 높이
+        skip_above_y = None   # 이 y보다 위는 이미 수집한 행
+        last_row_y = None     # 직전 화면 마지막 행 상단 y
+        swipe_px = 0          # 직전 스와이프 거리
+        rewinds = 0           # 연속 되돌리기 횟수
+        rows_cap = None       # 오버슈트 발생 시 스와이프 행 수 상한
+        swipe_x = 540
+        swipe_from = CONTENT_BOTTOM_Y - 60
+
+        scroll_i = 0
+        while scroll_i <= max_scrolls:
+            if scroll_i == 0 and not rewinds:
                 time.sleep(2.5)  # 탭 전환 후 콘텐츠 로딩 대기
             elif no_new_count > 0:
                 time.sleep(2.5)
             else:
                 time.sleep(1)
 
-            root = self._dump_ui(f'/tmp/lm_app_scroll_{scroll_i}.xml')
+            # 되돌리기 재확인은 스크롤 횟수에 포함하지 않음 (연속 최대 3회)
+            root = self._dump_ui()
             if root is None:
                 break
 
-            items = self._parse_items_with_bounds(root)
-            new_count = 0
+            items = self._parse_items_with_bounds(root, skip_above_y=skip_above_y)
 
             # 첫 스크롤에서 아이템이 0이면 추가 대기 후 재시도
             if scroll_i == 0 and len(items) == 0:
                 self.logger.debug("  첫 시도 아이템 0 → 3초 추가 대기 후 재시도")
                 time.sleep(3)
-                root = self._dump_ui(f'/tmp/lm_app_scroll_{scroll_i}_retry.xml')
+                root = self._dump_ui()
                 if root is not None:
                     items = self._parse_items_with_bounds(root)
 
+            # 겹침 확인: 스크롤 후 화면에 이미 본 제목이 없으면 행을 건너뛴 것
+            overlap = any(item['title'] in seen_titles for item in items)
+            if all_titles and items and not overlap and rewinds < 3 and row_h:
+                self.logger.debug("  겹침 없음 → 1행 되돌려 재확인")
+                self._swipe(swipe_x, swipe_from - row_h, swipe_x, swipe_from, 600)
+                rewinds += 1
+                rows_cap = max(1, swipe_px // row_h - 1)
+                skip_above_y = None
+                continue
+            rewinds = 0
+
+            new_count = 0
             for item in items:
                 title = item['title']
                 if title not in seen_titles:
@@ -626,7 +744,18 @@ class LinemangaAppAgent(CrawlerAgent):
                     all_titles.append(title)
                     new_count += 1
 
-            self.logger.debug(f"  Scroll {scroll_i}: {new_count} new, total {len(all_titles)}")
+            measured = self._measure_row_height(items)
+            if measured:
+                row_h = measured
+            if items:
+                last_row_y = max(it['item_bounds'][1] for it in items)
+
+            cap = self._capture().last
+            self.logger.debug(
+                f"  Scroll {scroll_i}: {new_count} new, total {len(all_titles)} "
+                f"(row {row_h}px, dump {cap.get('transfer_ms', 0):.0f}ms "
+                f"+ parse {cap.get('parse_ms', 0):.0f}ms)"
+            )
 
             if new_count == 0:
                 no_new_count += 1
@@ -635,12 +764,28 @@ class LinemangaAppAgent(CrawlerAgent):
             else:
                 no_new_count = 0
 
+            # max_items위 확보 → 즉시 종료
             if len(all_titles) >= max_items:
                 break
 
             if scroll_i < max_scrolls:
-                use_short = no_new_count > 0 or len(all_titles) >= max_items - 15
-                self._swipe_up(short=use_short)
+                if row_h and last_row_y:
+                    # 마지막 수집 행이 콘텐츠 상단에 오도록 (행 단위, 손가락 이동 한계 내)
+                    max_px = swipe_from - 150
+                    rows = max(1, min(last_row_y - CONTENT_TOP_Y, max_px) // row_h)
+                    if rows_cap:
+                        rows = min(rows, rows_cap)
+                    if no_new_count > 0:
+                        rows = 1  # 끝 부분: 로딩 대기하며 짧게
+                    swipe_px = rows * row_h
+                    self._swipe(swipe_x, swipe_from, swipe_x, swipe_from - swipe_px, 800)
+                    # 다음 화면에서 마지막 행이 올라갈 위치 (1행 여유) 위는 파싱 생략
+                    skip_above_y = last_row_y - swipe_px - row_h // 2
+                else:
+                    use_short = no_new_count > 0 or len(all_titles) >= max_items - 15
+                    self._swipe_up(short=use_short)
+                    skip_above_y = None
+            scroll_i += 1
 
         # 순위 할당 (수집 순서 = 순위)
         rankings = []
@@ -881,12 +1026,14 @@ class LinemangaAppAgent(CrawlerAgent):
                         pass
         return None
 
+    def _swipe_down_repeated(self, times: int):
+        """빠른 스와이프 다운 반복 (1회 왕복으로 묶어 실행, 간격 0.2초)"""
+        self._run_adb_batch(['input swipe 540 600 540 1800 200'] * times, gap=0.2)
+
     def _scroll_to_top(self):
         """랭킹 리스트를 맨 위로 스크롤 (탭바 보이도록)"""
         import time
-        for _ in range(15):
-            self._swipe(540, 600, 540, 1800, 200)  # 빠른 스와이프 다운
-            time.sleep(0.2)
+        self._swipe_down_repeated(15)
         time.sleep(1.0)  # 스크롤 애니메이션 완료 대기
 
     def _is_tab_bar_visible(self, root) -> bool:
@@ -920,9 +1067,7 @@ class LinemangaAppAgent(CrawlerAgent):
         root = self._dump_ui()
         if root is not None and not self._is_tab_bar_visible(root):
             self.logger.info("  탭 바 미확인 → 추가 스크롤")
-            for _ in range(10):
-                self._swipe(540, 600, 540, 1800, 200)
-                time.sleep(0.2)
+            self._swipe_down_repeated(10)
             time.sleep(1.0)
 
         # 먼저 현재 상태에서 탭 검색 (리셋 없이)
@@ -944,9 +1089,7 @@ class LinemangaAppAgent(CrawlerAgent):
                     return True
 
         # 탭 바를 맨 왼쪽으로 리셋 (오른쪽으로 4번 스크롤)
-        for _ in range(4):
-            self._swipe_tabs_right()
-            time.sleep(0.3)
+        self._run_adb_batch(['input swipe 100 258 900 258 300'] * 4, gap=0.3)
         time.sleep(0.8)
 
         # 왼쪽으로 스크롤하며 탭 찾기 (최대 10번)
@@ -982,110 +1125,48 @@ class LinemangaAppAgent(CrawlerAgent):
     async def execute(self, browser=None) -> AgentResult:
         """
         ADB 기반 크롤링 실행 (browser 파라미터 무시).
+
+        ADB 명령/대기는 전부 동기 호출이므로 크롤링 세션과 저장은 워커 스레드에서
+        실행한다 → 오케스트레이터 이벤트 루프(Playwright 에이전트들)를 막지 않음.
         """
+        from crawler.db import pop_ingest_stats
+
         self.logger.info(f"Starting {self.platform_name} crawler (ADB)")
+        pop_ingest_stats(self.platform_id)
 
         for attempt in range(self.max_retries):
             try:
                 # 1. 디바이스 확인
-                if not self._check_device():
+                if not await asyncio.to_thread(self._check_device):
                     return AgentResult(
                         success=False,
                         platform=self.platform_id,
                         error="ADB device not connected (skip)",
                         attempts=1
                     )
-                self.logger.info(f"  📱 Device: {self.device_id}")
-
-                import time
-
-                # 2. 종합(기본) 랭킹 수집
-                if not self._navigate_to_ranking_page():
-                    raise Exception("Failed to navigate to ranking page")
-
-                # 3. 성별 필터 × 장르 탭 크롤링
-                all_rankings = None  # 종합 전체 (메인 데이터)
-
-                for gender in GENDER_FILTERS:
-                    gender_key = gender['key']
-                    gender_name = gender['name']
-                    gender_label = gender['label']
-
-                    if gender_key:
-                        # 여성/남성: 홈으로 돌아간 후 성별 전환 → 랭킹 재진입
-                        self.logger.info(f"📱 [{gender_label}] 홈으로 복귀 → 필터 전환...")
-                        self._run_adb('input keyevent KEYCODE_BACK')
-                        time.sleep(2)
+                self.logger.info(f"  📱 Device: {', '.join(self.devices)}")
 
-                        if not self._switch_gender_on_home(gender_name):
-                            self.logger.warning(f"  ⚠️ [{gender_label}] 필터 전환 실패")
-                            continue
-
-                        # 성별 전환 후 앱 재시작 없이 랭킹 페이지 진입
-                        if not self._enter_ranking_from_home():
-                            self.logger.warning(f"  ⚠️ [{gender_label}] 랭킹 페이지 재진입 실패")
-                            continue
-
-                    # すべて 탭 크롤링
-                    sub_key = gender_key  # '' or '女性' or '男性'
-                    self.logger.info(f"📱 [{gender_label} 전체] 크롤링 중...")
-                    if not self._navigate_to_tab('すべて'):
-                        self.logger.warning(f"  ⚠️ [{gender_label} 전체] すべて 탭 이동 실패")
-                        continue
-
-                    time.sleep(2)
-                    # 전체(すべて) 탭에서는 항상 썸네일 캡처
-                    rankings = self._collect_tab_rankings()
-                    self.genre_results[sub_key] = rankings
-                    self.logger.info(f"  ✅ [{gender_label} 전체]: {len(rankings)}개 작품")
-
-                    if gender_key == '':
-                        all_rankings = rankings
-
-                    # 장르별 탭 크롤링
-                    for genre_info in GENRE_TABS[1:]:  # すべて 스킵
-                        tab_name = genre_info['tab_name']
-                        label = genre_info['label']
-                        genre_key_part = genre_info['key']
-
-                        # 복합 키: "女性:恋愛" 형태
-                        if gender_key:
-                            compound_key = f"{gender_key}:{genre_key_part}"
-                        else:
-                            compound_key = genre_key_part
-
-                        self.logger.info(f"📱 [{gender_label}·{label}] 크롤링 중...")
-
-                        try:
-                            if self._navigate_to_tab(tab_name):
-                                time.sleep(2)
-                                tab_rankings = self._collect_tab_rankings()
-                                self.genre_results[compound_key] = tab_rankings
-                                self.logger.info(f"  ✅ [{gender_label}·{label}]: {len(tab_rankings)}개")
-                            else:
-                                self.genre_results[compound_key] = []
-                                self.logger.warning(f"  ⚠️ [{gender_label}·{label}] 탭 이동 실패")
-                        except Exception as e:
-                            self.logger.warning(f"  ⚠️ [{gender_label}·{label}] 실패: {e}")
-                            self.genre_results[compound_key] = []
+                # 2~3. 성별 필터 × 장르 탭 크롤링 (워커 스레드)
+                all_rankings = await self.crawl()
 
                 # 4. 데이터 검증
-                if all_rankings is None:
-                    raise Exception("종합 전체 데이터 수집 실패")
-
                 if self.validate(all_rankings):
                     from datetime import datetime
                     date = datetime.now().strftime('%Y-%m-%d')
                     await self.save(date, all_rankings)
+                    ingest = pop_ingest_stats(self.platform_id)
 
                     self.logger.info(
-                        f"✅ {self.platform_name}: {len(all_rankings)}개 작품 수집 완료"
+                        f"✅ {self.platform_name}: {len(all_rankings)}개 작품 수집 완료 "
+                        f"(DB 쓰기 {ingest['changed']} / 생략 {ingest['skipped']})"
                     )
                     return AgentResult(
                         success=True,
                         platform=self.platform_id,
                         data=all_rankings,
-                        attempts=attempt + 1
+                        attempts=attempt + 1,
+                        changed=ingest['changed'],
+                        skipped=ingest['skipped']
                     )
                 else:
                     raise ValueError(f"Validation failed: {len(all_rankings)} items")
@@ -1118,8 +1199,232 @@ class LinemangaAppAgent(CrawlerAgent):
         )
 
     async def crawl(self, browser=None) -> List[Dict[str, Any]]:
-        """사용되지 않음 (execute()에서 직접 처리)"""
-        return []
+        """
+        크롤링 세션을 워커 스레드에서 실행하고 종합 전체 랭킹 반환.
+
+        progress_callback이 설정돼 있으면 탭 단위 진행 상황을
+        이벤트 루프 스레드에서 호출한다 (call_soon_threadsafe).
+        """
+        loop = asyncio.get_running_loop()
+        callback = self.progress_callback
+
+        def report(done: int, total: int, label: str, count: int):
+            if callback:
+                loop.call_soon_threadsafe(callback, self.platform_id, done, total, label, count)
+
+        try:
+            return await asyncio.to_thread(self._crawl_session, report)
+        finally:
+            self._close_session()
+
+    @staticmethod
+    def _unit_key(gender_key: str, genre_info: Dict[str, str]) -> str:
+        """(성별, 탭) → genre_results 키 ('', '恋愛', '女性', '女性:恋愛' 형태)"""
+        if not genre_info['key']:
+            return gender_key
+        if gender_key:
+            return f"{gender_key}:{genre_info['key']}"
+        return genre_info['key']
+
+    @staticmethod
+    def _plan_groups(n_devices: int) -> List[Dict[str, Any]]:
+        """
+        (성별, 탭) 단위를 디바이스 수에 맞춰 작업 그룹으로 분할.
+
+        성별 전환(홈 복귀 → 필터 → 랭킹 재진입)이 비싸므로 그룹은 성별 단위로 묶고,
+        디바이스가 성별 수보다 많을 때만 성별 내 탭을 나눈다.
+        디바이스 1대면 기존 순서(종합 → 여성 → 남성, 탭 순서) 그대로.
+        """
+        per_gender = max(1, -(-n_devices // len(GENDER_FILTERS)))  # ceil
+        chunk = -(-len(GENRE_TABS) // per_gender)
+        groups = []
+        for gender in GENDER_FILTERS:
+            for i in range(0, len(GENRE_TABS), chunk):
+                groups.append({'gender': gender, 'tabs': GENRE_TABS[i:i + chunk], 'tries': 0})
+        return groups
+
+    def _switch_gender(self, gender: Dict[str, str]) -> bool:
+        """랭킹 페이지에서 성별 필터 전환 후 랭킹 재진입 (이미 해당 성별이면 통과)"""
+        import time
+
+        if self._current_gender == gender['key']:
+            return True
+        label = gender['label']
+        self.logger.info(f"📱 [{label}] 홈으로 복귀 → 필터 전환...")
+        self._run_adb('input keyevent KEYCODE_BACK')
+        time.sleep(2)
+
+        if not self._switch_gender_on_home(gender['name']):
+            self.logger.warning(f"  ⚠️ [{label}] 필터 전환 실패")
+            return False
+        # 성별 전환 후 앱 재시작 없이 랭킹 페이지 진입
+        if not self._enter_ranking_from_home():
+            self.logger.warning(f"  ⚠️ [{label}] 랭킹 페이지 재진입 실패")
+            return False
+        self._current_gender = gender['key']
+        return True
+
+    def _crawl_group(self, group: Dict[str, Any],
+                     on_unit: Callable[[str, str, List[Dict[str, Any]]], None]) -> bool:
+        """
+        작업 그룹 1개 수집 (랭킹 페이지에 있는 상태에서 호출)
+
+        Returns:
+            False면 그룹 실패 (성별 전환/すべて 탭 이동 실패) → 다른 디바이스에서 재시도
+        """
+        import time
+
+        gender = group['gender']
+        gender_label = gender['label']
+        if not self._switch_gender(gender):
+            return False
+
+        for genre_info in group['tabs']:
+            key = self._unit_key(gender['key'], genre_info)
+            label = f"{gender_label}·{genre_info['label']}"
+
+            if not genre_info['key']:
+                # すべて 탭 (전체 탭에서는 항상 썸네일 캡처)
+                self.logger.info(f"📱 [{gender_label} 전체] 크롤링 중...")
+                if not self._navigate_to_tab('すべて'):
+                    self.logger.warning(f"  ⚠️ [{gender_label} 전체] すべて 탭 이동 실패")
+                    return False
+                time.sleep(2)
+                rankings = self._collect_tab_rankings()
+                self.logger.info(f"  ✅ [{gender_label} 전체]: {len(rankings)}개 작품")
+                on_unit(key, f"{gender_label} 전체", rankings)
+                continue
+
+            self.logger.info(f"📱 [{label}] 크롤링 중...")
+            try:
+                if self._navigate_to_tab(genre_info['tab_name']):
+                    time.sleep(2)
+                    rankings = self._collect_tab_rankings()
+                    self.logger.info(f"  ✅ [{label}]: {len(rankings)}개")
+                else:
+                    rankings = []
+                    self.logger.warning(f"  ⚠️ [{label}] 탭 이동 실패")
+            except Exception as e:
+                self.logger.warning(f"  ⚠️ [{label}] 실패: {e}")
+                rankings = []
+            on_unit(key, label, rankings)
+        return True
+
+    def _run_device(self, groups: "queue.Queue", failed: List[Dict[str, Any]],
+                    on_unit: Callable[[str, str, List[Dict[str, Any]]], None]):
+        """
+        디바이스 1대 워커: 큐에서 그룹을 가져와 수집 (디바이스 장애는 이 워커 안에서 격리)
+
+        그룹 실패 시 앱 재시작 후 다음 그룹 진행, 실패 그룹은 failed에 반환.
+        ADB 예외 등으로 디바이스가 죽으면 진행 중 그룹을 반환하고 종료.
+        """
+        if groups.empty():
+            return
+        group = None
+        try:
+            if not self._navigate_to_ranking_page():
+                raise Exception("Failed to navigate to ranking page")
+            self._current_gender = ''
+
+            while True:
+                try:
+                    group = groups.get_nowait()
+                except queue.Empty:
+                    return
+                ok = self._crawl_group(group, on_unit)
+                if not ok:
+                    failed.append(group)
+                group = None
+                if not ok:
+                    # 화면 상태를 알 수 없으므로 재시작 후 종합부터 다시
+                    if not self._navigate_to_ranking_page():
+                        raise Exception("Failed to navigate to ranking page")
+                    self._current_gender = ''
+        except Exception as e:
+            self.healthy = False
+            self.logger.error(f"  ❌ 디바이스 {self.device_id} 중단: {e}")
+            if group is not None:
+                failed.append(group)
+        finally:
+            self._close_session()
+
+    def _device_worker(self, serial: str) -> "LinemangaAppAgent":
+        """디바이스별 워커 에이전트 (ADB 세션/캡처/로거 분리)"""
+        worker = LinemangaAppAgent()
+        worker.device_id = serial
+        worker.logger = logging.getLogger(f'crawler.agents.linemanga_app.{serial}')
+        return worker
+
+    def _crawl_session(self, report: Callable[[int, int, str, int], None]) -> List[Dict[str, Any]]:
+        """
+        성별 필터 × 장르 탭 전체 수집 (동기, 워커 스레드 전용)
+
+        연결된 디바이스가 여러 대면 (성별, 탭) 그룹을 디바이스별 스레드로 분배한다.
+        실패한 그룹은 살아있는 디바이스에서 1회 재시도하고, 결과는 디바이스와 무관하게
+        GENDER_FILTERS × GENRE_TABS 순서로 genre_results에 병합한다.
+
+        Returns:
+            종합 전체(すべて) 랭킹. genre_results에 나머지 탭 결과 저장.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        devices = self.devices or [self.device_id]
+        self.healthy = True
+        total_units = len(GENDER_FILTERS) * len(GENRE_TABS)
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        lock = threading.Lock()
+
+        def on_unit(key: str, label: str, rankings: List[Dict[str, Any]]):
+            with lock:
+                results[key] = rankings
+                done = len(results)
+            report(done, total_units, label, len(rankings))
+
+        workers = [self if serial == self.device_id else self._device_worker(serial)
+                   for serial in devices]
+        groups = queue.Queue()
+        for group in self._plan_groups(len(workers)):
+            groups.put(group)
+
+        for attempt in range(2):
+            failed: List[Dict[str, Any]] = []
+            workers = [w for w in workers if w.healthy]
+            if not workers:
+                break
+            if len(workers) == 1:
+                workers[0]._run_device(groups, failed, on_unit)
+            else:
+                self.logger.info(f"  📱 디바이스 {len(workers)}대 분산: {', '.join(devices)}")
+                with ThreadPoolExecutor(max_workers=len(workers),
+                                        thread_name_prefix='lm-adb') as pool:
+                    for f in [pool.submit(w._run_device, groups, failed, on_unit) for w in workers]:
+                        f.result()
+
+            if not failed or attempt == 1:
+                break
+            self.logger.info(f"  🔁 실패 그룹 {len(failed)}개 재시도")
+            for group in failed:
+                group['tries'] += 1
+                groups.put(group)
+
+        for group in failed:
+            self.logger.warning(
+                f"  ⚠️ [{group['gender']['label']}] "
+                f"{', '.join(t['label'] for t in group['tabs'])} 수집 실패"
+            )
+
+        # 결정적 병합 (디바이스 처리 순서와 무관)
+        self.genre_results = {}
+        for gender in GENDER_FILTERS:
+            for genre_info in GENRE_TABS:
+                key = self._unit_key(gender['key'], genre_info)
+                if key in results:
+                    self.genre_results[key] = results[key]
+
+        all_rankings = self.genre_results.get('')
+        if all_rankings is None:
+            raise Exception("종합 전체 데이터 수집 실패")
+        return all_rankings
 
     def validate(self, data: List[Dict[str, Any]]) -> bool:
         """ADB 크롤링은 최소 5개 이상이면 유효"""
@@ -1132,7 +1437,10 @@ class LinemangaAppAgent(CrawlerAgent):
         return True
 
     async def save(self, date: str, data: List[Dict[str, Any]]):
-        """성별 × 장르별 전체 랭킹 저장 + CDN 썸네일 일괄 수집"""
+        """성별 × 장르별 전체 랭킹 저장 + CDN 썸네일 일괄 수집 (워커 스레드)"""
+        await asyncio.to_thread(self._save_sync, date, data)
+
+    def _save_sync(self, date: str, data: List[Dict[str, Any]]):
         from crawler.db import save_rankings, backup_to_json, save_works_metadata
 
         # 종합 전체 랭킹 저장 + JSON 백업
@@ -1189,7 +1497,7 @@ class LinemangaAppAgent(CrawlerAgent):
                 cur.execute("""
                     SELECT title FROM works
                     WHERE platform = %s AND title IN %s
-                    AND thumbnail_base64 IS NOT NULL AND thumbnail_base64 != ''
+                    AND thumbnail_hash IS NOT NULL
                 """, (self.platform_id, tuple(all_titles)))
                 existing = {r[0] for r in cur.fetchall()}
                 cur.close()
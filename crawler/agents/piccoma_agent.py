@@ -7,12 +7,14 @@
 - 일본 IP 필수
 - 셀렉터: .PCM-productTile ul > li (2026년 현재 구조)
 - 장르: 랭킹 페이지에 없음 → 개별 작품 페이지 JSON-LD에서 수집 후 캐시
+  (HTTP로 HTML만 받아 파싱, 실패 시 Playwright 페이지로 폴백)
 """
 
 from typing import List, Dict, Any
 from playwright.async_api import Browser
 
 from crawler.agents.base_agent import CrawlerAgent
+from crawler.detail_extract import extract_breadcrumb_genre, new_http_session
 from crawler.db import get_works_genres, save_work_genre, update_rankings_genre
 from crawler.utils import translate_genre
 
@@ -170,13 +172,20 @@ class PiccomaAgent(CrawlerAgent):
 
         self.logger.info(f"   📚 장르 수집: {len(need_fetch)}개 작품 페이지 방문 필요")
 
-        # 2. 개별 페이지 방문하여 장르 추출
-        page = await browser.new_page()
+        # 2. 개별 페이지에서 장르 추출 (HTTP 우선, 브라우저 페이지는 필요할 때만 생성)
+        page = None
         fetched = 0
+        via_browser = 0
+        session = new_http_session(limit=4)
         try:
             for item in need_fetch:
                 try:
-                    genre = await self._fetch_genre_from_page(page, item['url'])
+                    genre = await self._fetch_genre_http(session, item['url'])
+                    if not genre:
+                        if page is None:
+                            page = await browser.new_page()
+                        genre = await self._fetch_genre_from_page(page, item['url'])
+                        via_browser += 1
                     if genre:
                         item['genre'] = genre
                         save_work_genre(self.platform_id, item['title'], genre)
@@ -187,9 +196,13 @@ class PiccomaAgent(CrawlerAgent):
                     self.logger.warning(f"   장르 수집 실패 ({item['title']}): {e}")
                     continue
         finally:
-            await page.close()
+            await session.close()
+            if page is not None:
+                await page.close()
 
-        self.logger.info(f"   📚 장르 수집 완료: {fetched}/{len(need_fetch)}개 성공")
+        self.logger.info(
+            f"   📚 장르 수집 완료: {fetched}/{len(need_fetch)}개 성공 (브라우저 폴백 {via_browser}개)"
+        )
 
     async def save(self, date: str, data: List[Dict[str, Any]]):
         """종합 + 장르별 랭킹 모두 저장"""
@@ -221,6 +234,17 @@ class PiccomaAgent(CrawlerAgent):
                 save_works_metadata(self.platform_id, genre_meta, date=date, sub_category=genre_key)
             self.logger.info(f"   💾 [{genre_name}]: {len(rankings)}개 저장")
 
+    async def _fetch_genre_http(self, session, url: str) -> str:
+        """HTML만 받아 BreadcrumbList의 position 2(장르) 추출 (실패 시 빈 문자열)"""
+        try:
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return ''
+                html = await resp.text()
+        except Exception:
+            return ''
+        return extract_breadcrumb_genre(html)
+
     async def _fetch_genre_from_page(self, page, url: str) -> str:
         """개별 작품 페이지에서 BreadcrumbList의 position 2(장르)를 추출"""
         await page.goto(url, wait_until='domcontentloaded', timeout=15000)
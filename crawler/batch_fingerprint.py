@@ -0,0 +1,72 @@
+"""
+랭킹 배치 지문(fingerprint) — 하루 3회 크롤링의 중복 쓰기 제거
+
+같은 날 (platform, sub_category) 랭킹은 09/15/21시 실행에서 대부분 동일하다.
+배치마다 항목 해시와 전체 지문을 ranking_batches 테이블에 저장해 두고:
+- 지문이 같으면 배치 전체 쓰기 생략
+- 다르면 항목 해시가 바뀐 행만 upsert
+(테이블 생성: scripts/migrate_ranking_batches.py)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import psycopg2
+import psycopg2.extras
+
+
+KIND_RANKINGS = 'rankings'
+KIND_WORKS = 'works'
+
+
+def item_hash(values: Iterable[Any]) -> str:
+    """행 값 튜플 → 짧은 해시"""
+    raw = json.dumps(list(values), ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def batch_fingerprint(item_hashes: Dict[str, str]) -> str:
+    """항목 해시 전체 → 배치 지문 (키 순서 무관)"""
+    raw = '\n'.join(f"{k}\t{v}" for k, v in sorted(item_hashes.items()))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def load_batch(cursor, date: str, platform: str, sub_category: str,
+               kind: str) -> Tuple[bool, Optional[str], Dict[str, str]]:
+    """
+    저장된 배치 지문 조회
+
+    Returns:
+        (사용 가능 여부, 지문 또는 None, {키: 항목 해시})
+        ranking_batches 테이블이 없으면 (False, None, {}) — 호출 측은 전체 쓰기로 동작.
+        테이블 미존재 시 트랜잭션이 abort되므로 반드시 다른 쓰기보다 먼저 호출할 것.
+    """
+    try:
+        cursor.execute('''
+            SELECT fingerprint, item_hashes FROM ranking_batches
+            WHERE date = %s AND platform = %s AND sub_category = %s AND kind = %s
+        ''', (date, platform, sub_category, kind))
+    except psycopg2.errors.UndefinedTable:
+        cursor.connection.rollback()
+        return False, None, {}
+    row = cursor.fetchone()
+    if not row:
+        return True, None, {}
+    return True, row[0], row[1] or {}
+
+
+def store_batch(cursor, date: str, platform: str, sub_category: str, kind: str,
+                fingerprint: str, item_hashes: Dict[str, str]):
+    """배치 지문 저장 (같은 배치 키는 덮어씀)"""
+    cursor.execute('''
+        INSERT INTO ranking_batches
+            (date, platform, sub_category, kind, fingerprint, item_hashes, item_count, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+        ON CONFLICT (date, platform, sub_category, kind) DO UPDATE SET
+            fingerprint = EXCLUDED.fingerprint,
+            item_hashes = EXCLUDED.item_hashes,
+            item_count = EXCLUDED.item_count,
+            updated_at = NOW()
+    ''', (date, platform, sub_category, kind, fingerprint,
+          psycopg2.extras.Json(item_hashes), len(item_hashes)))
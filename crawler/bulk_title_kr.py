@@ -0,0 +1,204 @@
+"""
+title_kr 일괄 수정 엔진 (set 기반)
+
+제목별 UPDATE 반복 대신:
+1. 수정 목록 {일본어 제목: 한국어 제목}을 임시 테이블에 적재
+2. works / rankings를 임시 테이블과 조인한 UPDATE ... FROM 각 1문장
+3. unified_works 재연결도 INSERT ... SELECT + UPDATE ... FROM 2문장
+모두 한 트랜잭션에서 실행하고, dry_run이면 변경 예정 diff만 보고 후 ROLLBACK.
+
+사용 예:
+    from crawler.bulk_title_kr import apply_title_kr_corrections, print_report
+    report = apply_title_kr_corrections(conn, corrections, mode='overwrite', dry_run=True)
+    print_report(report)
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+
+import psycopg2.extras
+
+
+# 수정 대상 조건 (mode별)
+# - fill: title_kr 비어있는 행만
+# - fill_or_mixed: 비어있거나 일본어/한국어 혼합(불량) 행
+# - overwrite: 값이 다르면 무조건 교체
+_MODE_CONDITIONS = {
+    'fill': "(t.title_kr IS NULL OR t.title_kr = '')",
+    'fill_or_mixed': (
+        "(t.title_kr IS NULL OR t.title_kr = '' OR "
+        "(t.title_kr ~ '[ぁ-んァ-ヶ一-龥]' AND t.title_kr ~ '[ㄱ-ㅣ가-힣]'))"
+    ),
+    'overwrite': 'TRUE',
+}
+
+DIFF_SAMPLE_LIMIT = 20
+
+
+@contextmanager
+def _timed(report: Dict[str, Any], name: str):
+    """단계별 소요 시간을 report['timings']에 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        report['timings'][name] = time.perf_counter() - start
+
+
+def _load_temp_table(cur, corrections: Dict[str, str]):
+    """수정 목록을 임시 테이블 _title_kr_fix에 적재 (트랜잭션 종료 시 자동 삭제)"""
+    cur.execute('''
+        CREATE TEMP TABLE _title_kr_fix (
+            title TEXT PRIMARY KEY,
+            title_kr TEXT NOT NULL
+        ) ON COMMIT DROP
+    ''')
+    rows = [(jp, kr) for jp, kr in corrections.items() if jp and kr]
+    psycopg2.extras.execute_values(
+        cur, 'INSERT INTO _title_kr_fix (title, title_kr) VALUES %s', rows, page_size=1000
+    )
+    cur.execute('ANALYZE _title_kr_fix')
+    return len(rows)
+
+
+def _diff(cur, table: str, cond: str) -> Dict[str, Any]:
+    """변경 예정 행 수 + 제목 단위 샘플"""
+    cur.execute(f'''
+        SELECT t.title, MIN(t.title_kr), f.title_kr, COUNT(*)
+        FROM {table} t
+        JOIN _title_kr_fix f ON f.title = t.title
+        WHERE {cond} AND t.title_kr IS DISTINCT FROM f.title_kr
+        GROUP BY t.title, f.title_kr
+        ORDER BY t.title
+    ''')
+    rows = cur.fetchall()
+    return {
+        'rows': sum(r[3] for r in rows),
+        'titles': len(rows),
+        'sample': [(r[0], r[1] or '', r[2]) for r in rows[:DIFF_SAMPLE_LIMIT]],
+    }
+
+
+def _update(cur, table: str, cond: str) -> int:
+    cur.execute(f'''
+        UPDATE {table} t
+        SET title_kr = f.title_kr
+        FROM _title_kr_fix f
+        WHERE f.title = t.title
+          AND {cond}
+          AND t.title_kr IS DISTINCT FROM f.title_kr
+    ''')
+    return cur.rowcount
+
+
+def relink_unified_works_bulk(cur) -> int:
+    """
+    title_kr이 있지만 unified_work_id가 없는 works를 unified_works에 연결 (2문장)
+
+    Returns:
+        연결된 works 행 수
+    """
+    cur.execute('''
+        INSERT INTO unified_works
+            (title_kr, title_canonical, author, publisher, genre, genre_kr,
+             is_riverse, thumbnail_url, thumbnail_hash)
+        SELECT DISTINCT ON (title_kr)
+            title_kr, title, COALESCE(author, ''), COALESCE(publisher, ''),
+            COALESCE(genre, ''), COALESCE(genre_kr, ''), COALESCE(is_riverse, FALSE),
+            COALESCE(thumbnail_url, ''), thumbnail_hash
+        FROM works
+        WHERE title_kr IS NOT NULL AND title_kr != ''
+          AND unified_work_id IS NULL
+        ORDER BY title_kr, last_seen_date DESC NULLS LAST
+        ON CONFLICT (title_kr) DO UPDATE SET
+            title_canonical = COALESCE(NULLIF(EXCLUDED.title_canonical, ''), unified_works.title_canonical),
+            author = COALESCE(NULLIF(EXCLUDED.author, ''), unified_works.author),
+            is_riverse = EXCLUDED.is_riverse OR unified_works.is_riverse,
+            thumbnail_url = COALESCE(NULLIF(EXCLUDED.thumbnail_url, ''), unified_works.thumbnail_url),
+            thumbnail_hash = COALESCE(EXCLUDED.thumbnail_hash, unified_works.thumbnail_hash),
+            updated_at = NOW()
+    ''')
+    cur.execute('''
+        UPDATE works w
+        SET unified_work_id = uw.id
+        FROM unified_works uw
+        WHERE w.title_kr = uw.title_kr
+          AND w.title_kr IS NOT NULL AND w.title_kr != ''
+          AND w.unified_work_id IS NULL
+    ''')
+    return cur.rowcount
+
+
+def apply_title_kr_corrections(conn, corrections: Dict[str, str], mode: str = 'fill',
+                               dry_run: bool = False, relink: bool = False) -> Dict[str, Any]:
+    """
+    title_kr 일괄 수정 (한 트랜잭션)
+
+    Args:
+        conn: psycopg2 연결 (autocommit 꺼져 있어야 함)
+        corrections: {일본어 제목: 한국어 제목}
+        mode: 'fill' | 'fill_or_mixed' | 'overwrite'
+        dry_run: True면 diff만 계산하고 ROLLBACK
+        relink: True면 수정 후 unified_works 재연결까지 실행
+
+    Returns:
+        {'mode', 'dry_run', 'loaded', 'works': {...}, 'rankings': {...},
+         'relinked', 'timings': {단계: 초}}
+    """
+    if mode not in _MODE_CONDITIONS:
+        raise ValueError(f"unknown mode: {mode}")
+    cond = _MODE_CONDITIONS[mode]
+
+    report: Dict[str, Any] = {'mode': mode, 'dry_run': dry_run, 'relinked': 0, 'timings': {}}
+    total_start = time.perf_counter()
+
+    cur = conn.cursor()
+    try:
+        with _timed(report, 'load'):
+            report['loaded'] = _load_temp_table(cur, corrections)
+
+        if dry_run:
+            with _timed(report, 'diff'):
+                report['works'] = _diff(cur, 'works', cond)
+                report['rankings'] = _diff(cur, 'rankings', cond)
+            conn.rollback()
+        else:
+            with _timed(report, 'update_works'):
+                report['works'] = {'rows': _update(cur, 'works', cond)}
+            with _timed(report, 'update_rankings'):
+                report['rankings'] = {'rows': _update(cur, 'rankings', cond)}
+            if relink:
+                with _timed(report, 'relink'):
+                    report['relinked'] = relink_unified_works_bulk(cur)
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+    report['timings']['total'] = time.perf_counter() - total_start
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """수정 결과 / dry-run diff + 단계별 소요 시간 출력"""
+    label = 'DRY-RUN (변경 없음)' if report['dry_run'] else '적용 완료'
+    print(f"\n📋 title_kr 일괄 수정 [{report['mode']}] — {label}")
+    print(f"  적재: {report.get('loaded', 0)}개 매핑")
+
+    for table in ('works', 'rankings'):
+        info = report.get(table, {})
+        if report['dry_run']:
+            print(f"  {table}: {info.get('rows', 0)}행 / {info.get('titles', 0)}개 제목 변경 예정")
+            for jp, old, new in info.get('sample', []):
+                print(f"     {jp[:40]}: '{old[:30]}' → '{new[:30]}'")
+        else:
+            print(f"  {table}: {info.get('rows', 0)}행 업데이트")
+
+    if report.get('relinked'):
+        print(f"  unified_works 재연결: {report['relinked']}행")
+
+    timings = report.get('timings', {})
+    print("  ⏱️  " + ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()))
@@ -16,11 +16,20 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from crawler.utils import get_korean_title, is_riverse_title, translate_genre
+from crawler.work_resolver import get_resolver
+from crawler.thumbnail_store import decode_data_uri, get_store as get_thumbnail_store
+from crawler.refresh_scheduler import plan_refreshes, record_refresh
+from crawler.batch_fingerprint import (
+    KIND_RANKINGS, KIND_WORKS, batch_fingerprint, item_hash, load_batch, store_batch,
+)
 
 # 환경변수 로드
 load_dotenv(project_root / '.env')
 DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
 
+# 플랫폼별 배치 diff 결과 누적 {platform: {'changed': n, 'skipped': n}}
+_ingest_stats: Dict[str, Dict[str, int]] = {}
+
 
 def get_db_connection():
     """Supabase PostgreSQL 연결"""
@@ -41,62 +50,100 @@ def init_db():
         raise
 
 
+def _record_ingest(platform: str, changed: int, skipped: int):
+    stats = _ingest_stats.setdefault(platform, {'changed': 0, 'skipped': 0})
+    stats['changed'] += changed
+    stats['skipped'] += skipped
+
+
+def pop_ingest_stats(platform: str) -> Dict[str, int]:
+    """
+    플랫폼별 누적 쓰기/스킵 행 수 반환 후 초기화
+    (save_rankings + save_works_metadata 합계, AgentResult 보고용)
+    """
+    return _ingest_stats.pop(platform, {'changed': 0, 'skipped': 0})
+
+
 def save_rankings(date: str, platform: str, rankings: List[Dict[str, Any]],
-                   sub_category: str = ''):
+                   sub_category: str = '') -> Dict[str, int]:
     """
-    랭킹 데이터 저장 (upsert 방식)
+    랭킹 데이터 저장 (upsert 방식, 배치 지문 기반 diff)
+
+    같은 날 같은 (platform, sub_category) 배치가 이미 저장돼 있으면:
+    - 지문이 같으면 쓰기 생략
+    - 다르면 항목 해시가 바뀐 순위만 upsert
 
     Args:
         date: 날짜 (YYYY-MM-DD)
         platform: 플랫폼 이름 (piccoma, linemanga, mechacomic, cmoa)
         rankings: 랭킹 데이터 리스트
         sub_category: 서브 카테고리 (예: 'ファンタジー', '恋愛' 등, 기본: '' = 종합)
+
+    Returns:
+        {'changed': 쓴 행 수, 'skipped': 변경 없어 생략한 행 수}
     """
     if not rankings:
         print(f"⚠️  {platform}: 저장할 데이터 없음")
-        return
+        return {'changed': 0, 'skipped': 0}
 
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    # Asura: rankings 제목을 works 제목과 정규화 매칭하여 통일
-    # (랭킹 페이지와 시리즈 목록의 제목 표기 차이 해소)
-    title_norm_map = {}  # {normalized: works_title}
-    if platform == 'asura':
-        import re
-        cursor.execute("SELECT title FROM works WHERE platform = 'asura'")
-        for (wt,) in cursor.fetchall():
-            n = re.sub(r'[^a-z0-9]', '', wt.lower())
-            title_norm_map[n] = wt
-
-    saved_count = 0
+    # 파생 컬럼 (한국어 제목 / 장르 번역 / 리버스 여부) — 매핑 테이블이 바뀌면 해시도 바뀌도록 포함
+    derived = {}
     for item in rankings:
-        title = item['title']
+        derived[str(item['rank'])] = (
+            get_korean_title(item['title']),
+            translate_genre(item.get('genre', '')),
+            is_riverse_title(item['title']),
+        )
 
-        # Asura: works 제목과 정규화 매칭
-        if platform == 'asura' and title_norm_map:
-            import re
-            tn = re.sub(r'[^a-z0-9]', '', title.lower())
-            if title not in title_norm_map.values() and tn in title_norm_map:
-                title = title_norm_map[tn]
+    # 배치 지문 비교 (rank별 title/genre/url + 파생 컬럼 기준)
+    hashes = {
+        str(item['rank']): item_hash((item['title'], item.get('genre', ''), item.get('url', ''))
+                                     + derived[str(item['rank'])])
+        for item in rankings
+    }
+    fingerprint = batch_fingerprint(hashes)
+    enabled, prev_fp, prev_hashes = load_batch(cursor, date, platform, sub_category, KIND_RANKINGS)
+    if enabled and prev_fp == fingerprint:
+        conn.close()
+        _record_ingest(platform, 0, len(rankings))
+        print(f"⏭️  {platform}{f' [{sub_category}]' if sub_category else ''}: "
+              f"변경 없음 — {len(rankings)}개 쓰기 생략")
+        return {'changed': 0, 'skipped': len(rankings)}
 
-        # 제목 매핑
-        title_kr = get_korean_title(title)
+    # 작품 ID 리졸버: 제목 → (works 정식 제목, works.id)
+    # (Asura 랭킹 페이지/시리즈 목록 표기 차이 등은 정규화 매칭으로 works 제목에 통일 —
+    #  제목으로 조인하는 화면이 계속 맞도록. 퍼지는 후보 로그만 남기고 수집 제목 그대로)
+    resolver = get_resolver(platform, cursor)
 
-        # 장르 번역
-        genre_kr = translate_genre(item.get('genre', ''))
+    saved_count = 0
+    skipped_count = 0
+    for item in rankings:
+        key = str(item['rank'])
+        if prev_hashes.get(key) == hashes[key]:
+            skipped_count += 1
+            continue
 
-        # 리버스 작품 여부
-        is_riverse = is_riverse_title(title)
+        title_kr, genre_kr, is_riverse = derived[key]
 
+        # 행 단위 SAVEPOINT: 한 행이 실패해도 트랜잭션은 살아 있어야 나머지 행/배치 지문을 저장할 수 있음
+        cursor.execute('SAVEPOINT ranking_row')
+        created_before = resolver.stats['created']
         try:
+            title, work_id = resolver.resolve(item['title'], cursor=cursor, create=True)
+            if title != item['title']:
+                title_kr = get_korean_title(title)
+                is_riverse = is_riverse_title(title)
             cursor.execute('''
                 INSERT INTO rankings
-                (date, platform, sub_category, rank, title, title_kr, genre, genre_kr, url, is_riverse)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                (date, platform, sub_category, rank, title, title_kr, genre, genre_kr, url, is_riverse, work_id)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 ON CONFLICT (date, platform, sub_category, rank)
                 DO UPDATE SET
                     title = EXCLUDED.title,
+                    work_id = EXCLUDED.work_id,
                     title_kr = EXCLUDED.title_kr,
                     genre = EXCLUDED.genre,
                     genre_kr = EXCLUDED.genre_kr,
@@ -112,23 +159,39 @@ def save_rankings(date: str, platform: str, rankings: List[Dict[str, Any]],
                 item.get('genre', ''),
                 genre_kr,
                 item.get('url', ''),
-                is_riverse
+                is_riverse,
+                work_id
             ))
+            cursor.execute('RELEASE SAVEPOINT ranking_row')
             saved_count += 1
         except Exception as e:
+            cursor.execute('ROLLBACK TO SAVEPOINT ranking_row')
+            if resolver.stats['created'] != created_before:
+                resolver.forget(item['title'])
+            hashes.pop(key, None)
             print(f"❌ 저장 실패 ({platform} {item['rank']}위): {e}")
 
+    if enabled:
+        store_batch(cursor, date, platform, sub_category, KIND_RANKINGS,
+                    batch_fingerprint(hashes), hashes)
+
     conn.commit()
     conn.close()
+    resolver.mark_committed()
 
-    print(f"💾 {platform}: {saved_count}개 작품 DB 저장")
+    _record_ingest(platform, saved_count, skipped_count)
+    if skipped_count:
+        print(f"💾 {platform}: {saved_count}개 작품 DB 저장 (변경 없음 {skipped_count}개 생략)")
+    else:
+        print(f"💾 {platform}: {saved_count}개 작품 DB 저장")
+    return {'changed': saved_count, 'skipped': skipped_count}
 
 
 def _upsert_unified_work(cursor, title_kr: str, title: str, author: str = '',
                           publisher: str = '', genre: str = '', genre_kr: str = '',
                           tags: str = '', description: str = '',
                           is_riverse: bool = False, thumbnail_url: str = '',
-                          thumbnail_base64: str = '',
+                          thumbnail_hash: Optional[str] = None,
                           title_en: str = '') -> Optional[int]:
     """
     unified_works 테이블 UPSERT 후 id 반환.
@@ -140,7 +203,7 @@ def _upsert_unified_work(cursor, title_kr: str, title: str, author: str = '',
     cursor.execute('''
         INSERT INTO unified_works
             (title_kr, title_canonical, author, publisher, genre, genre_kr,
-             tags, description, is_riverse, thumbnail_url, thumbnail_base64, title_en)
+             tags, description, is_riverse, thumbnail_url, thumbnail_hash, title_en)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         ON CONFLICT (title_kr) DO UPDATE SET
             title_canonical = COALESCE(NULLIF(EXCLUDED.title_canonical, ''), unified_works.title_canonical),
@@ -154,39 +217,81 @@ def _upsert_unified_work(cursor, title_kr: str, title: str, author: str = '',
                           THEN EXCLUDED.description ELSE unified_works.description END,
             is_riverse = EXCLUDED.is_riverse OR unified_works.is_riverse,
             thumbnail_url = COALESCE(NULLIF(EXCLUDED.thumbnail_url, ''), unified_works.thumbnail_url),
-            thumbnail_base64 = COALESCE(NULLIF(EXCLUDED.thumbnail_base64, ''), unified_works.thumbnail_base64),
+            thumbnail_hash = COALESCE(EXCLUDED.thumbnail_hash, unified_works.thumbnail_hash),
             title_en = COALESCE(NULLIF(EXCLUDED.title_en, ''), unified_works.title_en),
             updated_at = NOW()
         RETURNING id
     ''', (
         title_kr, title, author, publisher, genre, genre_kr,
-        tags, description, is_riverse, thumbnail_url, thumbnail_base64, title_en
+        tags, description, is_riverse, thumbnail_url, thumbnail_hash, title_en
     ))
     row = cursor.fetchone()
     return row[0] if row else None
 
 
 def save_works_metadata(platform: str, works: List[Dict[str, Any]],
-                        date: str = '', sub_category: str = ''):
+                        date: str = '', sub_category: str = '') -> Dict[str, int]:
     """
     작품 메타데이터 저장/갱신 (독립 작품 DB)
     + unified_works 자동 연결
 
+    date가 있으면 save_rankings와 같은 방식으로 배치 지문을 비교해
+    같은 날 이미 반영된 항목(last_seen_date/best_rank 포함)은 다시 쓰지 않는다.
+
     Args:
         platform: 플랫폼 이름
         works: [{'title': str, 'thumbnail_url': str, 'url': str, 'genre': str, 'rank': int}, ...]
         date: 크롤링 날짜 (YYYY-MM-DD) — first/last_seen_date 갱신용
         sub_category: 서브 카테고리 ('' = 종합 → best_rank 갱신)
+
+    Returns:
+        {'changed': 쓴 작품 수, 'skipped': 변경 없어 생략한 작품 수}
     """
     if not works:
-        return
+        return {'changed': 0, 'skipped': 0}
 
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    count = 0
+    # 파생 컬럼 (한국어 제목 / 장르 번역 / 리버스 여부) — 매핑 테이블이 바뀌면 해시도 바뀌도록 포함
+    derived = {}
     for item in works:
         title = item.get('title', '')
+        if title:
+            genre = item.get('genre', '')
+            derived[title] = (
+                get_korean_title(title),
+                translate_genre(genre) if genre else '',
+                is_riverse_title(title),
+            )
+
+    hashes = {
+        item.get('title', ''): item_hash((
+            item.get('thumbnail_url', ''), item.get('url', ''), item.get('genre', ''),
+            item.get('rank'), item.get('rating'), item.get('review_count'),
+        ) + derived[item['title']])
+        for item in works if item.get('title')
+    }
+    enabled, prev_fp, prev_hashes = (
+        load_batch(cursor, date, platform, sub_category, KIND_WORKS) if date
+        else (False, None, {})
+    )
+    if enabled and prev_fp == batch_fingerprint(hashes):
+        conn.close()
+        _record_ingest(platform, 0, len(hashes))
+        return {'changed': 0, 'skipped': len(hashes)}
+
+    resolver = get_resolver(platform, cursor)
+
+    count = 0
+    skipped = 0
+    for item in works:
+        raw_title = item.get('title', '')
+        if raw_title and prev_hashes.get(raw_title) == hashes[raw_title]:
+            skipped += 1
+            continue
+
+        title = raw_title
         thumbnail_url = item.get('thumbnail_url', '')
         url = item.get('url', '')
         genre = item.get('genre', '')
@@ -195,10 +300,8 @@ def save_works_metadata(platform: str, works: List[Dict[str, Any]],
         if not title:
             continue
 
-        # 한국어 제목, 리버스 여부 계산
-        title_kr = get_korean_title(title)
-        genre_kr = translate_genre(genre) if genre else ''
-        is_riverse = is_riverse_title(title)
+        # 한국어 제목, 장르 번역, 리버스 여부 (해시 계산 때 구한 값)
+        title_kr, genre_kr, is_riverse = derived[title]
 
         # Asura: 한국어 매핑 없으면 영어 제목을 title_kr로 사용 (fallback)
         title_en = title if platform == 'asura' else ''
@@ -239,6 +342,7 @@ def save_works_metadata(platform: str, works: List[Dict[str, Any]],
                     THEN EXCLUDED.best_rank ELSE works.best_rank END,
                 unified_work_id = COALESCE(EXCLUDED.unified_work_id, works.unified_work_id),
                 updated_at = NOW()
+            RETURNING id
         ''', (
             platform, title, thumbnail_url, url, genre, genre_kr,
             title_kr, is_riverse,
@@ -247,6 +351,7 @@ def save_works_metadata(platform: str, works: List[Dict[str, Any]],
             sub_category, rank, rank,  # best_rank (only for 종합)
             unified_id
         ))
+        resolver.register(title, cursor.fetchone()[0])
         count += 1
 
         # rating/review_count가 있으면 works에 반영 (Asura 등)
@@ -261,11 +366,18 @@ def save_works_metadata(platform: str, works: List[Dict[str, Any]],
                 WHERE platform = %s AND title = %s
             ''', (rating, review_count, platform, title))
 
+    if enabled:
+        store_batch(cursor, date, platform, sub_category, KIND_WORKS,
+                    batch_fingerprint(hashes), hashes)
+
     conn.commit()
     conn.close()
+    resolver.mark_committed()
 
+    _record_ingest(platform, count, skipped)
     if count > 0:
         print(f"🖼️  {platform}: {count}개 작품 메타데이터 저장")
+    return {'changed': count, 'skipped': skipped}
 
 
 def get_works_thumbnails(platform: str) -> Dict[str, str]:
@@ -289,28 +401,48 @@ def get_works_thumbnails(platform: str) -> Dict[str, str]:
     return result
 
 
-def save_thumbnail_base64(platform: str, title: str, b64_data: str):
+def save_thumbnail_bytes(platform: str, title: str, data: bytes) -> str:
     """
-    작품 썸네일 base64 데이터 저장
+    작품 썸네일 저장 (blob 저장소 + works.thumbnail_hash)
 
     Args:
         platform: 플랫폼 이름
         title: 작품명
-        b64_data: "data:image/jpeg;base64,..." 형식의 data URI
+        data: 이미지 바이트
+
+    Returns:
+        콘텐츠 해시
     """
+    key = get_thumbnail_store().put(data)
     conn = get_db_connection()
     cursor = conn.cursor()
     cursor.execute('''
-        UPDATE works SET thumbnail_base64 = %s, updated_at = NOW()
+        UPDATE works SET thumbnail_hash = %s, updated_at = NOW()
         WHERE platform = %s AND title = %s
-    ''', (b64_data, platform, title))
+          AND thumbnail_hash IS DISTINCT FROM %s
+    ''', (key, platform, title, key))
     conn.commit()
     conn.close()
+    return key
+
+
+def save_thumbnail_base64(platform: str, title: str, b64_data: str):
+    """
+    작품 썸네일 저장 (data URI 입력용 — 디코드 후 save_thumbnail_bytes)
+
+    Args:
+        platform: 플랫폼 이름
+        title: 작품명
+        b64_data: "data:image/jpeg;base64,..." 형식의 data URI
+    """
+    data = decode_data_uri(b64_data)
+    if data:
+        save_thumbnail_bytes(platform, title, data)
 
 
 def get_thumbnails_base64(platform: str) -> Dict[str, str]:
     """
-    플랫폼의 모든 작품 썸네일 base64 맵 반환
+    플랫폼의 모든 작품 썸네일을 data URI 맵으로 반환 (blob 저장소에서 로드)
 
     Returns:
         {title: "data:image/...;base64,..."} 딕셔너리
@@ -318,18 +450,20 @@ def get_thumbnails_base64(platform: str) -> Dict[str, str]:
     conn = get_db_connection()
     cursor = conn.cursor()
     cursor.execute('''
-        SELECT title, thumbnail_base64
+        SELECT title, thumbnail_hash
         FROM works
-        WHERE platform = %s AND thumbnail_base64 IS NOT NULL AND thumbnail_base64 != ''
+        WHERE platform = %s AND thumbnail_hash IS NOT NULL
     ''', (platform,))
-    result = {row[0]: row[1] for row in cursor.fetchall()}
+    hashes = {row[0]: row[1] for row in cursor.fetchall()}
     conn.close()
-    return result
+
+    uris = get_thumbnail_store().get_data_uris(hashes.values())
+    return {title: uris[h] for title, h in hashes.items() if h in uris}
 
 
 def get_works_without_base64(platform: str) -> List[Dict[str, str]]:
     """
-    base64가 없지만 thumbnail_url이 있는 작품 목록 반환
+    저장된 썸네일이 없지만 thumbnail_url이 있는 작품 목록 반환
 
     Returns:
         [{'title': str, 'thumbnail_url': str}, ...]
@@ -341,26 +475,52 @@ def get_works_without_base64(platform: str) -> List[Dict[str, str]]:
         FROM works
         WHERE platform = %s
           AND thumbnail_url IS NOT NULL AND thumbnail_url != ''
-          AND (thumbnail_base64 IS NULL OR thumbnail_base64 = '')
+          AND thumbnail_hash IS NULL
     ''', (platform,))
     result = [{'title': row[0], 'thumbnail_url': row[1]} for row in cursor.fetchall()]
     conn.close()
     return result
 
 
-def save_work_detail(platform: str, title: str, detail: Dict[str, Any]):
+DETAIL_FIELDS = ('author', 'publisher', 'label', 'tags', 'description',
+                 'hearts', 'favorites', 'rating', 'review_count')
+
+
+def _detail_changed(old, new) -> bool:
+    """COALESCE 저장 규칙 기준으로 값이 실제로 바뀌는지"""
+    if new is None or new == '':
+        return False
+    if old is None:
+        return True
+    if isinstance(new, (int, float)):
+        try:
+            return float(old) != float(new)
+        except (TypeError, ValueError):
+            return True
+    return str(old) != str(new)
+
+
+def save_work_detail(platform: str, title: str, detail: Dict[str, Any],
+                     score: Optional[float] = None):
     """
     작품 상세 메타데이터 저장 (상세 페이지에서 수집)
     COALESCE(NULLIF(...), existing) 패턴으로 기존 데이터 보호
     + unified_works에도 상세 정보 반영
+    + 바뀐 필드를 detail_refresh_log에 기록 (갱신 스케줄러 적중률용)
 
     Args:
         platform: 플랫폼 이름
         title: 작품 제목 (일본어)
         detail: {author, publisher, label, tags, description, hearts, favorites, rating, review_count}
+        score: 스케줄러가 이 작품을 고른 점수 (수동/리버스 전체 수집이면 None)
     """
     conn = get_db_connection()
     cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT {', '.join(DETAIL_FIELDS)} FROM works WHERE platform = %s AND title = %s
+    ''', (platform, title))
+    old = cursor.fetchone()
+
     cursor.execute('''
         UPDATE works SET
             author = COALESCE(NULLIF(%s, ''), author),
@@ -388,6 +548,9 @@ def save_work_detail(platform: str, title: str, detail: Dict[str, Any]):
         platform, title
     ))
     updated = cursor.rowcount
+    if old is not None:
+        changed = [f for f, o in zip(DETAIL_FIELDS, old) if _detail_changed(o, detail.get(f))]
+        record_refresh(cursor, platform, title, changed, detail, score)
 
     # unified_works에도 상세 정보 반영
     title_kr = get_korean_title(title)
@@ -424,18 +587,19 @@ def save_reviews(platform: str, work_title: str, reviews: List[Dict[str, Any]])
 
     conn = get_db_connection()
     cursor = conn.cursor()
+    _, work_id = get_resolver(platform, cursor).resolve(work_title)
     count = 0
     for r in reviews:
         try:
             cursor.execute('''
                 INSERT INTO reviews
-                (platform, work_title, reviewer_name, reviewer_info, body,
+                (platform, work_title, work_id, reviewer_name, reviewer_info, body,
                  rating, likes_count, is_spoiler, reviewed_at, collected_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
                 ON CONFLICT (platform, work_title, reviewer_name, reviewed_at)
                 DO NOTHING
             ''', (
-                platform, work_title,
+                platform, work_title, work_id,
                 r.get('reviewer_name', ''),
                 r.get('reviewer_info', ''),
                 r.get('body', ''),
@@ -453,47 +617,72 @@ def save_reviews(platform: str, work_title: str, reviews: List[Dict[str, Any]])
     return count
 
 
+def get_review_watermarks(platform: str) -> Dict[str, Dict[str, Any]]:
+    """
+    작품별 리뷰 수집 기준점 (이미 저장된 가장 최신 리뷰)
+
+    reviewed_at은 크롤러가 넘긴 naive 시각과 같은 기준(DB 세션 타임존)의 문자열로 반환.
+    같은 시각(일 단위 날짜 등)에 여러 리뷰가 있을 수 있어 그 시각의 작성자 목록도 함께 반환.
+    MAX(reviewed_at) 기준이므로 리뷰 크롤러는 끝까지 수집된 작품만 저장한다 (중단된 수집은 미저장).
+
+    Returns:
+        {work_title: {'reviewed_at': 'YYYY-MM-DDTHH:MM:SS', 'reviewers': [이름, ...]}}
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        WITH latest AS (
+            SELECT work_title, MAX(reviewed_at) AS mx
+            FROM reviews
+            WHERE platform = %s AND reviewed_at IS NOT NULL
+            GROUP BY work_title
+        )
+        SELECT l.work_title,
+               to_char(l.mx AT TIME ZONE current_setting('TimeZone'), 'YYYY-MM-DD"T"HH24:MI:SS'),
+               array_agg(r.reviewer_name)
+        FROM latest l
+        JOIN reviews r
+          ON r.platform = %s AND r.work_title = l.work_title AND r.reviewed_at = l.mx
+        GROUP BY l.work_title, l.mx
+    ''', (platform, platform))
+    result = {
+        row[0]: {'reviewed_at': row[1], 'reviewers': row[2] or []}
+        for row in cursor.fetchall()
+    }
+    conn.close()
+    return result
+
+
 def get_works_needing_detail(max_count: int = 50, riverse_only: bool = False) -> List[Dict[str, str]]:
     """
     상세 메타데이터가 필요한 작품 목록 조회
-    - detail_scraped_at이 NULL이거나 7일 이상 지난 작품
-    - 최근 랭킹 등장 순으로 우선
+    - 일반: 갱신 스케줄러(crawler/refresh_scheduler.py)가 가치 점수 순으로 max_count개 선택
     - 상세 크롤러 지원 플랫폼만: piccoma, linemanga, mechacomic, cmoa
 
     Args:
-        max_count: 최대 작품 수
+        max_count: 최대 작품 수 (실행당 갱신 예산)
         riverse_only: True이면 리버스 작품만 (detail_scraped_at 조건 무시, 강제 재수집)
 
     Returns:
-        [{platform, title, url}, ...]
+        [{platform, title, url, score?}, ...]
     """
     SUPPORTED_PLATFORMS = ('piccoma', 'linemanga', 'mechacomic', 'cmoa')
 
+    if not riverse_only:
+        return plan_refreshes(max_count, SUPPORTED_PLATFORMS)
+
     conn = get_db_connection()
     cursor = conn.cursor()
-    if riverse_only:
-        # 리버스 작품은 기존 수집 여부와 무관하게 전부 재수집
-        cursor.execute('''
-            SELECT platform, title, url
-            FROM works
-            WHERE url IS NOT NULL AND url != ''
-              AND is_riverse = TRUE
-              AND platform IN %s
-            ORDER BY last_seen_date DESC NULLS LAST
-            LIMIT %s
-        ''', (SUPPORTED_PLATFORMS, max_count))
-    else:
-        cursor.execute('''
-            SELECT platform, title, url
-            FROM works
-            WHERE url IS NOT NULL AND url != ''
-              AND platform IN %s
-              AND (detail_scraped_at IS NULL
-                   OR detail_scraped_at < NOW() - INTERVAL '7 days')
-            ORDER BY last_seen_date DESC NULLS LAST,
-                     detail_scraped_at ASC NULLS FIRST
-            LIMIT %s
-        ''', (SUPPORTED_PLATFORMS, max_count))
+    # 리버스 작품은 기존 수집 여부와 무관하게 전부 재수집
+    cursor.execute('''
+        SELECT platform, title, url
+        FROM works
+        WHERE url IS NOT NULL AND url != ''
+          AND is_riverse = TRUE
+          AND platform IN %s
+        ORDER BY last_seen_date DESC NULLS LAST
+        LIMIT %s
+    ''', (SUPPORTED_PLATFORMS, max_count))
     result = [{'platform': r[0], 'title': r[1], 'url': r[2]} for r in cursor.fetchall()]
     conn.close()
     return result
@@ -0,0 +1,194 @@
+"""
+브라우저 없는 상세 페이지 추출기 (HTTP + HTML 파서)
+
+픽코마/메챠코믹/코믹시모아 상세 페이지는 SSR이라 JSON-LD와 정적 마크업만으로
+필요한 값이 나온다. DetailScraper의 page.evaluate 스크립트와 같은 규칙을
+BeautifulSoup로 옮긴 것 — 결과가 비면 호출 측이 Playwright 경로로 폴백한다.
+
+- new_http_session(): 커넥션 풀을 공유하는 aiohttp 세션 (실행 1회당 1개)
+- extract_*(html): HTML 문자열 → 상세 dict (DetailScraper와 같은 키)
+- extract_breadcrumb_genre(html): BreadcrumbList position 2 (픽코마 장르)
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# 이 중 하나라도 있으면 추출 성공으로 간주 (없으면 Playwright 폴백)
+CORE_FIELDS = ('author', 'publisher', 'genre')
+
+
+def new_http_session(limit: int = 16) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit),
+        timeout=aiohttp.ClientTimeout(total=20, sock_connect=10),
+        headers={'User-Agent': USER_AGENT, 'Accept-Language': 'ja,en;q=0.8'},
+    )
+
+
+def has_core_fields(detail: Optional[Dict[str, Any]]) -> bool:
+    return bool(detail) and any(detail.get(k) for k in CORE_FIELDS)
+
+
+def _soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, 'html.parser')
+
+
+def _json_ld(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    """ld+json 블록 → 객체 목록 (배열/@graph 펼침, 파싱 실패 블록은 무시)"""
+    items = []
+    for tag in soup.select('script[type="application/ld+json"]'):
+        try:
+            data = json.loads(tag.string or tag.get_text())
+        except (ValueError, TypeError):
+            continue
+        stack = data if isinstance(data, list) else [data]
+        for obj in stack:
+            if isinstance(obj, dict):
+                items.append(obj)
+                items.extend(o for o in obj.get('@graph', []) if isinstance(o, dict))
+    return items
+
+
+def _ld_type(obj: Dict[str, Any]) -> str:
+    return str(obj.get('@type', '')).lower()
+
+
+def _link_texts(soup: BeautifulSoup, selector: str, unique: bool = False) -> List[str]:
+    texts = [a.get_text(strip=True) for a in soup.select(selector)]
+    return list(dict.fromkeys(texts)) if unique else texts
+
+
+def _breadcrumb_position(items: List[Dict[str, Any]], position: int) -> Optional[str]:
+    for obj in items:
+        # 픽코마는 "BreadCrumbList", 메챠코믹은 "BreadcrumbList"
+        if _ld_type(obj) == 'breadcrumblist':
+            for el in obj.get('itemListElement') or []:
+                if isinstance(el, dict) and el.get('position') == position:
+                    return el.get('name') or (el.get('item') or {}).get('name')
+    return None
+
+
+def extract_breadcrumb_genre(html: str) -> str:
+    return _breadcrumb_position(_json_ld(_soup(html)), 2) or ''
+
+
+def extract_piccoma(html: str) -> Dict[str, Any]:
+    soup = _soup(html)
+    result: Dict[str, Any] = {}
+
+    for obj in _json_ld(soup):
+        if obj.get('@type') == 'Product':
+            result['description'] = obj.get('description') or ''
+            offers = obj.get('offers')
+            if isinstance(offers, dict) and offers.get('category'):
+                result['genre'] = offers['category']
+
+    authors = _link_texts(soup, 'a[href*="/author/product/list/"]', unique=True)
+    if authors:
+        result['author'] = ', '.join(authors)
+    partners = _link_texts(soup, 'a[href*="/partner/product/list/"]', unique=True)
+    if partners:
+        result['publisher'] = ', '.join(partners)
+    labels = _link_texts(soup, 'a[href*="/category/product/list/"]', unique=True)
+    if labels:
+        result['label'] = ', '.join(labels)
+
+    # 하트수 (いいね): like 클래스 조상 → 없으면 부모의 숫자
+    like_img = soup.select_one('img[alt="いいね"]')
+    if like_img:
+        holder = like_img.find_parent(
+            lambda t: any('like' in c for c in (t.get('class') or []))
+        ) or like_img.parent
+        digits = re.sub(r'[^0-9]', '', holder.get_text()) if holder else ''
+        if digits:
+            result['hearts'] = int(digits)
+
+    return result
+
+
+def extract_mechacomic(html: str) -> Dict[str, Any]:
+    soup = _soup(html)
+    result: Dict[str, Any] = {}
+
+    authors = _link_texts(soup, 'a[href*="/authors/"]')
+    if authors:
+        result['author'] = ', '.join(authors)
+    labels = _link_texts(soup, 'a[href*="/labels/"]')
+    if labels:
+        result['label'] = ', '.join(labels)
+
+    for img in soup.select('img[alt*="評価"]'):
+        m = re.search(r'([0-9.]+)', img.get('alt', ''))
+        if m:
+            try:
+                result['rating'] = float(m.group(1))
+                break
+            except ValueError:
+                continue
+
+    body = soup.body.get_text() if soup.body else ''
+    m = re.search(r'全([0-9]+)件', body)
+    if m:
+        result['review_count'] = int(m.group(1))
+
+    genre = _breadcrumb_position(_json_ld(soup), 2)
+    if genre:
+        result['genre'] = genre
+
+    return result
+
+
+def extract_cmoa(html: str) -> Dict[str, Any]:
+    soup = _soup(html)
+    result: Dict[str, Any] = {}
+
+    for obj in _json_ld(soup):
+        kind = _ld_type(obj)
+        # Product (브랜드=출판사, 카테고리=장르, 평점)
+        if kind == 'product':
+            brand = obj.get('brand')
+            if brand:
+                result['publisher'] = brand if isinstance(brand, str) else brand.get('name') or ''
+            if obj.get('category'):
+                result['genre'] = obj['category']
+            rating = obj.get('aggregateRating')
+            if isinstance(rating, dict):
+                try:
+                    result['rating'] = float(rating.get('ratingValue')) or None
+                except (TypeError, ValueError):
+                    result['rating'] = None
+                try:
+                    result['review_count'] = int(rating.get('reviewCount')) or None
+                except (TypeError, ValueError):
+                    result['review_count'] = None
+        # Book (작가)
+        if obj.get('@type') == 'Book' and obj.get('author'):
+            authors = obj['author'] if isinstance(obj['author'], list) else [obj['author']]
+            names = [a.get('name') if isinstance(a, dict) else a for a in authors]
+            result['author'] = ', '.join(n for n in names if n)
+
+    labels = _link_texts(soup, 'a[href*="/search/magazine/"]')
+    if labels:
+        result['label'] = ', '.join(labels)
+    tags = _link_texts(soup, 'a[href*="/search/titletag/"]', unique=True)
+    if tags:
+        result['tags'] = ','.join(tags)
+    genres = _link_texts(soup, 'a[href*="/search/genre/"]')
+    if genres and not result.get('genre'):
+        result['genre'] = ' / '.join(genres)
+
+    return result
+
+
+# 플랫폼 → 추출기 (여기 없는 플랫폼은 CSR이라 Playwright 전용)
+EXTRACTORS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    'piccoma': extract_piccoma,
+    'mechacomic': extract_mechacomic,
+    'cmoa': extract_cmoa,
+}
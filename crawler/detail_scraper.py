@@ -1,7 +1,10 @@
 """
 작품 상세 페이지 메타데이터 스크래퍼
 - 매일 랭킹 크롤링 후 실행
-- 1회 최대 50개, 요청 간 3초 딜레이 (NAS 부하 방지)
+- 대상은 갱신 스케줄러가 가치 점수 순으로 예산만큼 선택 (crawler/refresh_scheduler.py)
+- 플랫폼별 워커 동시 실행 (호스트마다 독립 페이싱, crawler/rate_controller.py)
+- SSR 플랫폼(픽코마/메챠코믹/코믹시모아)은 HTTP + 파서 우선 (crawler/detail_extract.py),
+  핵심 필드가 비면 Playwright로 폴백
 - 작가/출판사/레이블/태그/하트수/별점 등 수집
 """
 
@@ -9,7 +12,9 @@ import asyncio
 import json
 import logging
 import re
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 from playwright.async_api import Browser, Page
 
 import sys
@@ -18,6 +23,9 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from crawler.db import get_works_needing_detail, save_work_detail
+from crawler.refresh_scheduler import pop_refresh_stats
+from crawler.rate_controller import RateControllerPool
+from crawler.detail_extract import EXTRACTORS, has_core_fields, new_http_session
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('crawler.detail_scraper')
@@ -27,66 +35,133 @@ class DetailScraper:
     """작품 상세 페이지에서 메타데이터를 수집하는 스크래퍼"""
 
     def __init__(self, max_works: int = 50, delay_seconds: float = 3.0):
+        """
+        Args:
+            max_works: 최대 작품 수
+            delay_seconds: 호스트별 요청 간격 초기값 (초, 이후 응답에 따라 자동 조정)
+        """
         self.max_works = max_works
         self.delay_seconds = delay_seconds
+        self.rates: Optional[RateControllerPool] = None
+        self.http = None  # run() 동안 공유하는 aiohttp 세션
+        self.path_counts = {'http': 0, 'browser': 0}
 
     async def run(self, browser: Browser, riverse_only: bool = False):
-        """메인 실행: 메타데이터가 필요한 작품들을 순차 처리"""
+        """메인 실행: 플랫폼(호스트)별 워커를 동시에 돌려 상세 메타데이터 수집"""
         works = get_works_needing_detail(self.max_works, riverse_only=riverse_only)
         if not works:
             logger.info("상세 스크래핑 대상 없음")
             return
 
-        logger.info(f"상세 스크래핑 시작: {len(works)}개 작품")
+        by_platform = defaultdict(list)
+        for w in works:
+            by_platform[w['platform']].append(w)
 
-        # 플랫폼별 컨텍스트 (CMOA는 TLS 우회 필요)
-        context_default = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        logger.info(f"상세 스크래핑 시작: {len(works)}개 작품 ({len(by_platform)}개 플랫폼 동시 실행)")
+        for p, pw in sorted(by_platform.items()):
+            logger.info(f"  {p}: {len(pw)}개")
+        self.rates = RateControllerPool(initial_delay=self.delay_seconds)
+
+        async with new_http_session() as self.http:
+            results = await asyncio.gather(*(
+                self._run_platform(browser, platform, pworks)
+                for platform, pworks in by_platform.items()
+            ), return_exceptions=True)
+        self.http = None
+
+        success = 0
+        failed = 0
+        for r in results:
+            if isinstance(r, Exception):
+                logger.error(f"플랫폼 오류: {r}")
+                continue
+            success += r[0]
+            failed += r[1]
+
+        logger.info(
+            f"상세 스크래핑 완료: 성공 {success}, 실패 {failed} "
+            f"(HTTP {self.path_counts['http']}, 브라우저 {self.path_counts['browser']})"
         )
-        context_cmoa = await browser.new_context(
+        self.rates.log_summary(logger)
+        for platform, st in sorted(pop_refresh_stats().items()):
+            rate = st['hits'] / st['refreshed'] * 100 if st['refreshed'] else 0
+            logger.info(f"  🎯 [{platform}] 갱신 적중률: {st['hits']}/{st['refreshed']} ({rate:.0f}%)")
+
+    async def _run_platform(
+        self, browser: Browser, platform: str, works: List[Dict]
+    ) -> Tuple[int, int]:
+        """
+        플랫폼별 워커 — 자체 브라우저 컨텍스트 + 워커 N개 (N = 호스트 동시성 상한)
+        실제 요청 속도는 호스트 컨트롤러가 조절하므로 워커가 많아도 과속하지 않음
+        페이지는 Playwright 경로가 필요할 때만 워커별로 생성
+        """
+        # CMOA는 TLS 우회 필요
+        ctx = await browser.new_context(
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            ignore_https_errors=True
+            ignore_https_errors=(platform == 'cmoa')
         )
+        queue: asyncio.Queue = asyncio.Queue()
+        for i, work in enumerate(works, 1):
+            queue.put_nowait((i, work))
 
-        page_default = await context_default.new_page()
-        page_cmoa = await context_cmoa.new_page()
+        host = urlsplit(works[0]['url']).hostname or ''
+        n_pages = min(self.rates.limits_for(host).max_concurrency, len(works))
+        counts = {'success': 0, 'failed': 0}
 
-        success = 0
-        failed = 0
+        async def worker():
+            page = None
 
-        for i, work in enumerate(works, 1):
-            platform = work['platform']
-            title = work['title']
-            url = work['url']
+            async def get_page() -> Page:
+                nonlocal page
+                if page is None:
+                    page = await ctx.new_page()
+                return page
 
             try:
-                page = page_cmoa if platform == 'cmoa' else page_default
-
-                detail = await self._scrape_detail(page, platform, url)
-                if detail:
-                    save_work_detail(platform, title, detail)
-                    success += 1
-                    if i <= 5 or i % 10 == 0:
-                        logger.info(f"  [{i}/{len(works)}] {platform}: {title[:30]}... OK")
-                else:
-                    failed += 1
-                    logger.warning(f"  [{i}/{len(works)}] {platform}: {title[:30]}... 데이터 없음")
-            except Exception as e:
-                failed += 1
-                logger.warning(f"  [{i}/{len(works)}] {platform}: {title[:30]}... 실패: {e}")
-
-            if i < len(works):
-                await asyncio.sleep(self.delay_seconds)
-
-        await page_default.close()
-        await page_cmoa.close()
-        await context_default.close()
-        await context_cmoa.close()
-
-        logger.info(f"상세 스크래핑 완료: 성공 {success}, 실패 {failed}")
-
-    async def _scrape_detail(self, page: Page, platform: str, url: str) -> Optional[Dict[str, Any]]:
-        """플랫폼별 상세 스크래핑 디스패치"""
+                while not queue.empty():
+                    i, work = queue.get_nowait()
+                    await self._process_work(get_page, i, len(works), work, counts)
+            finally:
+                if page is not None:
+                    await page.close()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(n_pages)))
+        finally:
+            await ctx.close()
+
+        logger.info(f"  [{platform}] 완료: 성공 {counts['success']}, 실패 {counts['failed']}")
+        return counts['success'], counts['failed']
+
+    async def _process_work(self, get_page: Callable[[], Awaitable[Page]], i: int, total: int,
+                            work: Dict, counts: Dict[str, int]):
+        platform = work['platform']
+        title = work['title']
+        try:
+            detail = await self._scrape_detail(get_page, platform, work['url'])
+            if detail:
+                # DB 쓰기는 스레드로 (다른 플랫폼 워커의 이벤트 루프 블로킹 방지)
+                await asyncio.to_thread(save_work_detail, platform, title, detail, work.get('score'))
+                counts['success'] += 1
+                if i <= 5 or i % 10 == 0:
+                    logger.info(f"  [{i}/{total}] {platform}: {title[:30]}... OK")
+            else:
+                counts['failed'] += 1
+                logger.warning(f"  [{i}/{total}] {platform}: {title[:30]}... 데이터 없음")
+        except Exception as e:
+            counts['failed'] += 1
+            logger.warning(f"  [{i}/{total}] {platform}: {title[:30]}... 실패: {e}")
+
+    async def _scrape_detail(self, get_page: Callable[[], Awaitable[Page]],
+                             platform: str, url: str) -> Optional[Dict[str, Any]]:
+        """플랫폼별 상세 스크래핑 디스패치 (HTTP 추출 → 실패 시 Playwright)"""
+        detail = await self._scrape_detail_http(platform, url)
+        if detail:
+            self.path_counts['http'] += 1
+            return detail
+
+        self.path_counts['browser'] += 1
+        page = await get_page()
         if platform == 'piccoma':
             return await self._scrape_piccoma(page, url)
         elif platform == 'linemanga':
@@ -97,9 +172,25 @@ class DetailScraper:
             return await self._scrape_cmoa(page, url)
         return None
 
+    async def _scrape_detail_http(self, platform: str, url: str) -> Optional[Dict[str, Any]]:
+        """브라우저 없이 HTML만 받아 추출 (지원 플랫폼 아니거나 핵심 필드 없으면 None)"""
+        extractor = EXTRACTORS.get(platform)
+        if extractor is None or self.http is None:
+            return None
+        try:
+            # CMOA는 TLS 우회 필요 (Playwright의 ignore_https_errors와 동일)
+            kwargs = {'ssl': False} if platform == 'cmoa' else {}
+            html = await self.rates.get_text(self.http, url, **kwargs)
+            if not html:
+                return None
+            detail = await asyncio.to_thread(extractor, html)
+        except Exception:
+            return None
+        return detail if has_core_fields(detail) else None
+
     # ─── 픽코마 (SSR) ───
     async def _scrape_piccoma(self, page: Page, url: str) -> Optional[Dict[str, Any]]:
-        await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+        await self.rates.goto(page, url, wait_until='domcontentloaded', timeout=20000)
 
         detail = await page.evaluate('''
             () => {
@@ -155,7 +246,7 @@ class DetailScraper:
 
     # ─── 라인망가 (CSR - Playwright 필수) ───
     async def _scrape_linemanga(self, page: Page, url: str) -> Optional[Dict[str, Any]]:
-        await page.goto(url, wait_until='networkidle', timeout=30000)
+        await self.rates.goto(page, url, wait_until='networkidle', timeout=30000)
         await page.wait_for_timeout(2000)  # JS 렌더링 대기
 
         detail = await page.evaluate('''
@@ -278,7 +369,7 @@ class DetailScraper:
 
     # ─── 메챠코믹 (SSR) ───
     async def _scrape_mechacomic(self, page: Page, url: str) -> Optional[Dict[str, Any]]:
-        await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+        await self.rates.goto(page, url, wait_until='domcontentloaded', timeout=20000)
         await page.wait_for_timeout(1000)
 
         detail = await page.evaluate('''
@@ -335,7 +426,7 @@ class DetailScraper:
 
     # ─── 코믹시모아 (Playwright, TLS 우회) ───
     async def _scrape_cmoa(self, page: Page, url: str) -> Optional[Dict[str, Any]]:
-        await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+        await self.rates.goto(page, url, wait_until='domcontentloaded', timeout=20000)
         await page.wait_for_timeout(1000)
 
         detail = await page.evaluate('''
@@ -51,14 +51,22 @@ def main():
             print("\n")
             verify()
 
-            # 상세 페이지 메타데이터 스크래핑 (50개, 순차)
+            # 상세 페이지 메타데이터 스크래핑 (300개, 플랫폼별 동시)
             try:
                 from crawler.detail_scraper import run_detail_scraper
                 print("\n📋 상세 페이지 메타데이터 수집 시작...")
-                asyncio.run(run_detail_scraper(max_works=50))
+                asyncio.run(run_detail_scraper(max_works=300))
             except Exception as e:
                 print(f"⚠️  상세 스크래핑 중 오류 (무시): {e}")
 
+            # 썸네일 일괄 수집 (비동기, 신규/URL 변경 작품만)
+            try:
+                from crawler.thumbnail_fetcher import run_thumbnail_fetcher
+                print("\n🖼️  썸네일 일괄 수집 시작...")
+                asyncio.run(run_thumbnail_fetcher())
+            except Exception as e:
+                print(f"⚠️  썸네일 수집 중 오류 (무시): {e}")
+
             # title_kr 누락 작품 자동 번역
             try:
                 print("\n🔤 title_kr 누락 작품 자동 번역...")
@@ -1,5 +1,6 @@
 """
 외부 데이터 수집 진입점
+- 선택한 소스를 동시에 실행 (소스별 토큰 버킷/동시성 상한은 각 수집기 클래스에 선언)
 Usage:
     python crawler/main_external.py              # 기본 (anilist + mal + youtube)
     python crawler/main_external.py --anilist    # AniList만
@@ -13,18 +14,23 @@ Usage:
     python crawler/main_external.py --twitter    # Twitter/X만
     python crawler/main_external.py --all        # 전체 9개 소스
     python crawler/main_external.py --max-works 10  # 최대 10개 작품
+    python crawler/main_external.py --no-cache   # 검색 응답 캐시 무시 (항상 새로 요청)
 """
 import asyncio
 import argparse
+import importlib
 import logging
 import sys
+import time
 from pathlib import Path
+from typing import Dict
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from crawler.db import init_db
-from crawler.sns.external_db import get_works_for_external
+from crawler.sns.external_db import ExternalStore, get_works_for_external, record_external_attempts
+from crawler.sns.http_cache import get_response_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,66 +47,109 @@ ALL_SOURCES = [
 DEFAULT_SOURCES = ['anilist', 'mal', 'youtube']
 
 
-async def run_collectors(sources: list, max_works: int = 200,
-                         riverse_only: bool = False, asura_only: bool = False):
-    works = get_works_for_external(max_works, riverse_only=riverse_only, asura_only=asura_only)
-    if not works:
-        logger.info("수집 대상 작품 없음")
-        return
+# 소스 → (모듈, 클래스, 생성 인자) — 의존성 누락 소스만 건너뛰도록 지연 import
+COLLECTORS = {
+    'anilist': ('crawler.sns.anilist_collector', 'AnilistCollector', {}),
+    'mal': ('crawler.sns.jikan_collector', 'JikanCollector', {}),
+    'youtube': ('crawler.sns.youtube_collector', 'YoutubeCollector', {'max_titles': 80}),
+    'trends': ('crawler.sns.trends_collector', 'TrendsCollector', {}),
+    'reddit': ('crawler.sns.reddit_collector', 'RedditCollector', {}),
+    'bookwalker': ('crawler.sns.bookwalker_collector', 'BookWalkerCollector', {}),
+    'pixiv': ('crawler.sns.pixiv_collector', 'PixivCollector', {}),
+    'amazon': ('crawler.sns.amazon_collector', 'AmazonCollector', {}),
+    'twitter': ('crawler.sns.twitter_collector', 'TwitterCollector', {}),
+}
+
+
+def _load_collector(source: str):
+    module_name, class_name, kwargs = COLLECTORS[source]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)(**kwargs)
+
+
+async def _run_source(source: str, collector, works: list) -> Dict[str, int]:
+    try:
+        return await collector.collect_all(works)
+    except Exception as e:
+        logger.error(f"[{source}] 수집 실패: {e}")
+        return {
+            'success': collector.success_count,
+            'failed': collector.fail_count + 1,
+            'skipped': collector.skip_count,
+        }
+    finally:
+        # 실제로 조회를 마친 타이틀(매칭 실패 포함)만 시도 날짜를 남겨 신선도 주기만큼 뒤로 보냄
+        # (한도 초과로 건너뛴 타이틀, 오류 난 타이틀은 다음 실행에서 다시 대상)
+        if not collector.match_all_candidates:
+            record_external_attempts(collector.source_name, sorted(collector.attempted))
 
-    logger.info(f"외부 데이터 수집 대상: {len(works)}개 작품")
 
+async def run_collectors(sources: list, max_works: int = 200,
+                         riverse_only: bool = False, asura_only: bool = False,
+                         use_cache: bool = True) -> Dict[str, Dict[str, int]]:
+    """
+    선택한 소스를 동시에 실행 (소스끼리는 독립 서비스)
+    각 소스의 속도/동시성은 수집기 클래스의 토큰 버킷 설정이 제어
+    소스별 대상은 수집기 클래스의 freshness_days 기준으로 최근 시도분(매칭 실패 포함)을 뺀 오래된 순
+    (match_all_candidates 수집기는 신선도/상한 없이 전체 후보)
+    use_cache=False면 검색 응답 캐시(crawler/sns/http_cache.py)를 읽지도 쓰지도 않음
+
+    Returns:
+        {source: {'success', 'failed', 'skipped'}}
+    """
+    cache = get_response_cache()
+    cache.enabled = use_cache
+
+    collectors = {}
     for source in sources:
         try:
-            if source == 'anilist':
-                from crawler.sns.anilist_collector import AnilistCollector
-                collector = AnilistCollector()
-                await collector.collect_all(works)
-
-            elif source == 'mal':
-                from crawler.sns.jikan_collector import JikanCollector
-                collector = JikanCollector()
-                await collector.collect_all(works)
-
-            elif source == 'youtube':
-                from crawler.sns.youtube_collector import YoutubeCollector
-                collector = YoutubeCollector(max_titles=80)
-                await collector.collect_all(works)
-
-            elif source == 'trends':
-                from crawler.sns.trends_collector import TrendsCollector
-                collector = TrendsCollector()
-                await collector.collect_all(works)
-
-            elif source == 'reddit':
-                from crawler.sns.reddit_collector import RedditCollector
-                collector = RedditCollector()
-                await collector.collect_all(works)
-
-            elif source == 'bookwalker':
-                from crawler.sns.bookwalker_collector import BookWalkerCollector
-                collector = BookWalkerCollector()
-                await collector.collect_all(works)
-
-            elif source == 'pixiv':
-                from crawler.sns.pixiv_collector import PixivCollector
-                collector = PixivCollector()
-                await collector.collect_all(works)
-
-            elif source == 'amazon':
-                from crawler.sns.amazon_collector import AmazonCollector
-                collector = AmazonCollector()
-                await collector.collect_all(works)
-
-            elif source == 'twitter':
-                from crawler.sns.twitter_collector import TwitterCollector
-                collector = TwitterCollector()
-                await collector.collect_all(works)
-
+            collectors[source] = _load_collector(source)
         except ImportError as e:
             logger.warning(f"[{source}] 의존성 누락: {e}")
         except Exception as e:
-            logger.error(f"[{source}] 수집 실패: {e}")
+            logger.error(f"[{source}] 초기화 실패: {e}")
+
+    # 소스별 대상: 신선도 기간 안에 시도한 타이틀 제외, 오래된 순 (쿼리 1회)
+    targets = get_works_for_external(
+        {c.source_name: None if c.match_all_candidates else c.freshness_days
+         for c in collectors.values()},
+        max_works, riverse_only=riverse_only, asura_only=asura_only
+    )
+    for source, collector in list(collectors.items()):
+        works = targets.get(collector.source_name, [])
+        freshness = '전체 후보' if collector.match_all_candidates else f'신선도 {collector.freshness_days}일'
+        logger.info(f"  [{source}] 대상 {len(works)}개 ({freshness})")
+        if not works:
+            del collectors[source]
+    if not collectors:
+        logger.info("수집 대상 작품 없음 (모든 소스 최신)")
+        return {}
+
+    start = time.monotonic()
+    # 실행 1회 저장소: external_ids 일괄 적재 + 쓰기 배치 (종료 시 남은 버퍼 flush)
+    with ExternalStore() as store:
+        results = await asyncio.gather(*(
+            _run_source(source, collector, targets[collector.source_name])
+            for source, collector in collectors.items()
+        ))
+    summary = dict(zip(collectors, results))
+
+    # 수집기는 버퍼에 넣은 시점에 성공으로 세므로, 저장에 끝내 실패한 타이틀은 실패로 옮김
+    for source, collector in collectors.items():
+        lost = store.lost_count(collector.source_name)
+        if lost:
+            r = summary[source]
+            r['success'] = max(0, r['success'] - lost)
+            r['failed'] += lost
+            logger.warning(f"  [{source}] 저장 실패로 {lost}개 성공 → 실패 처리")
+
+    logger.info(f"외부 데이터 수집 결과 ({time.monotonic() - start:.0f}s)")
+    for source, r in summary.items():
+        logger.info(f"  [{source}] 성공 {r['success']}, 실패 {r['failed']}, 스킵 {r['skipped']}")
+    logger.info(f"  🗄️ 외부 데이터 저장: {store.rows_written}행 / flush {store.flushes}회")
+    cache.log_stats(logger)
+    cache.close()
+    return summary
 
 
 def main():
@@ -118,6 +167,7 @@ def main():
     parser.add_argument('--max-works', type=int, default=200, help='최대 작품 수')
     parser.add_argument('--riverse', action='store_true', help='리버스 작품만')
     parser.add_argument('--asura', action='store_true', help='Asura 작품만')
+    parser.add_argument('--no-cache', action='store_true', help='검색 응답 캐시 사용 안 함')
     args = parser.parse_args()
 
     try:
@@ -138,7 +188,8 @@ def main():
         print(f"\n🌐 외부 데이터 수집 시작: {', '.join(sources)} ({filter_mode})\n")
         asyncio.run(run_collectors(
             sources, args.max_works,
-            riverse_only=args.riverse, asura_only=args.asura
+            riverse_only=args.riverse, asura_only=args.asura,
+            use_cache=not args.no_cache
         ))
         print("\n✅ 외부 데이터 수집 완료")
         sys.exit(0)
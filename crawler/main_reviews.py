@@ -4,6 +4,7 @@
 - 최근 7일 랭킹 등장 작품 대상
 - 3개 플랫폼 동시 실행 (라인망가, 메챠코믹, 코믹시모아)
 - 픽코마 제외 (하트수는 detail_scraper에서 수집)
+- 기본은 증분 수집 (작품별 최신 저장 리뷰까지만), --full이면 전체 재수집
 """
 
 import asyncio
@@ -23,16 +24,19 @@ def main():
     parser = argparse.ArgumentParser(description='리뷰/코멘트 수집')
     parser.add_argument('--riverse', action='store_true', help='리버스 작품만 수집')
     parser.add_argument('--max-works', type=int, default=0, help='최대 작품 수 (0=무제한)')
+    parser.add_argument('--full', action='store_true', help='기준점 무시하고 전체 리뷰 재수집')
     args = parser.parse_args()
 
     try:
         init_db()
-        mode = "리버스 전용" if args.riverse else "전체"
+        mode = "리버스 전용" if args.riverse else "전체 작품"
+        mode += ", 전체 재수집" if args.full else ", 증분"
         print(f"\n📝 리뷰/코멘트 수집 시작 ({mode}, 3개 플랫폼 동시 실행)\n")
         asyncio.run(run_review_crawler(
             max_works=args.max_works,
             concurrency=1,
-            riverse_only=args.riverse
+            riverse_only=args.riverse,
+            full=args.full
         ))
         print("\n✅ 리뷰 수집 완료")
         sys.exit(0)
@@ -38,6 +38,7 @@ class CrawlerOrchestrator:
         """Initialize orchestrator."""
         self.date = datetime.now().strftime('%Y-%m-%d')
         self.logger = logger
+        self.progress: Dict[str, tuple] = {}  # platform_id → (완료, 전체)
 
     async def run_all(self) -> Dict[str, AgentResult]:
         """
@@ -131,7 +132,10 @@ class CrawlerOrchestrator:
         # Print detailed results
         for platform_id, result in results_dict.items():
             if result.success:
-                self.logger.info(f"   ✅ {platform_id}: {result.count}개 작품")
+                self.logger.info(
+                    f"   ✅ {platform_id}: {result.count}개 작품 "
+                    f"(쓰기 {result.changed} / 생략 {result.skipped})"
+                )
             else:
                 self.logger.info(f"   ❌ {platform_id}: {result.error}")
 
@@ -139,7 +143,10 @@ class CrawlerOrchestrator:
         total_items = sum(r.count for r in results_dict.values() if r.success)
         self.logger.info("")
         self.logger.info(f"📚 총 {total_items}개 작품 수집")
-        self.logger.info(f"💾 데이터 저장: Supabase PostgreSQL")
+        total_changed = sum(r.changed for r in results_dict.values() if r.success)
+        total_skipped = sum(r.skipped for r in results_dict.values() if r.success)
+        self.logger.info(f"💾 데이터 저장: Supabase PostgreSQL "
+                         f"(쓰기 {total_changed}행 / 변경 없음 생략 {total_skipped}행)")
         self.logger.info(f"📦 백업: data/backup/{self.date}/")
         self.logger.info("=" * 70)
 
@@ -148,12 +155,19 @@ class CrawlerOrchestrator:
 
         return results_dict
 
+    def _on_agent_progress(self, platform_id: str, done: int, total: int,
+                           label: str, count: int):
+        """워커 스레드 에이전트 진행 보고 (이벤트 루프 스레드에서 호출)"""
+        self.progress[platform_id] = (done, total)
+        self.logger.info(f"📡 {platform_id} 진행: {done}/{total} [{label}] {count}개")
+
     async def _run_agent_with_browser(self, agent) -> AgentResult:
         """각 에이전트를 자체 브라우저로 실행 (격리)"""
         from crawler.agents.linemanga_app_agent import LinemangaAppAgent
 
-        # ADB 에이전트는 브라우저 불필요 — 더미 전달
+        # ADB 에이전트는 브라우저 불필요 — 더미 전달 (내부적으로 워커 스레드 실행)
         if isinstance(agent, LinemangaAppAgent):
+            agent.progress_callback = self._on_agent_progress
             return await agent.execute(None)
 
         async with async_playwright() as p:
@@ -0,0 +1,208 @@
+"""
+호스트별 적응형 요청 속도 제어 (AIMD)
+
+고정 딜레이/고정 동시성 대신 호스트마다 관측값으로 조정한다:
+- 정상 응답이 일정 횟수 쌓이면 → 동시성 +1, 요청 간격 -DELAY_STEP (가산 증가)
+- 429/403/503, 타임아웃, 상태 없이 끝난 예외 → 동시성 절반, 간격 2배 (곱셈 감소)
+- 응답 지연이 target_latency 초과 → 간격만 1.5배 (완만한 감속)
+모든 값은 RateLimits의 하한/상한 안에서만 움직이고, 바뀔 때마다 로그로 남긴다.
+
+사용 예:
+    pool = RateControllerPool(initial_concurrency=1, initial_delay=3.0)
+    resp = await pool.goto(page, url, wait_until='domcontentloaded', timeout=20000)
+    ...
+    pool.log_summary(logger)
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger('crawler.rate_controller')
+
+THROTTLE_STATUSES = {403, 429, 503}
+SUCCESS_WINDOW = 5   # 동시성 1당 이 횟수만큼 연속 정상이면 한 단계 가속
+DELAY_STEP = 0.25    # 가속 시 간격 감소량 (초)
+
+
+@dataclass
+class RateLimits:
+    """호스트별 하한/상한"""
+    min_concurrency: int = 1
+    max_concurrency: int = 3
+    min_delay: float = 0.5
+    max_delay: float = 30.0
+    target_latency: float = 8.0  # 이보다 느린 응답은 혼잡 신호
+    initial_delay: Optional[float] = None  # 없으면 풀의 initial_delay
+
+
+# 호스트별 상한/하한 (없으면 RateLimits 기본값)
+HOST_LIMITS: Dict[str, RateLimits] = {
+    # 코멘트 JSON API — 가벼워서 동시 요청 여유 있음
+    'manga.line.me': RateLimits(max_concurrency=4, min_delay=0.2, target_latency=5.0,
+                                initial_delay=0.3),
+}
+
+
+@dataclass
+class _Request:
+    """slot() 안에서 호출 측이 결과를 기록하는 객체"""
+    status: Optional[int] = None
+
+
+class HostRateController:
+    """호스트 1개의 동시성/간격 상태"""
+
+    def __init__(self, host: str, limits: RateLimits,
+                 initial_concurrency: int = 1, initial_delay: float = 3.0):
+        self.host = host
+        self.limits = limits
+        self.concurrency = min(max(initial_concurrency, limits.min_concurrency), limits.max_concurrency)
+        if limits.initial_delay is not None:
+            initial_delay = limits.initial_delay
+        self.delay = min(max(initial_delay, limits.min_delay), limits.max_delay)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self._pace_lock = asyncio.Lock()
+        self._next_start = 0.0
+        self._ok_streak = 0
+        self._last_backoff = 0.0
+        # 통계
+        self.requests = 0
+        self.throttled = 0
+        self.total_latency = 0.0
+        self.peak_concurrency = self.concurrency
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        요청 1건 슬롯: 동시성 상한 대기 → 간격 대기 → 실행 → 결과 반영
+
+        본문에서 req.status에 HTTP 상태를 넣으면 조정에 사용된다.
+        타임아웃 예외, req.status 없이 빠져나온 예외는 스로틀 신호로 처리하고 그대로 다시 던진다
+        (장애 중에 예외를 정상으로 세어 가속하지 않도록).
+        """
+        async with self._cond:
+            while self._in_flight >= self.concurrency:
+                await self._cond.wait()
+            self._in_flight += 1
+
+        async with self._pace_lock:
+            wait = self._next_start - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start = time.monotonic() + self.delay
+
+        req = _Request()
+        start = time.monotonic()
+        timed_out = False
+        failed = False
+        try:
+            yield req
+        except Exception as e:
+            timed_out = isinstance(e, asyncio.TimeoutError) or 'Timeout' in type(e).__name__
+            failed = True
+            raise
+        finally:
+            self._observe(time.monotonic() - start, req.status, timed_out, failed)
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _observe(self, latency: float, status: Optional[int], timed_out: bool,
+                 failed: bool = False):
+        self.requests += 1
+        self.total_latency += latency
+        lim = self.limits
+
+        errored = failed and status is None
+        if timed_out or errored or status in THROTTLE_STATUSES:
+            self.throttled += 1
+            self._ok_streak = 0
+            # 이미 날아간 요청들의 실패가 몰려와도 한 간격 안에서는 한 번만 감속
+            now = time.monotonic()
+            if now - self._last_backoff < self.delay:
+                return
+            self._last_backoff = now
+            self._set(max(lim.min_concurrency, self.concurrency // 2),
+                      min(lim.max_delay, self.delay * 2),
+                      'timeout' if timed_out else ('error' if errored else f'HTTP {status}'))
+        elif latency > lim.target_latency:
+            self._ok_streak = 0
+            self._set(self.concurrency, min(lim.max_delay, self.delay * 1.5),
+                      f'지연 {latency:.1f}s')
+        elif failed:
+            self._ok_streak = 0
+        elif status is None or status < 400:
+            self._ok_streak += 1
+            if self._ok_streak >= SUCCESS_WINDOW * self.concurrency:
+                self._ok_streak = 0
+                self._set(min(lim.max_concurrency, self.concurrency + 1),
+                          max(lim.min_delay, self.delay - DELAY_STEP),
+                          f'정상 {SUCCESS_WINDOW * self.concurrency}회')
+
+    def _set(self, concurrency: int, delay: float, reason: str):
+        if concurrency == self.concurrency and abs(delay - self.delay) < 1e-6:
+            return
+        self.concurrency = concurrency
+        self.delay = delay
+        self.peak_concurrency = max(self.peak_concurrency, concurrency)
+        logger.info(f"  ⚙️ [{self.host}] 동시 {concurrency} / 간격 {delay:.2f}s ← {reason}")
+
+    def summary(self) -> str:
+        avg = self.total_latency / self.requests if self.requests else 0.0
+        return (f"{self.host}: 요청 {self.requests} (스로틀 {self.throttled}), "
+                f"평균 응답 {avg:.1f}s, 최종 동시 {self.concurrency} / 간격 {self.delay:.2f}s "
+                f"(최대 동시 {self.peak_concurrency})")
+
+
+class RateControllerPool:
+    """
+    실행 1회(크롤러 인스턴스)당 호스트별 컨트롤러 모음
+
+    asyncio 객체를 쓰므로 이벤트 루프를 넘나들며 재사용하지 않는다.
+    """
+
+    def __init__(self, initial_concurrency: int = 1, initial_delay: float = 3.0,
+                 limits: Optional[Dict[str, RateLimits]] = None):
+        self.initial_concurrency = initial_concurrency
+        self.initial_delay = initial_delay
+        self.limits = dict(HOST_LIMITS, **(limits or {}))
+        self._controllers: Dict[str, HostRateController] = {}
+
+    def limits_for(self, host: str) -> RateLimits:
+        return self.limits.get(host) or RateLimits()
+
+    def get(self, host: str) -> HostRateController:
+        if host not in self._controllers:
+            self._controllers[host] = HostRateController(
+                host, self.limits_for(host), self.initial_concurrency, self.initial_delay
+            )
+        return self._controllers[host]
+
+    def for_url(self, url: str) -> HostRateController:
+        return self.get(urlsplit(url).hostname or '')
+
+    async def goto(self, page, url: str, **kwargs):
+        """page.goto를 호스트 컨트롤러 슬롯 안에서 실행 (응답 상태 자동 기록)"""
+        async with self.for_url(url).slot() as req:
+            resp = await page.goto(url, **kwargs)
+            req.status = resp.status if resp else None
+        return resp
+
+    async def get_text(self, session, url: str, **kwargs) -> Optional[str]:
+        """aiohttp GET을 호스트 컨트롤러 슬롯 안에서 실행 → 200이면 본문, 아니면 None"""
+        async with self.for_url(url).slot() as req:
+            async with session.get(url, **kwargs) as resp:
+                req.status = resp.status
+                if resp.status != 200:
+                    return None
+                return await resp.text()
+
+    def log_summary(self, log: logging.Logger = logger):
+        for ctl in self._controllers.values():
+            log.info(f"  📈 속도 제어 {ctl.summary()}")
@@ -0,0 +1,259 @@
+"""
+작품 상세 메타데이터 갱신 스케줄러 (가치 기반)
+
+고정 주기(7일/14일) 대신 작품마다 "지금 다시 긁을 가치"를 점수로 매기고,
+실행당 고정 예산(작품 수)을 점수 높은 순으로 채운다.
+
+점수 = 가치 × 적중률 × 경과 가중치
+- 가치: 최고 순위(상위일수록↑), 순위 변동성(14일 표준편차/평균), 최근 랭킹 등장,
+        하트/평점/리뷰수 변화량(직전 두 갱신 비교), 리버스 작품 가산
+- 적중률: 과거 갱신에서 실제로 필드가 바뀐 비율 (베타(1,1) 평활)
+- 경과 가중치: 마지막 갱신 후 경과일 / STALENESS_DAYS (상한 MAX_STALENESS)
+- 한 번도 수집 안 된 작품은 최우선
+
+갱신 결과는 detail_refresh_log에 (바뀐 필드, 선택 점수, 수치 스냅샷)으로 남아
+적중률 계산과 정책 튜닝(report_hit_rates)에 쓰인다.
+(테이블 생성: scripts/migrate_detail_refresh_log.py — 없으면 적중률/변화량 없이 동작)
+"""
+
+import math
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import psycopg2
+import psycopg2.errors
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# ===== 정책 파라미터 =====
+RANK_WINDOW_DAYS = 14
+MIN_INTERVAL_HOURS = 20     # 이보다 최근에 갱신한 작품은 후보 제외
+STALENESS_DAYS = 7.0
+MAX_STALENESS = 4.0
+NEVER_SCRAPED_BONUS = 10.0
+
+W_RANK = 1.0
+W_VOLATILITY = 0.8
+W_RECENCY = 0.6
+W_MOMENTUM = 0.8
+W_RIVERSE = 1.0
+BASE_VALUE = 0.05           # 롱테일도 오래 묵으면 언젠가 뽑히도록
+
+# 실행 중 갱신 결과 누적 {platform: {'refreshed': n, 'hits': n}}
+# (save_work_detail이 asyncio.to_thread 워커에서 동시에 호출되므로 락으로 보호)
+_run_stats: Dict[str, Dict[str, int]] = {}
+_run_stats_lock = threading.Lock()
+
+
+@dataclass
+class WorkFeatures:
+    platform: str
+    title: str
+    url: str
+    is_riverse: bool = False
+    days_since_seen: Optional[float] = None
+    days_since_refresh: Optional[float] = None   # None = 한 번도 수집 안 됨
+    best_rank: Optional[int] = None
+    rank_std: Optional[float] = None
+    avg_rank: Optional[float] = None
+    refreshes: int = 0
+    hits: int = 0
+    momentum: float = 0.0
+
+
+def _rel_change(new, old) -> float:
+    if new is None or old is None:
+        return 0.0
+    return abs(float(new) - float(old)) / max(abs(float(old)), 1.0)
+
+
+def score_work(f: WorkFeatures) -> float:
+    """작품 1개의 갱신 가치 점수 (높을수록 먼저)"""
+    rank_signal = 1.0 / (1.0 + math.log2(f.best_rank)) if f.best_rank else 0.0
+    volatility = min((f.rank_std or 0.0) / max(f.avg_rank or 1.0, 1.0), 1.0)
+    recency = math.exp(-f.days_since_seen / 7.0) if f.days_since_seen is not None else 0.0
+    value = (BASE_VALUE
+             + W_RANK * rank_signal
+             + W_VOLATILITY * volatility
+             + W_RECENCY * recency
+             + W_MOMENTUM * min(f.momentum, 1.0)
+             + (W_RIVERSE if f.is_riverse else 0.0))
+
+    if f.days_since_refresh is None:
+        return NEVER_SCRAPED_BONUS + value
+
+    hit_rate = (f.hits + 1) / (f.refreshes + 2)
+    staleness = min(f.days_since_refresh / STALENESS_DAYS, MAX_STALENESS)
+    return value * hit_rate * staleness
+
+
+def _has_log_table(cursor) -> bool:
+    cursor.execute("SELECT to_regclass('detail_refresh_log') IS NOT NULL")
+    return cursor.fetchone()[0]
+
+
+def load_features(cursor, platforms: Sequence[str]) -> List[WorkFeatures]:
+    """후보 작품 특징 일괄 조회 (쿼리 1회)"""
+    has_log = _has_log_table(cursor)
+    log_cols = '''
+        lg.refreshes, lg.hits,
+        cur.hearts, prev.hearts, cur.rating, prev.rating, cur.review_count, prev.review_count
+    ''' if has_log else 'NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL'
+    log_joins = '''
+        LEFT JOIN (
+            SELECT platform, title, COUNT(*) AS refreshes,
+                   COUNT(*) FILTER (WHERE cardinality(changed_fields) > 0) AS hits
+            FROM detail_refresh_log
+            WHERE refreshed_at >= NOW() - INTERVAL '90 days'
+            GROUP BY platform, title
+        ) lg ON lg.platform = w.platform AND lg.title = w.title
+        LEFT JOIN LATERAL (
+            SELECT hearts, rating, review_count FROM detail_refresh_log l
+            WHERE l.platform = w.platform AND l.title = w.title
+            ORDER BY refreshed_at DESC LIMIT 1
+        ) cur ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT hearts, rating, review_count FROM detail_refresh_log l
+            WHERE l.platform = w.platform AND l.title = w.title
+            ORDER BY refreshed_at DESC OFFSET 1 LIMIT 1
+        ) prev ON TRUE
+    ''' if has_log else ''
+
+    cursor.execute(f'''
+        WITH rk AS (
+            SELECT platform, title, MIN(rank) AS best_rank,
+                   STDDEV_POP(rank) AS rank_std, AVG(rank) AS avg_rank
+            FROM rankings
+            WHERE date::date >= CURRENT_DATE - %(window)s
+              AND sub_category = ''
+              AND platform IN %(platforms)s
+            GROUP BY platform, title
+        )
+        SELECT w.platform, w.title, w.url, COALESCE(w.is_riverse, FALSE),
+               CURRENT_DATE - w.last_seen_date::date,
+               EXTRACT(EPOCH FROM NOW() - w.detail_scraped_at) / 86400.0,
+               rk.best_rank, rk.rank_std, rk.avg_rank,
+               {log_cols}
+        FROM works w
+        LEFT JOIN rk ON rk.platform = w.platform AND rk.title = w.title
+        {log_joins}
+        WHERE w.platform IN %(platforms)s
+          AND w.url IS NOT NULL AND w.url != ''
+          AND (w.detail_scraped_at IS NULL
+               OR w.detail_scraped_at < NOW() - make_interval(hours => %(min_hours)s))
+    ''', {'window': RANK_WINDOW_DAYS, 'platforms': tuple(platforms),
+          'min_hours': MIN_INTERVAL_HOURS})
+
+    features = []
+    for (platform, title, url, riverse, seen_days, refresh_days, best_rank, rank_std, avg_rank,
+         refreshes, hits, h_cur, h_prev, r_cur, r_prev, rc_cur, rc_prev) in cursor.fetchall():
+        features.append(WorkFeatures(
+            platform=platform, title=title, url=url, is_riverse=bool(riverse),
+            days_since_seen=float(seen_days) if seen_days is not None else None,
+            days_since_refresh=float(refresh_days) if refresh_days is not None else None,
+            best_rank=best_rank,
+            rank_std=float(rank_std) if rank_std is not None else None,
+            avg_rank=float(avg_rank) if avg_rank is not None else None,
+            refreshes=refreshes or 0, hits=hits or 0,
+            momentum=(_rel_change(h_cur, h_prev) + _rel_change(r_cur, r_prev)
+                      + _rel_change(rc_cur, rc_prev)),
+        ))
+    return features
+
+
+def plan_refreshes(budget: int, platforms: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    예산만큼 갱신할 작품 선택 (점수 내림차순)
+
+    Returns:
+        [{platform, title, url, score}, ...]
+    """
+    from crawler.db import get_db_connection
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    features = load_features(cursor, platforms)
+    conn.close()
+
+    scored = sorted(((score_work(f), f) for f in features), key=lambda x: -x[0])
+    return [
+        {'platform': f.platform, 'title': f.title, 'url': f.url, 'score': round(s, 4)}
+        for s, f in scored[:budget]
+    ]
+
+
+def record_refresh(cursor, platform: str, title: str, changed_fields: List[str],
+                   detail: Dict[str, Any], score: Optional[float] = None):
+    """
+    갱신 1건 기록 (save_work_detail의 트랜잭션 안에서 호출)
+    테이블이 없으면 세이브포인트로 되돌리고 통계만 누적
+    """
+    with _run_stats_lock:
+        stats = _run_stats.setdefault(platform, {'refreshed': 0, 'hits': 0})
+        stats['refreshed'] += 1
+        stats['hits'] += 1 if changed_fields else 0
+
+    cursor.execute('SAVEPOINT refresh_log')
+    try:
+        cursor.execute('''
+            INSERT INTO detail_refresh_log
+                (platform, title, refreshed_at, changed_fields, score, hearts, rating, review_count)
+            VALUES (%s, %s, NOW(), %s, %s, %s, %s, %s)
+        ''', (platform, title, changed_fields, score,
+              detail.get('hearts'), detail.get('rating'), detail.get('review_count')))
+        cursor.execute('RELEASE SAVEPOINT refresh_log')
+    except psycopg2.errors.UndefinedTable:
+        cursor.execute('ROLLBACK TO SAVEPOINT refresh_log')
+
+
+def pop_refresh_stats() -> Dict[str, Dict[str, int]]:
+    """이번 실행의 플랫폼별 갱신/적중 수 반환 후 초기화"""
+    global _run_stats
+    with _run_stats_lock:
+        stats, _run_stats = _run_stats, {}
+    return stats
+
+
+def report_hit_rates(days: int = 30):
+    """점수 구간별 적중률 출력 (정책 튜닝용)"""
+    from crawler.db import get_db_connection
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT platform,
+               CASE WHEN score IS NULL THEN '(수동)'
+                    WHEN score >= %(never)s THEN '신규'
+                    WHEN score >= 1 THEN '>=1'
+                    WHEN score >= 0.3 THEN '0.3-1'
+                    ELSE '<0.3' END AS bucket,
+               COUNT(*), COUNT(*) FILTER (WHERE cardinality(changed_fields) > 0)
+        FROM detail_refresh_log
+        WHERE refreshed_at >= NOW() - make_interval(days => %(days)s)
+        GROUP BY 1, 2 ORDER BY 1, 2
+    ''', {'never': NEVER_SCRAPED_BONUS, 'days': days})
+    print(f"📊 최근 {days}일 상세 갱신 적중률 (플랫폼 / 점수 구간)")
+    for platform, bucket, n, hits in cursor.fetchall():
+        print(f"  {platform:12s} {bucket:6s} {hits:5d}/{n:5d} ({hits / n * 100:.0f}%)")
+    conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='상세 갱신 스케줄러 계획/적중률 확인')
+    parser.add_argument('--budget', type=int, default=30)
+    parser.add_argument('--report', action='store_true', help='점수 구간별 적중률 출력')
+    args = parser.parse_args()
+
+    if args.report:
+        report_hit_rates()
+    else:
+        plan = plan_refreshes(args.budget, ('piccoma', 'linemanga', 'mechacomic', 'cmoa', 'asura'))
+        print(f"🗓️  {date.today()} 갱신 계획 ({len(plan)}개)")
+        for w in plan:
+            print(f"  {w['score']:8.3f}  {w['platform']:12s} {w['title'][:40]}")
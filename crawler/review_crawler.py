@@ -7,14 +7,17 @@
 - 메챠코믹/코믹시모아: 페이지 제한 제거 (전체 리뷰 수집)
 - 수집 후 코멘트 수 매칭 검증 로깅
 - 픽코마: 제외 (하트수는 detail_scraper에서 수집)
+- 증분 수집: 작품별 기준점(이미 저장된 최신 리뷰)에 닿으면 페이징 중단 (--full이면 전체)
+  (기준점은 저장된 MAX(reviewed_at)이므로 도중에 끊긴 수집은 저장하지 않음 — 빈 구간 방지)
 """
 
 import asyncio
 import logging
 import re
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from playwright.async_api import Browser, Page
 
 import sys
@@ -22,28 +25,78 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from crawler.db import get_works_for_review, save_reviews
+from crawler.db import get_review_watermarks, get_works_for_review, save_reviews
+from crawler.rate_controller import RateControllerPool
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('crawler.review_crawler')
 
+LINEMANGA_COMMENT_ROWS = 20
+LINEMANGA_FANOUT = 8  # 코멘트 수를 알 때 한 웨이브에 요청할 페이지 수
+
+# 플랫폼별 리뷰 페이지 호스트 (작품 동시 처리 수 = 이 호스트의 동시성 상한)
+PLATFORM_HOSTS = {
+    'linemanga': 'manga.line.me',
+    'mechacomic': 'mechacomic.jp',
+    'cmoa': 'www.cmoa.jp',
+}
+
+
+def _parse_reviewed_at(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@dataclass
+class ReviewWatermark:
+    """
+    작품별 증분 수집 기준점 — DB에 저장된 가장 최신 리뷰의 시각과 그 시각의 작성자들
+
+    최신순 페이지에서 기준점 이하(같은 시각이면 이미 저장된 작성자)인 리뷰가 나오면
+    그 뒤는 모두 수집된 구간으로 보고 페이징을 멈춘다.
+    """
+    reviewed_at: datetime
+    reviewers: Set[str] = field(default_factory=set)
+
+    def is_known(self, review: Dict[str, Any]) -> bool:
+        ts = _parse_reviewed_at(review.get('reviewed_at'))
+        if ts is None:
+            return False  # 시각 없는 리뷰는 판단 불가 → 신규로 취급
+        if ts < self.reviewed_at:
+            return True
+        return ts == self.reviewed_at and review.get('reviewer_name', '') in self.reviewers
+
+    def split(self, reviews: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+        """페이지 리뷰 → (신규 리뷰, 기준점 도달 여부)"""
+        fresh = [r for r in reviews if not self.is_known(r)]
+        return fresh, len(fresh) < len(reviews)
+
 
 class ReviewCrawler:
     """리뷰/코멘트 수집 크롤러 (플랫폼 동시 실행)"""
 
-    def __init__(self, max_works: int = 0, delay_seconds: float = 3.0, concurrency: int = 1):
+    def __init__(self, max_works: int = 0, delay_seconds: float = 3.0, concurrency: int = 1,
+                 full: bool = False):
         """
         Args:
             max_works: 최대 작품 수 (0 = 무제한)
-            delay_seconds: 작품 간 딜레이 (초)
-            concurrency: 플랫폼별 동시 페이지 수 (기본 1 = 순차)
+            delay_seconds: 호스트별 요청 간격 초기값 (초, 이후 응답에 따라 자동 조정)
+            concurrency: 호스트별 동시 요청 수 초기값 (기본 1, 이후 자동 조정)
+            full: True면 기준점 무시하고 전체 리뷰 재수집
         """
         self.max_works = max_works
         self.delay_seconds = delay_seconds
         self.concurrency = concurrency
+        self.full = full
+        self.rates: Optional[RateControllerPool] = None
 
     async def run(self, browser: Browser, riverse_only: bool = False):
         """메인: 3개 플랫폼 병렬 실행"""
+        self.rates = RateControllerPool(self.concurrency, self.delay_seconds)
         limit = self.max_works if self.max_works > 0 else 10000
         works = get_works_for_review(limit, riverse_only=riverse_only)
         if not works:
@@ -55,7 +108,8 @@ class ReviewCrawler:
         for w in works:
             by_platform[w['platform']].append(w)
 
-        logger.info(f"리뷰 수집 시작: {len(works)}개 작품 ({len(by_platform)}개 플랫폼 동시 실행)")
+        mode = "전체" if self.full else "증분"
+        logger.info(f"리뷰 수집 시작 ({mode}): {len(works)}개 작품 ({len(by_platform)}개 플랫폼 동시 실행)")
         for p, pw in sorted(by_platform.items()):
             logger.info(f"  {p}: {len(pw)}개")
 
@@ -77,6 +131,7 @@ class ReviewCrawler:
             total_failed += r[1]
 
         logger.info(f"리뷰 수집 완료: {total_reviews}개 리뷰 저장, {total_failed}개 실패")
+        self.rates.log_summary(logger)
 
     async def _run_platform(
         self, browser: Browser, platform: str, works: List[Dict]
@@ -87,7 +142,16 @@ class ReviewCrawler:
             ignore_https_errors=(platform == 'cmoa')
         )
 
-        sem = asyncio.Semaphore(self.concurrency)
+        watermarks: Dict[str, ReviewWatermark] = {}
+        if not self.full:
+            for title, wm in get_review_watermarks(platform).items():
+                ts = _parse_reviewed_at(wm['reviewed_at'])
+                if ts:
+                    watermarks[title] = ReviewWatermark(ts, set(wm['reviewers']))
+
+        # 작품 단위 동시 처리는 호스트 상한까지 열어 두고, 실제 요청 속도는 컨트롤러가 조절
+        host = PLATFORM_HOSTS.get(platform, '')
+        sem = asyncio.Semaphore(self.rates.limits_for(host).max_concurrency)
         review_counts = []
         fail_count = 0
 
@@ -96,8 +160,21 @@ class ReviewCrawler:
             async with sem:
                 page = await ctx.new_page()
                 try:
-                    reviews = await self._collect_reviews(page, platform, work['url'])
-                    if reviews:
+                    reviews, complete = await self._collect_reviews(
+                        page, platform, work['url'], watermarks.get(work['title'])
+                    )
+                    if not complete:
+                        # 최신 페이지만 저장하면 기준점(MAX(reviewed_at))이 올라가
+                        # 못 받은 이전 리뷰가 다음 실행부터 영영 기준점 아래에 묻힌다
+                        # → 저장하지 않고 다음 실행에서 기존 기준점부터 다시 수집
+                        fail_count += 1
+                        review_counts.append(0)
+                        if i <= 10 or i % 50 == 0:
+                            logger.warning(
+                                f"  [{i}/{len(works)}] {platform}: "
+                                f"{work['title'][:25]}... 수집 중단 ({len(reviews)}개 미저장)"
+                            )
+                    elif reviews:
                         count = save_reviews(platform, work['title'], reviews)
                         review_counts.append(count)
                         if i <= 5 or i % 50 == 0 or i == len(works):
@@ -116,32 +193,44 @@ class ReviewCrawler:
                         )
                 finally:
                     await page.close()
-                    await asyncio.sleep(self.delay_seconds)
 
         tasks = [process(i, w) for i, w in enumerate(works, 1)]
         await asyncio.gather(*tasks, return_exceptions=True)
         await ctx.close()
 
         total = sum(review_counts)
-        logger.info(f"  [{platform}] 완료: {total}개 리뷰, {fail_count}개 실패")
+        logger.info(
+            f"  [{platform}] 완료: {total}개 리뷰, {fail_count}개 실패 "
+            f"(기준점 {len(watermarks)}/{len(works)}개 작품)"
+        )
         return total, fail_count
 
     async def _collect_reviews(
-        self, page: Page, platform: str, url: str
-    ) -> List[Dict[str, Any]]:
-        """플랫폼별 리뷰 수집 디스패치"""
+        self, page: Page, platform: str, url: str,
+        watermark: Optional[ReviewWatermark] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        플랫폼별 리뷰 수집 디스패치
+
+        watermark가 있으면 각 수집기는 최신순 페이지에서 기준점에 닿는 즉시 중단하고
+        기준점 이후(신규) 리뷰만 반환한다.
+
+        Returns:
+            (리뷰 목록, 완료 여부) — 요청 실패로 중간에 끊겼으면 완료 여부 False
+        """
         if platform == 'linemanga':
-            return await self._collect_linemanga(page, url)
+            return await self._collect_linemanga(page, url, watermark)
         elif platform == 'mechacomic':
-            return await self._collect_mechacomic(page, url)
+            return await self._collect_mechacomic(page, url, watermark)
         elif platform == 'cmoa':
-            return await self._collect_cmoa(page, url)
-        return []
+            return await self._collect_cmoa(page, url, watermark)
+        return [], True
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 라인망가 — 상품 페이지 → book_id 탐지 → API 전체 수집
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    async def _collect_linemanga(self, page: Page, url: str) -> List[Dict[str, Any]]:
+    async def _collect_linemanga(self, page: Page, url: str,
+                                 watermark: Optional[ReviewWatermark] = None) -> Tuple[List[Dict[str, Any]], bool]:
         """
         라인망가 코멘트 수집 (정확한 book_id 탐지 방식)
 
@@ -154,10 +243,10 @@ class ReviewCrawler:
 
         # ── 1단계: 상품 페이지 이동 ──
         try:
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await self.rates.goto(page, url, wait_until='domcontentloaded', timeout=30000)
             await page.wait_for_timeout(2000)
         except Exception:
-            return []
+            return [], False
 
         # ── 2단계: 코멘트 위젯의 data-conf에서 book_id 추출 ──
         # 라인망가 상품 페이지에는 코멘트 위젯 요소가 있고,
@@ -221,7 +310,7 @@ class ReviewCrawler:
             # 최종 fallback: URL에서 추출 (정확하지 않을 수 있음)
             m = re.search(r'[?&]id=([A-Za-z0-9]+)', url)
             if not m:
-                return []
+                return [], True
             discovered_book_id = m.group(1)
             logger.warning(f"  ⚠️ 라인망가 book_id fallback (URL): {discovered_book_id} — 정확하지 않을 수 있음")
 
@@ -236,78 +325,52 @@ class ReviewCrawler:
         if visible_count > 0:
             page_comment_count = visible_count
 
-        # ── 5단계: API로 전체 코멘트 수집 (페이지 제한 없음) ──
+        # ── 5단계: API로 코멘트 수집 (기준점 도달 또는 마지막 페이지까지) ──
         all_reviews = []
         seen_keys = set()  # best_comments ↔ comments 중복 방지
         page_num = 1
-
-        while True:
-            api_url = (
-                f'https://manga.line.me/api/book_comment/list'
-                f'?book_id={discovered_book_id}&page={page_num}&rows=20'
-            )
-
-            try:
-                result = await page.evaluate(
-                    'async (url) => {'
-                    '  try { const r = await fetch(url);'
-                    '    if (!r.ok) return null;'
-                    '    return await r.json();'
-                    '  } catch { return null; }'
-                    '}',
-                    api_url
+        complete = True
+        total_pages = -(-page_comment_count // LINEMANGA_COMMENT_ROWS) if page_comment_count > 0 else 0
+
+        # 코멘트 수를 알면 페이지 범위를 계산해 동시 요청 (호스트 제한기 안에서 웨이브 단위)
+        # 결과는 페이지 순서대로 병합 → 기준점/중복 판정은 순차 수집과 동일
+        # (증분 수집이면 첫 페이지만 먼저 — 신규가 1페이지 안이면 웨이브 낭비 없음)
+        while page_num <= total_pages:
+            size = 1 if watermark and page_num == 1 else LINEMANGA_FANOUT
+            wave = list(range(page_num, min(page_num + size, total_pages + 1)))
+            results = await asyncio.gather(*(
+                self._fetch_linemanga_comments(page, discovered_book_id, n) for n in wave
+            ))
+            stop = False
+            for n, result in zip(wave, results):
+                if result is None:
+                    complete, stop = False, True
+                    break
+                has_next, reached_known = self._merge_linemanga_comments(
+                    result, n, seen_keys, all_reviews, watermark
                 )
-
-                if not result or 'result' not in result:
+                if reached_known or not has_next:
+                    stop = True
                     break
-
-                comments = result['result'].get('comments', [])
-
-                # 첫 페이지: best_comments도 함께 수집
-                if page_num == 1:
-                    best = result['result'].get('best_comments', [])
-                    comments = best + comments
-
-                if not comments:
+            if stop:
+                break
+            page_num = wave[-1] + 1
+        else:
+            # 코멘트 수를 모르거나 표시 수보다 페이지가 더 있으면 순차 페이징
+            while True:
+                result = await self._fetch_linemanga_comments(page, discovered_book_id, page_num)
+                if result is None:
+                    complete = False
                     break
-
-                for c in comments:
-                    # 중복 방지 (nickname + timestamp)
-                    key = f"{c.get('nickname', '')}-{c.get('commented_on', '')}"
-                    if key in seen_keys:
-                        continue
-                    seen_keys.add(key)
-
-                    reviewed_at = None
-                    if c.get('commented_on'):
-                        try:
-                            reviewed_at = datetime.fromtimestamp(c['commented_on']).isoformat()
-                        except (ValueError, OSError):
-                            pass
-
-                    all_reviews.append({
-                        'reviewer_name': c.get('nickname', ''),
-                        'reviewer_info': '',
-                        'body': c.get('body', ''),
-                        'rating': None,
-                        'likes_count': c.get('iine_count', 0),
-                        'is_spoiler': False,
-                        'reviewed_at': reviewed_at,
-                    })
-
-                # 다음 페이지 확인
-                pager = result['result'].get('pager', {})
-                if not pager.get('hasNext'):
+                has_next, reached_known = self._merge_linemanga_comments(
+                    result, page_num, seen_keys, all_reviews, watermark
+                )
+                if reached_known or not has_next:
                     break
-
                 page_num += 1
-                await asyncio.sleep(0.3)
 
-            except Exception:
-                break
-
-        # ── 6단계: 수집 검증 ──
-        if page_comment_count > 0 and len(all_reviews) > 0:
+        # ── 6단계: 수집 검증 (전체 수집일 때만 의미 있음) ──
+        if not watermark and page_comment_count > 0 and len(all_reviews) > 0:
             ratio = len(all_reviews) / page_comment_count
             if ratio < 0.5:
                 logger.warning(
@@ -316,26 +379,109 @@ class ReviewCrawler:
                     f"(book_id={discovered_book_id})"
                 )
 
-        return all_reviews
+        return all_reviews, complete
+
+    async def _fetch_linemanga_comments(self, page: Page, book_id: str, page_num: int):
+        """book_comment/list 1페이지 → JSON (요청 실패 시 None — 수집 중단으로 취급)"""
+        api_url = (
+            f'https://manga.line.me/api/book_comment/list'
+            f'?book_id={book_id}&page={page_num}&rows={LINEMANGA_COMMENT_ROWS}'
+        )
+        try:
+            async with self.rates.for_url(api_url).slot() as req:
+                resp = await page.evaluate(
+                    'async (url) => {'
+                    '  try { const r = await fetch(url);'
+                    '    if (!r.ok) return { status: r.status, data: null };'
+                    '    return { status: r.status, data: await r.json() };'
+                    '  } catch { return null; }'
+                    '}',
+                    api_url
+                )
+                req.status = resp.get('status') if resp else None
+        except Exception:
+            return None
+        return resp.get('data') if resp else None
+
+    @staticmethod
+    def _merge_linemanga_comments(
+        result, page_num: int, seen_keys: set, all_reviews: List[Dict[str, Any]],
+        watermark: Optional[ReviewWatermark] = None
+    ) -> Tuple[bool, bool]:
+        """
+        API 응답 1페이지를 all_reviews에 병합
+
+        Returns:
+            (다음 페이지 있음, 기준점 도달)
+        """
+        if not result or 'result' not in result:
+            return False, False
+
+        comments = result['result'].get('comments', [])
+        # 기준점 판정은 최신순 comments만 (best_comments는 오래된 인기 코멘트 포함)
+        newest_count = len(comments)
+
+        # 첫 페이지: best_comments도 함께 수집
+        if page_num == 1:
+            best = result['result'].get('best_comments', [])
+            comments = best + comments
+
+        if not comments:
+            return False, False
+
+        reached_known = False
+        for idx, c in enumerate(comments):
+            # 중복 방지 (nickname + timestamp)
+            key = f"{c.get('nickname', '')}-{c.get('commented_on', '')}"
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
+            reviewed_at = None
+            if c.get('commented_on'):
+                try:
+                    reviewed_at = datetime.fromtimestamp(c['commented_on']).isoformat()
+                except (ValueError, OSError):
+                    pass
+
+            review = {
+                'reviewer_name': c.get('nickname', ''),
+                'reviewer_info': '',
+                'body': c.get('body', ''),
+                'rating': None,
+                'likes_count': c.get('iine_count', 0),
+                'is_spoiler': False,
+                'reviewed_at': reviewed_at,
+            }
+            if watermark and watermark.is_known(review):
+                if idx >= len(comments) - newest_count:
+                    reached_known = True
+                continue
+            all_reviews.append(review)
+
+        pager = result['result'].get('pager', {})
+        return bool(pager.get('hasNext')), reached_known
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 메챠코믹 — SSR 리뷰 페이지 전체 수집
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    async def _collect_mechacomic(self, page: Page, url: str) -> List[Dict[str, Any]]:
-        """메챠코믹 리뷰 전체 수집 (페이지 제한 없음)"""
+    async def _collect_mechacomic(self, page: Page, url: str,
+                                  watermark: Optional[ReviewWatermark] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """메챠코믹 리뷰 수집 (최신순, 기준점 도달 또는 마지막 페이지까지)"""
         match = re.search(r'/books/(\d+)', url)
         if not match:
-            return []
+            return [], True
 
         book_id = match.group(1)
         all_reviews = []
         page_num = 1
+        complete = True
 
         while True:
             review_url = f'https://mechacomic.jp/r/books/{book_id}/reviews?sort=newest&page={page_num}'
 
             try:
-                await page.goto(review_url, wait_until='domcontentloaded', timeout=20000)
+                await self.rates.goto(page, review_url, wait_until='domcontentloaded', timeout=20000)
                 await page.wait_for_timeout(1000)
 
                 reviews = await page.evaluate(r'''
@@ -395,7 +541,13 @@ class ReviewCrawler:
                 if not reviews:
                     break
 
-                all_reviews.extend(reviews)
+                if watermark:
+                    reviews, reached_known = watermark.split(reviews)
+                    all_reviews.extend(reviews)
+                    if reached_known:
+                        break
+                else:
+                    all_reviews.extend(reviews)
 
                 # 다음 페이지 존재 확인
                 has_next = await page.evaluate(r'''
@@ -411,25 +563,27 @@ class ReviewCrawler:
                     break
 
                 page_num += 1
-                await asyncio.sleep(0.5)
 
             except Exception:
+                complete = False
                 break
 
-        return all_reviews
+        return all_reviews, complete
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 코믹시모아 — Playwright 리뷰 페이지 전체 수집
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    async def _collect_cmoa(self, page: Page, url: str) -> List[Dict[str, Any]]:
-        """코믹시모아 리뷰 전체 수집 (페이지 제한 없음)"""
+    async def _collect_cmoa(self, page: Page, url: str,
+                            watermark: Optional[ReviewWatermark] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """코믹시모아 리뷰 수집 (sort=2 = 최신순, 기준점 도달 또는 마지막 페이지까지)"""
         match = re.search(r'/title/(\d+)', url)
         if not match:
-            return []
+            return [], True
 
         title_id = match.group(1)
         all_reviews = []
         page_num = 1
+        complete = True
 
         while True:
             review_url = (
@@ -438,7 +592,7 @@ class ReviewCrawler:
             )
 
             try:
-                await page.goto(review_url, wait_until='domcontentloaded', timeout=20000)
+                await self.rates.goto(page, review_url, wait_until='domcontentloaded', timeout=20000)
                 await page.wait_for_timeout(1000)
 
                 reviews = await page.evaluate(r'''
@@ -520,21 +674,28 @@ class ReviewCrawler:
                 if not page_reviews:
                     break
 
-                all_reviews.extend(page_reviews)
+                if watermark:
+                    page_reviews, reached_known = watermark.split(page_reviews)
+                    all_reviews.extend(page_reviews)
+                    if reached_known:
+                        break
+                else:
+                    all_reviews.extend(page_reviews)
 
                 if not has_next:
                     break
 
                 page_num += 1
-                await asyncio.sleep(0.5)
 
             except Exception:
+                complete = False
                 break
 
-        return all_reviews
+        return all_reviews, complete
 
 
-async def run_review_crawler(max_works: int = 0, concurrency: int = 1, riverse_only: bool = False):
+async def run_review_crawler(max_works: int = 0, concurrency: int = 1, riverse_only: bool = False,
+                             full: bool = False):
     """독립 실행용 래퍼"""
     from playwright.async_api import async_playwright
 
@@ -543,8 +704,9 @@ async def run_review_crawler(max_works: int = 0, concurrency: int = 1, riverse_o
         try:
             crawler = ReviewCrawler(
                 max_works=max_works,
-                delay_seconds=3.0,
-                concurrency=concurrency
+                delay_seconds=1.0,
+                concurrency=concurrency,
+                full=full
             )
             await crawler.run(browser, riverse_only=riverse_only)
         finally:
@@ -556,10 +718,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='리뷰/코멘트 수집 크롤러')
     parser.add_argument('--riverse', action='store_true', help='리버스 작품만 수집')
     parser.add_argument('--max-works', type=int, default=10, help='최대 작품 수')
+    parser.add_argument('--full', action='store_true', help='기준점 무시하고 전체 리뷰 재수집')
     args = parser.parse_args()
 
     mode = "리버스 전용" if args.riverse else "일반"
     print("=" * 60)
     print(f"리뷰/코멘트 수집 크롤러 v2 ({mode})")
     print("=" * 60)
-    asyncio.run(run_review_crawler(max_works=args.max_works, riverse_only=args.riverse))
+    asyncio.run(run_review_crawler(max_works=args.max_works, riverse_only=args.riverse, full=args.full))
@@ -26,6 +26,8 @@ BESTSELLER_URLS = [
 
 class AmazonCollector(BaseCollector):
 
+    match_all_candidates = True  # 베스트셀러 페이지 1회 스크래핑 → 전체 후보 매칭
+
     def __init__(self, max_pages: int = 3):
         super().__init__(source_name='amazon_jp', rate_limit_delay=8.0)
         self.max_pages = max_pages
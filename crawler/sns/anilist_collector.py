@@ -3,22 +3,32 @@ AniList GraphQL API 수집기.
 - 무료, API 키 불필요
 - POST https://graphql.anilist.co
 - 만화 검색 → 점수(0-100), 인기도, 팬 수, 상태
+
+배치 모드 (collect_all):
+- 캐시된 ID(external_ids) → Page(media(id_in: [...])) 한 번에 ID_BATCH개
+- 미캐시 타이틀 → 별칭(s0, s1, ...) 검색 쿼리 한 번에 SEARCH_BATCH개
+- 실행 1회 세션 1개 공유, 요청 단위로 토큰 버킷 적용
+- 검색 결과는 타이틀별로 응답 캐시(http_cache.py)에 보관 — 캐시 hit은 요청 없이 처리
 """
+import asyncio
 import aiohttp
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from crawler.sns.base_collector import BaseCollector
+from crawler.sns.base_collector import BaseCollector, unique_works
 from crawler.sns.external_db import (
-    get_cached_external_id, save_external_id, save_external_metrics_batch
+    get_cached_external_id, get_cached_external_ids, save_external_id,
+    save_external_metrics_batch
 )
+from crawler.sns.http_cache import get_response_cache
 from crawler.sns.title_matcher import best_match
 
 ANILIST_URL = 'https://graphql.anilist.co'
 
-SEARCH_QUERY = '''
-query ($search: String) {
-  Page(page: 1, perPage: 10) {
-    media(search: $search, type: MANGA, sort: SEARCH_MATCH) {
+ID_BATCH = 50       # Page perPage 상한
+SEARCH_BATCH = 10   # 별칭 10개 × 후보 10개 — 쿼리 복잡도 한도 안쪽
+MAX_RETRIES = 3
+
+MEDIA_FIELDS = '''
       id
       title { romaji english native }
       averageScore
@@ -27,95 +37,231 @@ query ($search: String) {
       status
       genres
       format
-    }
+    '''
+
+SEARCH_QUERY = '''
+query ($search: String) {
+  Page(page: 1, perPage: 10) {
+    media(search: $search, type: MANGA, sort: SEARCH_MATCH) {%s}
   }
 }
-'''
+''' % MEDIA_FIELDS
 
 FETCH_BY_ID_QUERY = '''
 query ($id: Int) {
-  Media(id: $id, type: MANGA) {
-    id
-    title { romaji english native }
-    averageScore
-    popularity
-    favourites
-    status
-    genres
-    format
+  Media(id: $id, type: MANGA) {%s}
+}
+''' % MEDIA_FIELDS
+
+FETCH_BY_IDS_QUERY = '''
+query ($ids: [Int]) {
+  Page(page: 1, perPage: %d) {
+    media(id_in: $ids, type: MANGA) {%s}
   }
 }
-'''
+''' % (ID_BATCH, MEDIA_FIELDS)
+
+
+def build_search_batch_query(n: int) -> str:
+    """검색 n건을 별칭(s0..s{n-1})으로 묶은 쿼리."""
+    params = ', '.join(f'$q{i}: String' for i in range(n))
+    aliases = '\n'.join(
+        f'  s{i}: Page(page: 1, perPage: 10) {{\n'
+        f'    media(search: $q{i}, type: MANGA, sort: SEARCH_MATCH) {{{MEDIA_FIELDS}}}\n'
+        f'  }}'
+        for i in range(n)
+    )
+    return f'query ({params}) {{\n{aliases}\n}}'
 
 
 class AnilistCollector(BaseCollector):
 
+    # 공식 90회/분 (혼잡 시 30회/분으로 낮아짐) — 평균은 기존과 같은 초당 1건
+    max_concurrency = 2
+    rate_per_second = 1.0
+    burst = 2
+    freshness_days = 2  # 점수/인기도는 하루 단위로 거의 안 바뀜
+
     def __init__(self):
         super().__init__(source_name='anilist', rate_limit_delay=1.0)
+        self.requests = 0
+
+    async def collect_all(self, works: List[Dict[str, str]]) -> Dict[str, int]:
+        """오버라이드: 캐시 ID는 id_in 배치, 미캐시 타이틀은 별칭 검색 배치."""
+        self.logger.info(f"[anilist] {len(works)}개 작품 수집 시작")
+        unique = unique_works(works)
+        cached = get_cached_external_ids([w['title'] for w in unique], 'anilist')
+
+        by_id = [(w, int(cached[w['title']])) for w in unique
+                 if cached.get(w['title'], '').isdigit()]
+        to_search = [w for w in unique if w['title'] not in cached]
+        # 숫자가 아닌 캐시 ID는 조회 불가 → 스킵 (다시 와도 같으므로 시도로 기록)
+        self.skip_count += len(unique) - len(by_id) - len(to_search)
+        self.attempted.update(t for t, mid in cached.items() if not mid.isdigit())
+
+        # 응답 캐시에 검색 결과가 있는 타이틀은 바로 처리
+        cache = get_response_cache()
+        search_hits = 0
+        misses = []
+        for w in to_search:
+            candidates = cache.get('anilist', {'search': w['title']})
+            if candidates is None:
+                misses.append(w)
+                continue
+            search_hits += 1
+            media = self._match_and_cache(w['title'], w['platform'], candidates)
+            self._record(w['title'], self._save_media(w['title'], media))
+        to_search = misses
+
+        self.logger.info(
+            f"[anilist] 중복 제거 후 {len(unique)}개 "
+            f"(캐시 ID {len(by_id)}, 검색 {len(to_search)}, 검색 캐시 hit {search_hits})"
+        )
+
+        bucket = self._new_bucket()
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async with aiohttp.ClientSession() as session:
+
+            async def run_batch(coro_fn, batch):
+                async with sem:
+                    await bucket.acquire()
+                    try:
+                        await coro_fn(session, batch)
+                    except Exception as e:
+                        self.fail_count += len(batch)
+                        self.logger.warning(f"  배치 {len(batch)}건 실패: {e}")
+
+            await asyncio.gather(
+                *(run_batch(self._collect_id_batch, by_id[i:i + ID_BATCH])
+                  for i in range(0, len(by_id), ID_BATCH)),
+                *(run_batch(self._collect_search_batch, to_search[i:i + SEARCH_BATCH])
+                  for i in range(0, len(to_search), SEARCH_BATCH)),
+            )
+
+        result = {
+            'success': self.success_count,
+            'failed': self.fail_count,
+            'skipped': self.skip_count,
+        }
+        self.logger.info(f"[anilist] 완료: {result} (요청 {self.requests}회)")
+        return result
+
+    async def _collect_id_batch(self, session: aiohttp.ClientSession,
+                                batch: List[Tuple[Dict[str, str], int]]):
+        data = await self._post(session, FETCH_BY_IDS_QUERY, {'ids': [mid for _, mid in batch]})
+        if data is None:
+            self.fail_count += len(batch)
+            return
+        found = {m['id']: m for m in (data.get('Page') or {}).get('media') or []}
+        for work, media_id in batch:
+            self._record(work['title'], self._save_media(work['title'], found.get(media_id)))
+
+    async def _collect_search_batch(self, session: aiohttp.ClientSession,
+                                    batch: List[Dict[str, str]]):
+        variables = {f'q{i}': w['title'] for i, w in enumerate(batch)}
+        data = await self._post(session, build_search_batch_query(len(batch)), variables)
+        if data is None:
+            self.fail_count += len(batch)
+            return
+        cache = get_response_cache()
+        for i, work in enumerate(batch):
+            page = data.get(f's{i}')
+            candidates = (page or {}).get('media') or []
+            if page is not None:
+                cache.put('anilist', {'search': work['title']}, candidates)
+            media = self._match_and_cache(work['title'], work['platform'], candidates)
+            self._record(work['title'], self._save_media(work['title'], media))
+
+    def _record(self, title: str, collected: bool):
+        self.attempted.add(title)
+        if collected:
+            self.success_count += 1
+        else:
+            self.skip_count += 1
+
+    async def _post(self, session: aiohttp.ClientSession, query: str,
+                    variables: dict) -> Optional[dict]:
+        """GraphQL POST → data (부분 오류 응답도 data 사용). 429는 Retry-After만큼 대기 후 재시도."""
+        for attempt in range(MAX_RETRIES):
+            self.requests += 1
+            async with session.post(ANILIST_URL, json={'query': query, 'variables': variables}) as resp:
+                if resp.status == 429:
+                    wait = float(resp.headers.get('Retry-After', 60))
+                    self.logger.warning(f"AniList rate limit, {wait:.0f}초 대기...")
+                    await asyncio.sleep(wait)
+                    continue
+                body = await resp.json(content_type=None)
+                if body.get('data') is not None:
+                    return body['data']
+                if resp.status != 200:
+                    self.logger.warning(f"AniList HTTP {resp.status}: {body.get('errors')}")
+                return None
+        return None
+
+    def _match_and_cache(self, title: str, platform: str, candidates: list) -> Optional[dict]:
+        """검색 후보에서 best_match → external_ids 캐시 후 media 반환."""
+        if not candidates:
+            return None
+        result = best_match(
+            title,
+            [self._flatten_titles(c) for c in candidates],
+            threshold=0.75
+        )
+        if not result:
+            return None
+
+        media, match_score = result
+        save_external_id(
+            platform=platform, title=title, source='anilist',
+            external_id=str(media['id']),
+            external_title=media.get('native', '') or media.get('romaji', ''),
+            match_score=match_score
+        )
+        return media
+
+    def _save_media(self, title: str, media: Optional[dict]) -> bool:
+        if not media:
+            return False
+
+        metrics = {}
+        if media.get('averageScore') is not None:
+            metrics['score'] = media['averageScore']
+        if media.get('popularity') is not None:
+            metrics['popularity'] = media['popularity']
+        if media.get('favourites') is not None:
+            metrics['members'] = media['favourites']
+        if media.get('status'):
+            metrics['status'] = media['status']
+
+        if metrics:
+            save_external_metrics_batch(title, 'anilist', metrics)
+            return True
+        return False
 
     async def collect_one(self, title: str, platform: str) -> bool:
+        """단건 수집 (배치 모드 밖에서 개별 작품만 갱신할 때)."""
         cached_id = get_cached_external_id(title, 'anilist')
 
         async with aiohttp.ClientSession() as session:
-            media = None
-            match_score = 1.0
-
             if cached_id:
                 media = await self._fetch_by_id(session, int(cached_id))
             else:
-                candidates = await self._search(session, title)
-                if not candidates:
-                    return False
-
-                result = best_match(
-                    title,
-                    [self._flatten_titles(c) for c in candidates],
-                    threshold=0.75
-                )
-                if not result:
-                    return False
-
-                media, match_score = result
-                save_external_id(
-                    platform=platform, title=title, source='anilist',
-                    external_id=str(media['id']),
-                    external_title=media.get('native', '') or media.get('romaji', ''),
-                    match_score=match_score
-                )
-
-            if not media:
-                return False
-
-            metrics = {}
-            if media.get('averageScore') is not None:
-                metrics['score'] = media['averageScore']
-            if media.get('popularity') is not None:
-                metrics['popularity'] = media['popularity']
-            if media.get('favourites') is not None:
-                metrics['members'] = media['favourites']
-            if media.get('status'):
-                metrics['status'] = media['status']
-
-            if metrics:
-                save_external_metrics_batch(title, 'anilist', metrics)
-                return True
-            return False
+                media = self._match_and_cache(title, platform, await self._search(session, title))
+            return self._save_media(title, media)
 
     async def _search(self, session: aiohttp.ClientSession, query: str) -> list:
-        payload = {'query': SEARCH_QUERY, 'variables': {'search': query}}
-        async with session.post(ANILIST_URL, json=payload) as resp:
-            if resp.status != 200:
-                return []
-            data = await resp.json()
-            return data.get('data', {}).get('Page', {}).get('media', [])
+        async def load() -> Optional[list]:
+            data = await self._post(session, SEARCH_QUERY, {'search': query})
+            if data is None:
+                return None
+            return (data.get('Page') or {}).get('media') or []
+
+        return await get_response_cache().fetch('anilist', {'search': query}, load) or []
 
     async def _fetch_by_id(self, session: aiohttp.ClientSession, media_id: int) -> Optional[dict]:
-        payload = {'query': FETCH_BY_ID_QUERY, 'variables': {'id': media_id}}
-        async with session.post(ANILIST_URL, json=payload) as resp:
-            if resp.status != 200:
-                return None
-            data = await resp.json()
-            return data.get('data', {}).get('Media')
+        data = await self._post(session, FETCH_BY_ID_QUERY, {'id': media_id})
+        return (data or {}).get('Media')
 
     def _flatten_titles(self, media: dict) -> dict:
         """AniList의 title 객체를 top-level 키로 펼침 (매칭용)."""
@@ -1,14 +1,66 @@
 """
 외부 데이터 수집기 추상 베이스 클래스.
+
+소스별 요청 한도는 수집기 클래스 속성으로 선언한다:
+- max_concurrency: 동시에 진행하는 collect_one 수
+- rate_per_second / burst: 토큰 버킷 (collect_one 1회 = 토큰 1개)
+  rate_per_second가 None이면 1 / rate_limit_delay (기존 고정 딜레이와 같은 평균 속도)
+- freshness_days: 마지막 시도 후 이 일수가 지나야 다시 대상 (1 = 오늘 시도분만 제외)
+  매칭 실패도 시도로 기록되므로 (external_attempts) 같은 주기로만 재시도
+- collect_one 반환: True 수집 / False 조회했지만 데이터 없음 / None 처리 못 함 (한도 초과, 일시 오류)
+  True/False만 self.attempted에 남아 external_attempts(시도 기록)로 저장된다
+- match_all_candidates: 순위표를 한 번 스크래핑해 후보 전체와 매칭하는 수집기 (Amazon, BookWalker)
+  → 요청 수가 대상 수와 무관하므로 신선도/상한 없이 전체 후보를 받는다
 """
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
+
+
+class TokenBucket:
+    """asyncio 토큰 버킷 — 초당 rate개 충전, 최대 burst개 적립."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def unique_works(works: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """타이틀 중복 제거 (외부 데이터는 타이틀 단위, 먼저 나온 작품 유지)."""
+    seen = set()
+    unique = []
+    for w in works:
+        if w['title'] not in seen:
+            seen.add(w['title'])
+            unique.append(w)
+    return unique
 
 
 class BaseCollector(ABC):
 
+    # 소스별 한도 (하위 클래스에서 재정의)
+    max_concurrency: int = 1
+    rate_per_second: Optional[float] = None
+    burst: int = 1
+    freshness_days: int = 1
+    match_all_candidates: bool = False
+
     def __init__(self, source_name: str, rate_limit_delay: float = 1.0):
         self.source_name = source_name
         self.rate_limit_delay = rate_limit_delay
@@ -16,38 +68,53 @@ class BaseCollector(ABC):
         self.success_count = 0
         self.fail_count = 0
         self.skip_count = 0
+        self.attempted: Set[str] = set()  # 실제로 조회를 마친 타이틀 (시도 기록 대상)
+
+    def _new_bucket(self) -> TokenBucket:
+        rate = self.rate_per_second or 1.0 / max(self.rate_limit_delay, 0.01)
+        return TokenBucket(rate, self.burst)
 
     async def collect_all(self, works: List[Dict[str, str]]) -> Dict[str, int]:
-        """전체 작품에 대해 외부 데이터 수집."""
+        """전체 작품에 대해 외부 데이터 수집 (토큰 버킷 + 동시성 상한 안에서 병렬)."""
         self.logger.info(f"[{self.source_name}] {len(works)}개 작품 수집 시작")
 
-        # 타이틀 중복 제거 (외부 데이터는 타이틀 단위)
-        seen = set()
-        unique = []
-        for w in works:
-            if w['title'] not in seen:
-                seen.add(w['title'])
-                unique.append(w)
-
-        self.logger.info(f"[{self.source_name}] 중복 제거 후 {len(unique)}개")
-
-        for i, work in enumerate(unique, 1):
-            try:
-                collected = await self.collect_one(work['title'], work['platform'])
-                if collected:
-                    self.success_count += 1
-                else:
-                    self.skip_count += 1
-
-                if i <= 5 or i % 50 == 0 or i == len(unique):
-                    status = 'OK' if collected else 'SKIP'
-                    self.logger.info(f"  [{i}/{len(unique)}] {work['title'][:30]}... {status}")
-            except Exception as e:
-                self.fail_count += 1
-                if i <= 10:
-                    self.logger.warning(f"  [{i}/{len(unique)}] {work['title'][:30]}... ERROR: {e}")
-
-            await asyncio.sleep(self.rate_limit_delay)
+        unique = unique_works(works)
+        bucket = self._new_bucket()
+        self.logger.info(
+            f"[{self.source_name}] 중복 제거 후 {len(unique)}개 "
+            f"(동시 {self.max_concurrency}, 초당 {bucket.rate:.2f}건)"
+        )
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for work in unique:
+            queue.put_nowait(work)
+        done = 0
+
+        async def worker():
+            nonlocal done
+            while not queue.empty():
+                work = queue.get_nowait()
+                await bucket.acquire()
+                try:
+                    collected = await self.collect_one(work['title'], work['platform'])
+                    if collected is not None:
+                        self.attempted.add(work['title'])
+                    if collected:
+                        self.success_count += 1
+                    else:
+                        self.skip_count += 1
+                    done += 1
+                    if done <= 5 or done % 50 == 0 or done == len(unique):
+                        status = 'OK' if collected else ('SKIP' if collected is False else 'PASS')
+                        self.logger.info(f"  [{done}/{len(unique)}] {work['title'][:30]}... {status}")
+                except Exception as e:
+                    self.fail_count += 1
+                    done += 1
+                    if self.fail_count <= 10:
+                        self.logger.warning(f"  [{done}/{len(unique)}] {work['title'][:30]}... ERROR: {e}")
+
+        n_workers = max(1, min(self.max_concurrency, len(unique)))
+        await asyncio.gather(*(worker() for _ in range(n_workers)))
 
         result = {
             'success': self.success_count,
@@ -58,6 +125,6 @@ class BaseCollector(ABC):
         return result
 
     @abstractmethod
-    async def collect_one(self, title: str, platform: str) -> bool:
-        """단일 작품의 외부 데이터 수집. 수집 성공시 True."""
+    async def collect_one(self, title: str, platform: str) -> Optional[bool]:
+        """단일 작품의 외부 데이터 수집. 수집 성공시 True, 데이터 없음 False, 처리 못 함 None."""
         pass
@@ -38,6 +38,8 @@ def _strip_volume(title: str) -> str:
 
 class BookWalkerCollector(BaseCollector):
 
+    match_all_candidates = True  # 랭킹 페이지 1회 스크래핑 → 전체 후보 매칭
+
     def __init__(self, max_pages: int = 5):
         super().__init__(source_name='bookwalker', rate_limit_delay=4.0)
         self.max_pages = max_pages
@@ -1,12 +1,21 @@
 """
 외부 데이터 DB 저장/조회 (external_ids + external_data 테이블)
+
+수집 실행 중에는 ExternalStore(실행 1회당 1개)가 활성화되어
+- external_ids를 소스별로 쿼리 1회에 전부 메모리로 적재하고
+- ID upsert / 메트릭 행을 모아 FLUSH_EVERY개 타이틀마다 다중 행 upsert로 저장한다.
+  (배치 실패 시 타이틀 단위 재시도, 끝내 실패한 타이틀은 lost에 남겨 수집 결과에서 실패로 집계)
+- 수집 시도(매칭 실패 포함)는 external_attempts에 (title, source)별 날짜로 남긴다.
+아래 모듈 함수들은 활성 저장소가 있으면 자동으로 그쪽을 쓴다 (수집기 코드 변경 불필요).
 """
+import logging
 import psycopg2
+import psycopg2.extras
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 project_root = Path(__file__).parent.parent.parent
@@ -15,13 +24,228 @@ load_dotenv(project_root / '.env')
 load_dotenv(project_root / 'dashboard-next' / '.env.local')
 DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
 
+FLUSH_EVERY = 50  # 이 수만큼 타이틀이 쌓이면 버퍼 flush
+
+logger = logging.getLogger('crawler.sns.external_db')
+
 
 def get_db_connection():
     return psycopg2.connect(DATABASE_URL)
 
 
+class ExternalStore:
+    """
+    실행 1회용 external_ids 캐시 + external_data/external_ids 쓰기 버퍼
+
+    사용 예:
+        with ExternalStore() as store:   # 활성화 → 모듈 함수가 store 경유
+            await collector.collect_all(works)
+        # 종료 시 남은 버퍼 flush
+    """
+
+    def __init__(self, flush_every: int = FLUSH_EVERY):
+        self.flush_every = flush_every
+        self._conn = None
+        self._ids: Dict[str, Dict[str, str]] = {}                          # source → {title: id}
+        self._id_rows: Dict[Tuple[str, str, str], Tuple] = {}              # (platform, title, source) → 행
+        self._metric_rows: Dict[Tuple[str, str, str, str], Tuple] = {}     # (title, source, metric, date) → 행
+        self._pending: Set[Tuple[str, str]] = set()                        # 버퍼에 쌓인 (title, source)
+        self._attempt_rows: Dict[Tuple[str, str], Tuple] = {}              # (title, source) → 행
+        self._has_attempts: Optional[bool] = None
+        self.flushes = 0
+        self.rows_written = 0
+        self.lost: Dict[str, Set[str]] = {}                                # source → 저장 실패 타이틀
+
+    def __enter__(self) -> 'ExternalStore':
+        global _active_store
+        _active_store = self
+        return self
+
+    def __exit__(self, *exc):
+        global _active_store
+        _active_store = None
+        self.close()
+
+    def _db(self):
+        if self._conn is None:
+            self._conn = get_db_connection()
+        return self._conn
+
+    def load_ids(self, source: str) -> Dict[str, str]:
+        """소스의 external_ids 전체를 쿼리 1회로 적재 (이미 적재했으면 재사용)"""
+        if source not in self._ids:
+            cur = self._db().cursor()
+            cur.execute('SELECT title, external_id FROM external_ids WHERE source = %s', (source,))
+            self._ids[source] = {r[0]: r[1] for r in cur.fetchall()}
+            self._db().commit()
+        return self._ids[source]
+
+    def get_id(self, title: str, source: str) -> Optional[str]:
+        return self.load_ids(source).get(title)
+
+    def save_id(self, platform: str, title: str, source: str, external_id: str,
+                external_title: str = '', match_score: float = 1.0):
+        self.load_ids(source)[title] = external_id
+        self._id_rows[(platform, title, source)] = (
+            platform, title, source, external_id, external_title, match_score
+        )
+        self._touch(title, source)
+
+    def save_metrics(self, title: str, source: str, metrics: Dict[str, Any],
+                     collected_date: str = ''):
+        date = collected_date or datetime.now().strftime('%Y-%m-%d')
+        for metric_name, value in metrics.items():
+            if value is None:
+                continue
+            self._metric_rows[(title, source, metric_name, date)] = (
+                title, source, metric_name, value, date
+            )
+        self._touch(title, source)
+
+    def save_attempts(self, source: str, titles: List[str], attempted_date: str = ''):
+        """수집 시도 기록 (external_attempts 테이블이 없으면 무시)"""
+        if self._has_attempts is None:
+            cur = self._db().cursor()
+            self._has_attempts = _has_attempts_table(cur)
+            self._db().commit()
+        if not self._has_attempts:
+            return
+        date = attempted_date or datetime.now().strftime('%Y-%m-%d')
+        for title in titles:
+            self._attempt_rows[(title, source)] = (title, source, date)
+
+    def _touch(self, title: str, source: str):
+        self._pending.add((title, source))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """버퍼를 다중 행 upsert로 저장 (실패 시 롤백 후 타이틀 단위로 재시도, 그래도 실패하면 lost에 기록)"""
+        if not self._id_rows and not self._metric_rows and not self._attempt_rows:
+            return
+        id_rows = list(self._id_rows.values())
+        metric_rows = list(self._metric_rows.values())
+        attempt_rows = list(self._attempt_rows.values())
+        self._id_rows.clear()
+        self._metric_rows.clear()
+        self._attempt_rows.clear()
+        self._pending.clear()
+
+        try:
+            self._write(id_rows, metric_rows, attempt_rows)
+            self.flushes += 1
+            return
+        except Exception as e:
+            self._reset()
+            logger.warning(f"외부 데이터 배치 저장 실패 ({len(id_rows)} ID, "
+                           f"{len(metric_rows)} 메트릭) → 타이틀 단위 재시도: {e}")
+
+        # (title, source)별로 나눠 따로 커밋 — 문제 행이 있는 타이틀만 잃는다
+        groups: Dict[Tuple[str, str], Tuple[list, list, list]] = {}
+        for r in id_rows:
+            groups.setdefault((r[1], r[2]), ([], [], []))[0].append(r)
+        for r in metric_rows:
+            groups.setdefault((r[0], r[1]), ([], [], []))[1].append(r)
+        for r in attempt_rows:
+            groups.setdefault((r[0], r[1]), ([], [], []))[2].append(r)
+
+        failed = 0
+        for (title, source), (ids, metrics, attempts) in groups.items():
+            try:
+                self._write(ids, metrics, attempts)
+            except Exception as e:
+                self._reset()
+                if ids or metrics:
+                    self.lost.setdefault(source, set()).add(title)
+                failed += 1
+                if failed <= 5:
+                    logger.error(f"  [{source}] {title[:30]} 저장 실패: {e}")
+        self.flushes += 1
+        if failed:
+            logger.error(f"외부 데이터 저장 실패: {failed}/{len(groups)}개 타이틀")
+
+    def _write(self, id_rows: list, metric_rows: list, attempt_rows: list):
+        """행 묶음 1개를 한 트랜잭션으로 upsert"""
+        text_rows = [r for r in metric_rows if isinstance(r[3], str)]
+        value_rows = [(t, s, m, float(v), d) for t, s, m, v, d in metric_rows
+                      if not isinstance(v, str)]
+        conn = self._db()
+        cur = conn.cursor()
+        if id_rows:
+            psycopg2.extras.execute_values(cur, '''
+                INSERT INTO external_ids
+                (platform, title, source, external_id, external_title, match_score, updated_at)
+                VALUES %s
+                ON CONFLICT (platform, title, source)
+                DO UPDATE SET
+                    external_id = EXCLUDED.external_id,
+                    external_title = EXCLUDED.external_title,
+                    match_score = EXCLUDED.match_score,
+                    updated_at = NOW()
+            ''', id_rows, template='(%s, %s, %s, %s, %s, %s, NOW())')
+        if text_rows:
+            psycopg2.extras.execute_values(cur, '''
+                INSERT INTO external_data
+                (title, source, metric_name, metric_text, collected_date)
+                VALUES %s
+                ON CONFLICT (title, source, metric_name, collected_date)
+                DO UPDATE SET metric_text = EXCLUDED.metric_text, collected_at = NOW()
+            ''', text_rows, template='(%s, %s, %s, %s, %s::date)')
+        if value_rows:
+            psycopg2.extras.execute_values(cur, '''
+                INSERT INTO external_data
+                (title, source, metric_name, metric_value, collected_date)
+                VALUES %s
+                ON CONFLICT (title, source, metric_name, collected_date)
+                DO UPDATE SET metric_value = EXCLUDED.metric_value, collected_at = NOW()
+            ''', value_rows, template='(%s, %s, %s, %s, %s::date)')
+        if attempt_rows:
+            psycopg2.extras.execute_values(cur, '''
+                INSERT INTO external_attempts (title, source, last_attempted)
+                VALUES %s
+                ON CONFLICT (title, source)
+                DO UPDATE SET last_attempted = GREATEST(external_attempts.last_attempted,
+                                                        EXCLUDED.last_attempted)
+            ''', attempt_rows, template='(%s, %s, %s::date)')
+        conn.commit()
+        self.rows_written += len(id_rows) + len(text_rows) + len(value_rows)
+
+    def _reset(self):
+        """실패한 트랜잭션 정리 (연결이 끊겼으면 다음 _db()에서 재연결)"""
+        try:
+            self._conn.rollback()
+        except Exception:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def lost_count(self, source: str) -> int:
+        """수집기가 성공으로 센 뒤 저장에 실패한 타이틀 수"""
+        return len(self.lost.get(source, ()))
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_active_store: Optional[ExternalStore] = None
+
+
+def _has_attempts_table(cur) -> bool:
+    cur.execute("SELECT to_regclass('external_attempts') IS NOT NULL")
+    return cur.fetchone()[0]
+
+
 def get_cached_external_id(title: str, source: str) -> Optional[str]:
     """캐시된 외부 ID 조회. 없으면 None."""
+    if _active_store is not None:
+        return _active_store.get_id(title, source)
     conn = get_db_connection()
     cur = conn.cursor()
     cur.execute(
@@ -33,10 +257,31 @@ def get_cached_external_id(title: str, source: str) -> Optional[str]:
     return row[0] if row else None
 
 
+def get_cached_external_ids(titles: List[str], source: str) -> Dict[str, str]:
+    """여러 타이틀의 캐시된 외부 ID 일괄 조회 → {title: external_id}."""
+    if not titles:
+        return {}
+    if _active_store is not None:
+        ids = _active_store.load_ids(source)
+        return {t: ids[t] for t in titles if t in ids}
+    conn = get_db_connection()
+    cur = conn.cursor()
+    cur.execute(
+        'SELECT title, external_id FROM external_ids WHERE source = %s AND title = ANY(%s)',
+        (source, list(titles))
+    )
+    result = {r[0]: r[1] for r in cur.fetchall()}
+    conn.close()
+    return result
+
+
 def save_external_id(platform: str, title: str, source: str,
                      external_id: str, external_title: str = '',
                      match_score: float = 1.0):
     """외부 ID 매핑 저장 (UPSERT)."""
+    if _active_store is not None:
+        _active_store.save_id(platform, title, source, external_id, external_title, match_score)
+        return
     conn = get_db_connection()
     cur = conn.cursor()
     cur.execute('''
@@ -58,6 +303,9 @@ def save_external_metrics_batch(title: str, source: str,
                                 metrics: Dict[str, Any],
                                 collected_date: str = ''):
     """메트릭 여러 개를 한 트랜잭션으로 저장."""
+    if _active_store is not None:
+        _active_store.save_metrics(title, source, metrics, collected_date)
+        return
     date = collected_date or datetime.now().strftime('%Y-%m-%d')
     conn = get_db_connection()
     cur = conn.cursor()
@@ -82,6 +330,26 @@ def save_external_metrics_batch(title: str, source: str,
     conn.close()
 
 
+def record_external_attempts(source: str, titles: List[str]):
+    """수집 시도 기록 (매칭 실패도 포함) — 다음 실행의 신선도 계산에 사용."""
+    if not titles:
+        return
+    if _active_store is not None:
+        _active_store.save_attempts(source, titles)
+        return
+    conn = get_db_connection()
+    cur = conn.cursor()
+    if _has_attempts_table(cur):
+        psycopg2.extras.execute_values(cur, '''
+            INSERT INTO external_attempts (title, source, last_attempted)
+            VALUES %s
+            ON CONFLICT (title, source)
+            DO UPDATE SET last_attempted = EXCLUDED.last_attempted
+        ''', [(t, source) for t in dict.fromkeys(titles)], template='(%s, %s, CURRENT_DATE)')
+        conn.commit()
+    conn.close()
+
+
 def get_external_data(title: str) -> List[Dict[str, Any]]:
     """타이틀의 최신 외부 데이터 조회 (소스+메트릭별 최신 1건)."""
     conn = get_db_connection()
@@ -102,41 +370,99 @@ def get_external_data(title: str) -> List[Dict[str, Any]]:
     return result
 
 
-def get_works_for_external(max_count: int = 200, riverse_only: bool = False,
-                           asura_only: bool = False) -> List[Dict[str, str]]:
-    """외부 데이터 수집 대상 작품 목록.
+def get_works_for_external(sources: Dict[str, Optional[int]], max_count: int = 200,
+                           riverse_only: bool = False,
+                           asura_only: bool = False) -> Dict[str, List[Dict[str, str]]]:
+    """외부 데이터 수집 대상 작품 목록 (소스별, 쿼리 1회).
+
+    (title, source)별 마지막 시도일 = MAX(external_data 수집일, external_attempts 시도일)을 조인해
+    - 신선도 기간 안에 시도한 타이틀은 제외하고 (매칭 실패 타이틀도 같은 주기로만 재시도)
+    - 나머지를 미시도 → 오래된 순, 같은 날짜면 리버스 → 최근 14일 최고 순위 순으로 정렬해
+    소스마다 max_count개씩 반환한다.
 
     Args:
-        max_count: 최대 작품 수
+        sources: {external_data 소스명: 신선도 일수} (1 = 오늘 시도분만 제외,
+                 None = 전체 후보 — 순위표 수집기처럼 후보 수가 요청 수와 무관한 소스)
+        max_count: 소스당 최대 작품 수 (신선도 None 소스는 제한 없음)
         riverse_only: True이면 리버스 작품만 (날짜 제한 해제)
         asura_only: True이면 Asura 작품만 (날짜 제한 해제)
+
+    Returns:
+        {source: [{title, platform, age_days}, ...]}  (age_days None = 미시도)
     """
-    conn = get_db_connection()
-    cur = conn.cursor()
+    if not sources:
+        return {}
     if riverse_only:
-        cur.execute('''
-            SELECT DISTINCT w.title, w.platform
-            FROM works w
-            WHERE w.is_riverse = TRUE
-            ORDER BY w.title
-            LIMIT %s
-        ''', (max_count,))
+        work_filter = 'w.is_riverse = TRUE'
     elif asura_only:
-        cur.execute('''
-            SELECT DISTINCT w.title, w.platform
-            FROM works w
-            WHERE w.platform = 'asura'
-            ORDER BY w.title
-            LIMIT %s
-        ''', (max_count,))
+        work_filter = "w.platform = 'asura'"
     else:
-        cur.execute('''
-            SELECT DISTINCT w.title, w.platform
+        work_filter = "w.last_seen_date >= (CURRENT_DATE - INTERVAL '14 days')::date"
+
+    conn = get_db_connection()
+    cur = conn.cursor()
+    attempts_sql = '''
+            UNION ALL
+            SELECT a.title, a.source, a.last_attempted
+            FROM external_attempts a
+            JOIN cand c ON c.title = a.title
+            WHERE a.source = ANY(%(sources)s::text[])
+    ''' if _has_attempts_table(cur) else ''
+    cur.execute(f'''
+        WITH cand AS (
+            SELECT DISTINCT ON (w.title)
+                   w.title, w.platform, COALESCE(w.is_riverse, FALSE) AS is_riverse
             FROM works w
-            WHERE w.last_seen_date >= (CURRENT_DATE - INTERVAL '14 days')::date
-            ORDER BY w.title
-            LIMIT %s
-        ''', (max_count,))
-    result = [{'title': r[0], 'platform': r[1]} for r in cur.fetchall()]
+            WHERE {work_filter}
+            ORDER BY w.title, w.last_seen_date DESC NULLS LAST
+        ),
+        src AS (
+            SELECT * FROM unnest(%(sources)s::text[], %(fresh)s::int[]) AS s(source, fresh_days)
+        ),
+        rk AS (
+            SELECT title, MIN(rank) AS best_rank
+            FROM rankings
+            WHERE date::date >= CURRENT_DATE - 14 AND sub_category = ''
+            GROUP BY title
+        ),
+        last AS (
+            SELECT title, source, MAX(last_date) AS last_date
+            FROM (
+                SELECT d.title, d.source, MAX(d.collected_date) AS last_date
+                FROM external_data d
+                JOIN cand c ON c.title = d.title
+                WHERE d.source = ANY(%(sources)s::text[])
+                GROUP BY d.title, d.source
+                {attempts_sql}
+            ) x
+            GROUP BY title, source
+        ),
+        ranked AS (
+            SELECT s.source, s.fresh_days, c.title, c.platform,
+                   CURRENT_DATE - l.last_date AS age_days,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY s.source
+                       ORDER BY l.last_date ASC NULLS FIRST,
+                                c.is_riverse DESC,
+                                rk.best_rank ASC NULLS LAST,
+                                c.title
+                   ) AS rn
+            FROM src s
+            CROSS JOIN cand c
+            LEFT JOIN last l ON l.title = c.title AND l.source = s.source
+            LEFT JOIN rk ON rk.title = c.title
+            WHERE s.fresh_days IS NULL
+               OR l.last_date IS NULL
+               OR l.last_date <= CURRENT_DATE - s.fresh_days
+        )
+        SELECT source, title, platform, age_days
+        FROM ranked
+        WHERE fresh_days IS NULL OR rn <= %(limit)s
+        ORDER BY source, rn
+    ''', {'sources': list(sources), 'fresh': [sources[s] for s in sources], 'limit': max_count})
+
+    result: Dict[str, List[Dict[str, str]]] = {s: [] for s in sources}
+    for source, title, platform, age_days in cur.fetchall():
+        result[source].append({'title': title, 'platform': platform, 'age_days': age_days})
     conn.close()
     return result
@@ -0,0 +1,187 @@
+"""
+외부 소스 검색 응답 디스크 캐시 (SQLite)
+
+타이틀 검색 결과는 며칠 안에 거의 바뀌지 않으므로 실행마다 다시 묻지 않는다.
+- 키: (소스, 정규화한 요청) — 문자열은 NFKC + 공백 정리, dict는 키 정렬 후 해시
+- 소스별 TTL (SOURCE_TTL_HOURS), 만료 항목은 조회 시 삭제
+- 전체 크기 상한 (MAX_BYTES) 초과 시 마지막 조회가 오래된 순으로 제거 (LRU)
+- 소스별 hit/miss/expired 통계 → log_stats()
+
+오류 응답은 저장하지 않는다: loader가 None을 돌려주면 캐시하지 않음
+(빈 결과 []/{}는 "없음"도 유효한 결과라 저장).
+
+사용 예:
+    cache = get_response_cache()
+    candidates = await cache.fetch('mal', {'q': title}, lambda: self._search_api(session, title))
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+project_root = Path(__file__).parent.parent.parent
+
+CACHE_PATH = project_root / 'data' / 'cache' / 'http_cache.sqlite3'
+MAX_BYTES = 64 * 1024 * 1024
+EVICT_TO = 0.9              # 상한 초과 시 이 비율까지 줄임
+EVICT_CHECK_EVERY = 50      # put N회마다 크기 확인
+
+DEFAULT_TTL_HOURS = 24
+SOURCE_TTL_HOURS: Dict[str, float] = {
+    'anilist': 72,
+    'mal': 72,
+    'reddit': 20,   # 최근 1개월 포스트 집계라 하루 단위로 갱신
+    'pixiv': 20,
+}
+
+logger = logging.getLogger('crawler.sns.http_cache')
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return ' '.join(unicodedata.normalize('NFKC', value).split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def make_key(source: str, request: Any) -> str:
+    raw = json.dumps([source, _normalize(request)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite 응답 캐시 (스레드 안전, 실행 중 1개 공유)"""
+
+    def __init__(self, path: Path = CACHE_PATH, max_bytes: int = MAX_BYTES,
+                 enabled: bool = True):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False,
+                                         isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)'
+            )
+        return self._conn
+
+    def _count(self, source: str, kind: str):
+        st = self.stats.setdefault(source, {'hit': 0, 'miss': 0, 'expired': 0})
+        st[kind] += 1
+
+    def get(self, source: str, request: Any) -> Optional[Any]:
+        """캐시 조회 → 값 (없거나 만료면 None)"""
+        if not self.enabled:
+            return None
+        key = make_key(source, request)
+        ttl = SOURCE_TTL_HOURS.get(source, DEFAULT_TTL_HOURS) * 3600
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                'SELECT value, created_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self._count(source, 'miss')
+                return None
+            if now - row[1] > ttl:
+                db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._count(source, 'expired')
+                return None
+            db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            self._count(source, 'hit')
+        return json.loads(row[0])
+
+    def put(self, source: str, request: Any, value: Any):
+        if not self.enabled or value is None:
+            return
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute('''
+                INSERT OR REPLACE INTO responses (key, source, value, size, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (make_key(source, request), source, payload, len(payload), now, now))
+            self._puts += 1
+            if self._puts % EVICT_CHECK_EVERY == 0:
+                self._evict(db)
+
+    def _evict(self, db: sqlite3.Connection):
+        total = db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = total - int(self.max_bytes * EVICT_TO)
+        freed = 0
+        victims = []
+        for key, size in db.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+            victims.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        db.executemany('DELETE FROM responses WHERE key = ?', victims)
+        logger.info(f"🧹 응답 캐시 {len(victims)}개 제거 ({freed / 1024 / 1024:.1f}MB)")
+
+    async def fetch(self, source: str, request: Any,
+                    loader: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        """캐시 우선 조회, 없으면 loader() 호출 후 저장 (None은 저장 안 함)"""
+        cached = self.get(source, request)
+        if cached is not None:
+            return cached
+        value = await loader()
+        self.put(source, request, value)
+        return value
+
+    def log_stats(self, log: logging.Logger = logger):
+        if not self.enabled:
+            log.info("  💽 응답 캐시: 사용 안 함 (--no-cache)")
+            return
+        for source, st in sorted(self.stats.items()):
+            total = st['hit'] + st['miss'] + st['expired']
+            rate = st['hit'] / total * 100 if total else 0
+            log.info(f"  💽 응답 캐시 [{source}] hit {st['hit']} / miss {st['miss']} "
+                     f"/ 만료 {st['expired']} ({rate:.0f}%)")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 공유 캐시 (main_external --no-cache면 enabled=False)"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
@@ -3,6 +3,7 @@ Jikan (MyAnimeList 비공식) REST API 수집기.
 - 무료, API 키 불필요, 60 req/min
 - GET https://api.jikan.moe/v4/manga?q={query}
 - MAL 점수(1-10), 회원 수, 랭킹, 인기도
+- 검색 결과는 응답 캐시(http_cache.py) 우선 — 캐시 hit이면 요청/429 대기 없음
 """
 import asyncio
 import aiohttp
@@ -12,6 +13,7 @@ from crawler.sns.base_collector import BaseCollector
 from crawler.sns.external_db import (
     get_cached_external_id, save_external_id, save_external_metrics_batch
 )
+from crawler.sns.http_cache import get_response_cache
 from crawler.sns.title_matcher import best_match
 
 JIKAN_BASE = 'https://api.jikan.moe/v4'
@@ -19,10 +21,16 @@ JIKAN_BASE = 'https://api.jikan.moe/v4'
 
 class JikanCollector(BaseCollector):
 
+    # 공식 한도 초당 3건 / 분당 60건
+    max_concurrency = 2
+    rate_per_second = 0.9
+    burst = 3
+    freshness_days = 2
+
     def __init__(self):
         super().__init__(source_name='mal', rate_limit_delay=1.2)
 
-    async def collect_one(self, title: str, platform: str) -> bool:
+    async def collect_one(self, title: str, platform: str) -> Optional[bool]:
         cached_id = get_cached_external_id(title, 'mal')
 
         async with aiohttp.ClientSession() as session:
@@ -31,8 +39,12 @@ class JikanCollector(BaseCollector):
 
             if cached_id:
                 manga = await self._fetch_by_id(session, int(cached_id))
+                if manga is None:
+                    return None  # 429/HTTP 오류 — 다음 실행에서 재시도
             else:
                 candidates = await self._search(session, title)
+                if candidates is None:
+                    return None
                 if not candidates:
                     return False
 
@@ -66,18 +78,23 @@ class JikanCollector(BaseCollector):
                 return True
             return False
 
-    async def _search(self, session: aiohttp.ClientSession, query: str) -> list:
+    async def _search(self, session: aiohttp.ClientSession, query: str) -> Optional[list]:
+        """검색 후보 목록 (오류면 None)."""
         url = f'{JIKAN_BASE}/manga'
         params = {'q': query, 'limit': 10, 'order_by': 'score', 'sort': 'desc'}
-        async with session.get(url, params=params) as resp:
-            if resp.status == 429:
-                self.logger.warning("Jikan rate limit, 5초 대기...")
-                await asyncio.sleep(5)
-                return []
-            if resp.status != 200:
-                return []
-            data = await resp.json()
-            return data.get('data', [])
+
+        async def load() -> Optional[list]:
+            async with session.get(url, params=params) as resp:
+                if resp.status == 429:
+                    self.logger.warning("Jikan rate limit, 5초 대기...")
+                    await asyncio.sleep(5)
+                    return None
+                if resp.status != 200:
+                    return None
+                data = await resp.json()
+                return data.get('data', [])
+
+        return await get_response_cache().fetch('mal', {'url': url, **params}, load)
 
     async def _fetch_by_id(self, session: aiohttp.ClientSession, mal_id: int) -> Optional[dict]:
         url = f'{JIKAN_BASE}/manga/{mal_id}'
@@ -1,6 +1,7 @@
 """
 Pixiv 팬아트 수집기.
 - pixivpy3 라이브러리 사용 (동기식 → run_in_executor 래핑)
+- 검색 집계는 응답 캐시(http_cache.py)에 하루 보관
 - 작품명 태그로 일러스트 검색 → 팬아트 수/북마크/조회수 집계
 - PIXIV_REFRESH_TOKEN 환경변수 필요 (1회 gppt 도구로 발급)
 """
@@ -8,6 +9,7 @@ import asyncio
 import os
 import logging
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 try:
@@ -18,6 +20,7 @@ except ImportError:
 
 from crawler.sns.base_collector import BaseCollector
 from crawler.sns.external_db import save_external_metrics_batch
+from crawler.sns.http_cache import get_response_cache
 
 project_root = Path(__file__).parent.parent.parent
 load_dotenv(project_root / '.env')
@@ -28,6 +31,10 @@ logger = logging.getLogger('crawler.sns.pixiv')
 
 class PixivCollector(BaseCollector):
 
+    max_concurrency = 2
+    rate_per_second = 0.5
+    freshness_days = 3
+
     def __init__(self):
         super().__init__(source_name='pixiv', rate_limit_delay=2.0)
 
@@ -53,21 +60,24 @@ class PixivCollector(BaseCollector):
             self._available = False
             self._api = None
 
-    async def collect_one(self, title: str, platform: str) -> bool:
+    async def collect_one(self, title: str, platform: str) -> Optional[bool]:
         if not self._available:
-            return False
+            return None
 
-        results = await asyncio.get_event_loop().run_in_executor(
-            None, self._search_fanart, title
+        results = await get_response_cache().fetch(
+            'pixiv', {'title': title},
+            lambda: asyncio.get_event_loop().run_in_executor(None, self._search_fanart, title)
         )
 
+        if results is None:
+            return None  # 검색 오류 — 다음 실행에서 재시도
         if not results:
             return False
 
         save_external_metrics_batch(title, 'pixiv', results)
         return True
 
-    def _search_fanart(self, title: str) -> dict:
+    def _search_fanart(self, title: str) -> Optional[dict]:
         """Pixiv에서 작품 태그로 일러스트 검색, 집계."""
         try:
             result = self._api.search_illust(
@@ -100,4 +110,4 @@ class PixivCollector(BaseCollector):
                 except Exception:
                     pass
             logger.warning(f"Pixiv search error for '{title[:30]}': {e}")
-            return {}
+            return None
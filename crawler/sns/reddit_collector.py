@@ -1,6 +1,7 @@
 """
 Reddit r/manga 수집기.
 - PRAW 라이브러리 사용 (동기식 → run_in_executor 래핑)
+- 검색 집계는 응답 캐시(http_cache.py)에 하루 보관
 - 무료 Reddit API (100 req/min)
 - r/manga에서 작품명 검색 → 토론 수, 업보트, 댓글 집계
 """
@@ -8,6 +9,7 @@ import asyncio
 import os
 import logging
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 try:
@@ -18,6 +20,7 @@ except ImportError:
 
 from crawler.sns.base_collector import BaseCollector
 from crawler.sns.external_db import save_external_metrics_batch
+from crawler.sns.http_cache import get_response_cache
 
 project_root = Path(__file__).parent.parent.parent
 load_dotenv(project_root / '.env')
@@ -28,6 +31,11 @@ logger = logging.getLogger('crawler.sns.reddit')
 
 class RedditCollector(BaseCollector):
 
+    # OAuth 분당 100건 (praw가 자체 대기도 함)
+    max_concurrency = 2
+    rate_per_second = 1.5
+    burst = 2
+
     def __init__(self):
         super().__init__(source_name='reddit', rate_limit_delay=0.6)
 
@@ -53,21 +61,24 @@ class RedditCollector(BaseCollector):
             user_agent='webtoon-ranking-bot/1.0 (by jp-webtoon-ranking)'
         )
 
-    async def collect_one(self, title: str, platform: str) -> bool:
+    async def collect_one(self, title: str, platform: str) -> Optional[bool]:
         if not self._available:
-            return False
+            return None
 
-        results = await asyncio.get_event_loop().run_in_executor(
-            None, self._search_manga, title
+        results = await get_response_cache().fetch(
+            'reddit', {'title': title},
+            lambda: asyncio.get_event_loop().run_in_executor(None, self._search_manga, title)
         )
 
+        if results is None:
+            return None  # 검색 오류 — 다음 실행에서 재시도
         if not results:
             return False
 
         save_external_metrics_batch(title, 'reddit', results)
         return True
 
-    def _search_manga(self, title: str) -> dict:
+    def _search_manga(self, title: str) -> Optional[dict]:
         """r/manga에서 작품 검색, 포스트 집계."""
         try:
             subreddit = self._reddit.subreddit('manga')
@@ -90,4 +101,4 @@ class RedditCollector(BaseCollector):
 
         except Exception as e:
             logger.warning(f"Reddit search error for '{title[:30]}': {e}")
-            return {}
+            return None
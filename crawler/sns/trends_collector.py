@@ -2,10 +2,15 @@
 Google Trends 수집기 (pytrends-modern).
 - 일본(JP)에서의 검색 관심도를 0-100 스케일로 수집
 - 5개씩 배치 비교 (Google Trends 최대 5개)
+- 전용 스레드 1개 + TrendReq 세션 재사용 (기본 executor를 막지 않음)
+- 배치 간격은 호스트 속도 제어(crawler/rate_controller.py)가 조절:
+  429면 간격 2배 후 같은 배치 재시도 (asyncio 대기), 정상이 이어지면 점차 단축
+  그 밖의 오류(네트워크 장애 등)도 감속 신호(503)로 기록하고 최소 ERROR_RETRY_DELAY초 쉬었다 재시도
 """
 import asyncio
 import logging
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 
 try:
     from pytrends.request import TrendReq
@@ -17,14 +22,37 @@ except ImportError:
     except ImportError:
         HAS_PYTRENDS = False
 
-from crawler.sns.base_collector import BaseCollector
+from crawler.rate_controller import HostRateController, RateLimits
+from crawler.sns.base_collector import BaseCollector, unique_works
 from crawler.sns.external_db import save_external_metrics_batch
 
 logger = logging.getLogger('crawler.sns.google_trends')
 
+TRENDS_HOST = 'trends.google.com'
+BATCH_SIZE = 5
+MAX_RETRIES = 4          # 배치당 429 재시도
+SESSION_RESET_AFTER = 2  # 연속 429가 이만큼이면 TrendReq 새로 생성 (쿠키 갱신)
+ERROR_RETRY_DELAY = 30.0  # 429 이외 오류 재시도 전 최소 대기 (초)
+
+TRENDS_LIMITS = RateLimits(
+    max_concurrency=1, min_delay=2.0, max_delay=120.0,
+    target_latency=20.0, initial_delay=5.0,
+)
+
+
+class TooManyRequests(Exception):
+    """Google Trends 429"""
+
+
+def _is_rate_limited(e: Exception) -> bool:
+    status = getattr(getattr(e, 'response', None), 'status_code', None)
+    return status == 429 or type(e).__name__ == 'TooManyRequestsError' or '429' in str(e)
+
 
 class TrendsCollector(BaseCollector):
 
+    freshness_days = 3  # 3개월 관심도 평균
+
     def __init__(self):
         super().__init__(source_name='google_trends', rate_limit_delay=5.0)
         if not HAS_PYTRENDS:
@@ -32,50 +60,59 @@ class TrendsCollector(BaseCollector):
             self._available = False
         else:
             self._available = True
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pytrends = None
+        self._consecutive_429 = 0
+
+    def _run(self, fn, *args):
+        """전용 스레드에서 실행 (pytrends 세션은 스레드 1개에서만 사용)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='trends')
+        return asyncio.get_event_loop().run_in_executor(self._executor, fn, *args)
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pytrends = None
 
     async def collect_all(self, works: List[Dict[str, str]]) -> Dict[str, int]:
-        """오버라이드: 5개씩 배치로 Google Trends 비교."""
+        """오버라이드: 5개씩 배치로 Google Trends 비교 (429 적응형 간격)."""
         if not self._available:
             logger.warning("[google_trends] pytrends-modern 미설치, 스킵")
             return {'success': 0, 'failed': 0, 'skipped': len(works)}
 
         self.logger.info(f"[google_trends] {len(works)}개 작품 수집 시작")
 
-        # 타이틀 중복 제거
-        seen = set()
-        unique_titles = []
-        for w in works:
-            if w['title'] not in seen:
-                seen.add(w['title'])
-                unique_titles.append(w['title'])
-
+        unique_titles = [w['title'] for w in unique_works(works)]
         self.logger.info(f"[google_trends] 중복 제거 후 {len(unique_titles)}개")
 
-        # 5개씩 배치
-        batches = [unique_titles[i:i+5] for i in range(0, len(unique_titles), 5)]
-
-        for batch_idx, batch in enumerate(batches, 1):
-            try:
-                results = await asyncio.get_event_loop().run_in_executor(
-                    None, self._fetch_trends, batch
-                )
-                for title, metrics in results.items():
-                    save_external_metrics_batch(title, 'google_trends', metrics)
-                    self.success_count += 1
-
-                if batch_idx <= 3 or batch_idx % 10 == 0 or batch_idx == len(batches):
-                    self.logger.info(
-                        f"  [batch {batch_idx}/{len(batches)}] "
-                        f"{len(results)} titles OK"
-                    )
-            except Exception as e:
-                self.fail_count += len(batch)
-                if batch_idx <= 5:
-                    self.logger.warning(
-                        f"  [batch {batch_idx}/{len(batches)}] ERROR: {e}"
-                    )
+        batches = [unique_titles[i:i + BATCH_SIZE] for i in range(0, len(unique_titles), BATCH_SIZE)]
+        pacer = HostRateController(TRENDS_HOST, TRENDS_LIMITS)
 
-            await asyncio.sleep(self.rate_limit_delay)
+        try:
+            for batch_idx, batch in enumerate(batches, 1):
+                try:
+                    results = await self._fetch_batch(pacer, batch)
+                    self.attempted.update(batch)
+                    for title, metrics in results.items():
+                        save_external_metrics_batch(title, 'google_trends', metrics)
+                        self.success_count += 1
+                    self.skip_count += len(batch) - len(results)
+
+                    if batch_idx <= 3 or batch_idx % 10 == 0 or batch_idx == len(batches):
+                        self.logger.info(
+                            f"  [batch {batch_idx}/{len(batches)}] "
+                            f"{len(results)} titles OK (간격 {pacer.delay:.1f}s)"
+                        )
+                except Exception as e:
+                    self.fail_count += len(batch)
+                    if batch_idx <= 5:
+                        self.logger.warning(
+                            f"  [batch {batch_idx}/{len(batches)}] ERROR: {e}"
+                        )
+        finally:
+            self._shutdown()
 
         result = {
             'success': self.success_count,
@@ -83,46 +120,85 @@ class TrendsCollector(BaseCollector):
             'skipped': self.skip_count,
         }
         self.logger.info(f"[google_trends] 완료: {result}")
+        self.logger.info(f"  📈 속도 제어 {pacer.summary()}")
         return result
 
+    async def _fetch_batch(self, pacer: HostRateController,
+                           titles: List[str]) -> Dict[str, Dict]:
+        """배치 1개 조회. 429/오류면 페이서가 간격을 늘린 뒤 같은 배치 재시도."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with pacer.slot() as req:
+                    try:
+                        results = await self._run(self._fetch_trends, titles)
+                    except TooManyRequests:
+                        req.status = 429
+                        raise
+                    except Exception:
+                        req.status = 503  # 일시 장애 → 정상으로 세지 않고 감속
+                        raise
+                    req.status = 200
+                self._consecutive_429 = 0
+                return results
+            except TooManyRequests:
+                self._consecutive_429 += 1
+                if self._consecutive_429 >= SESSION_RESET_AFTER:
+                    self._pytrends = None
+                if attempt == MAX_RETRIES:
+                    raise
+                self.logger.warning(
+                    f"  Google Trends 429 — {pacer.delay:.0f}s 뒤 재시도 ({attempt + 1}/{MAX_RETRIES})"
+                )
+                await asyncio.sleep(pacer.delay)
+            except Exception as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                wait = max(pacer.delay, ERROR_RETRY_DELAY)
+                self.logger.warning(
+                    f"  Google Trends 오류 — {wait:.0f}s 뒤 재시도 ({attempt + 1}/{MAX_RETRIES}): {e}"
+                )
+                await asyncio.sleep(wait)
+        return {}
+
     def _fetch_trends(self, titles: List[str]) -> Dict[str, Dict]:
-        """동기 함수: pytrends로 관심도 조회."""
+        """동기 함수 (전용 스레드): pytrends로 관심도 조회. 429는 TooManyRequests로 올림."""
         try:
-            pytrends = TrendReq(hl='ja', tz=-540)
+            if self._pytrends is None:
+                self._pytrends = TrendReq(hl='ja', tz=-540)
             # 제목이 너무 길면 잘라서 검색
             kw_list = [t[:50] for t in titles]
-            pytrends.build_payload(kw_list, timeframe='today 3-m', geo='JP')
-            df = pytrends.interest_over_time()
-
-            if df is None or df.empty:
-                return {}
-
-            results = {}
-            for title, kw in zip(titles, kw_list):
-                if kw not in df.columns:
-                    continue
-                series = df[kw]
-                latest = int(series.iloc[-1]) if len(series) > 0 else 0
-                avg = round(float(series.mean()), 1)
-                results[title] = {
-                    'interest_score': latest,
-                    'interest_avg_3m': avg,
-                }
-            return results
-
+            self._pytrends.build_payload(kw_list, timeframe='today 3-m', geo='JP')
+            df = self._pytrends.interest_over_time()
         except Exception as e:
+            if _is_rate_limited(e):
+                raise TooManyRequests(str(e)) from e
             logger.warning(f"Google Trends fetch error: {e}")
-            import time
-            time.sleep(30)  # 429 대비 대기
+            raise
+
+        if df is None or df.empty:
             return {}
 
+        results = {}
+        for title, kw in zip(titles, kw_list):
+            if kw not in df.columns:
+                continue
+            series = df[kw]
+            latest = int(series.iloc[-1]) if len(series) > 0 else 0
+            avg = round(float(series.mean()), 1)
+            results[title] = {
+                'interest_score': latest,
+                'interest_avg_3m': avg,
+            }
+        return results
+
     async def collect_one(self, title: str, platform: str) -> bool:
         """개별 수집 (collect_all에서 배치 처리하므로 보통 사용 안 함)."""
         if not self._available:
             return False
-        results = await asyncio.get_event_loop().run_in_executor(
-            None, self._fetch_trends, [title]
-        )
+        try:
+            results = await self._run(self._fetch_trends, [title])
+        except Exception:
+            return False
         if title in results:
             save_external_metrics_batch(title, 'google_trends', results[title])
             return True
@@ -20,6 +20,8 @@ logger = logging.getLogger('crawler.sns.twitter')
 
 class TwitterCollector(BaseCollector):
 
+    max_concurrency = 1  # 페이지 1개 공유
+
     def __init__(self, max_titles: int = 50):
         super().__init__(source_name='twitter', rate_limit_delay=4.0)
         self.max_titles = max_titles
@@ -54,13 +56,13 @@ class TwitterCollector(BaseCollector):
         finally:
             await self._close_browser()
 
-    async def collect_one(self, title: str, platform: str) -> bool:
+    async def collect_one(self, title: str, platform: str) -> Optional[bool]:
         if self._collected >= self.max_titles:
-            return False
+            return None  # 한도 초과 — 조회 안 함 (시도 기록 안 남김)
 
         page = self._page
         if not page:
-            return False
+            return None
 
         try:
             # Yahoo! リアルタイム検索 (X/Twitter 데이터)
@@ -109,4 +111,4 @@ class TwitterCollector(BaseCollector):
 
         except Exception as e:
             logger.warning(f"Twitter/Yahoo search error for '{title[:30]}': {e}")
-            return False
+            return None
@@ -2,12 +2,18 @@
 YouTube Playwright 크롤러.
 - API 키 불필요 — 브라우저로 YouTube 검색 결과 직접 스크래핑
 - "{만화 제목} PV 公式" 검색 → 조회수 수집
+- 검색 페이지의 ytInitialData(JSON)에서 영상 ID/제목/조회수를 한 번에 추출
+  → 조회수가 빠진 영상만 영상 페이지(ytInitialPlayerResponse) 방문
+- 영상 ID가 캐시된 작품은 검색 없이 영상 페이지(최대 3개)만 방문
+- 탭 풀(TAB_POOL_SIZE)로 작품 여러 개를 동시에 처리, 작품별 소요 시간 요약 로그
 """
 import asyncio
 import re
 import logging
-from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Browser, Page
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Iterator, List, Dict, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from crawler.sns.base_collector import BaseCollector
 from crawler.sns.external_db import (
@@ -16,6 +22,9 @@ from crawler.sns.external_db import (
 
 logger = logging.getLogger('crawler.sns.youtube')
 
+TAB_POOL_SIZE = 3
+SEARCH_RESULTS = 5
+
 
 def parse_view_count(text: str) -> Optional[int]:
     """YouTube 조회수 텍스트를 숫자로 변환.
@@ -57,33 +66,85 @@ def parse_view_count(text: str) -> Optional[int]:
     return None
 
 
+def iter_video_renderers(data: Any) -> Iterator[Dict]:
+    """ytInitialData 안의 videoRenderer 객체를 문서 순서대로 순회."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            renderer = node.get('videoRenderer')
+            if isinstance(renderer, dict):
+                yield renderer
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _text(obj: Optional[Dict]) -> str:
+    """YouTube 텍스트 객체 ({simpleText} 또는 {runs: [{text}]}) → 문자열."""
+    if not obj:
+        return ''
+    if 'simpleText' in obj:
+        return obj['simpleText']
+    return ''.join(r.get('text', '') for r in obj.get('runs', []))
+
+
+def extract_search_videos(data: Any, limit: int = SEARCH_RESULTS) -> List[Dict]:
+    """검색 페이지 ytInitialData → [{id, title, views}] (views None = 페이로드에 없음)."""
+    videos = []
+    for r in iter_video_renderers(data):
+        if not r.get('videoId'):
+            continue
+        views_text = _text(r.get('viewCountText')) or _text(r.get('shortViewCountText'))
+        videos.append({
+            'id': r['videoId'],
+            'title': _text(r.get('title')),
+            'views': parse_view_count(views_text),
+        })
+        if len(videos) >= limit:
+            break
+    return videos
+
+
 class YoutubeCollector(BaseCollector):
 
+    max_concurrency = TAB_POOL_SIZE  # 탭 풀 크기만큼 작품 동시 처리
+    rate_per_second = 0.5
+    burst = 2
+    freshness_days = 2
+
     def __init__(self, max_titles: int = 80):
         super().__init__(source_name='youtube', rate_limit_delay=3.0)
         self.max_titles = max_titles
         self._collected = 0
+        self._pw = None
         self._browser: Optional[Browser] = None
-        self._page: Optional[Page] = None
+        self._ctx: Optional[BrowserContext] = None
+        self._tabs: Optional[asyncio.Queue] = None
+        # 소요 시간 통계
+        self._timings: List[float] = []
+        self.search_pages = 0
+        self.video_pages = 0
 
     async def _ensure_browser(self):
-        """브라우저가 없으면 시작."""
+        """브라우저가 없으면 시작 + 탭 풀 생성."""
         if self._browser is None:
-            pw = await async_playwright().start()
-            self._browser = await pw.chromium.launch(headless=True)
-            ctx = await self._browser.new_context(
+            self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(headless=True)
+            self._ctx = await self._browser.new_context(
                 locale='ja-JP',
                 user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
                            'AppleWebKit/537.36 (KHTML, like Gecko) '
                            'Chrome/120.0.0.0 Safari/537.36',
             )
-            self._page = await ctx.new_page()
-            # YouTube 쿠키 동의 우회
-            await self._page.goto('https://www.youtube.com', wait_until='domcontentloaded')
+            first = await self._ctx.new_page()
+            # YouTube 쿠키 동의 우회 (쿠키는 컨텍스트 공유라 첫 탭에서 1회)
+            await first.goto('https://www.youtube.com', wait_until='domcontentloaded')
             await asyncio.sleep(2)
             # 쿠키 동의 버튼 클릭 (있으면)
             try:
-                consent_btn = self._page.locator(
+                consent_btn = first.locator(
                     'button:has-text("Accept all"), button:has-text("すべて同意"), '
                     'button:has-text("Agree"), button:has-text("同意")'
                 )
@@ -93,41 +154,77 @@ class YoutubeCollector(BaseCollector):
             except Exception:
                 pass
 
+            self._tabs = asyncio.Queue()
+            self._tabs.put_nowait(first)
+            for _ in range(TAB_POOL_SIZE - 1):
+                self._tabs.put_nowait(await self._ctx.new_page())
+
     async def close(self):
         """브라우저 종료."""
         if self._browser:
             await self._browser.close()
+            await self._pw.stop()
             self._browser = None
-            self._page = None
+            self._ctx = None
+            self._tabs = None
+
+    @asynccontextmanager
+    async def _tab(self):
+        """탭 풀에서 탭 1개 대여."""
+        page = await self._tabs.get()
+        try:
+            yield page
+        finally:
+            self._tabs.put_nowait(page)
 
     async def collect_all(self, works):
-        """오버라이드: 브라우저 시작/종료 래핑."""
+        """오버라이드: 브라우저 시작/종료 래핑 + 소요 시간 요약."""
         try:
             await self._ensure_browser()
             return await super().collect_all(works)
         finally:
             await self.close()
-
-    async def collect_one(self, title: str, platform: str) -> bool:
+            self.logger.info(f"[youtube] {self.timing_summary()}")
+
+    def timing_summary(self) -> str:
+        if not self._timings:
+            return "⏱️ 처리한 작품 없음"
+        t = sorted(self._timings)
+        p50 = t[len(t) // 2]
+        p90 = t[min(len(t) - 1, int(len(t) * 0.9))]
+        return (f"⏱️ 작품 {len(t)}개: 평균 {sum(t) / len(t):.1f}s, "
+                f"p50 {p50:.1f}s, p90 {p90:.1f}s, 최대 {t[-1]:.1f}s "
+                f"(검색 페이지 {self.search_pages}, 영상 페이지 {self.video_pages})")
+
+    async def collect_one(self, title: str, platform: str) -> Optional[bool]:
         if self._collected >= self.max_titles:
-            return False
+            return None  # 한도 초과 — 조회 안 함 (시도 기록 안 남김)
+        start = time.monotonic()
+        try:
+            return await self._collect_title(title, platform)
+        finally:
+            self._timings.append(time.monotonic() - start)
 
+    async def _collect_title(self, title: str, platform: str) -> Optional[bool]:
         cached_id = get_cached_external_id(title, 'youtube')
 
-        if cached_id and cached_id != 'NOT_FOUND':
-            # 캐시된 video ID가 있으면 개별 영상 페이지에서 조회수 수집
-            video_ids = cached_id.split(',')
-            stats = await self._get_stats_from_pages(video_ids[:3])
+        if cached_id == 'NOT_FOUND':
+            return False
+
+        if cached_id:
+            # 캐시된 영상은 검색 없이 영상 페이지에서 바로 조회수
+            videos = [{'id': vid, 'views': None} for vid in cached_id.split(',')[:3]]
+            await self._fill_missing_views(videos)
+            stats = [{'viewCount': v['views']} for v in videos if v.get('views')]
             if stats:
                 self._save_metrics(title, stats)
                 return True
             return False
 
-        if cached_id == 'NOT_FOUND':
-            return False
-
-        # 새로 검색
+        # 미캐시 타이틀은 검색 페이지 1회로 ID/제목/조회수 확보
         results = await self._search_youtube(title)
+        if results is None:
+            return None  # 검색 오류 — NOT_FOUND로 캐시하지 않음
 
         if not results:
             # 찾지 못함 — NOT_FOUND 캐시
@@ -147,7 +244,8 @@ class YoutubeCollector(BaseCollector):
         )
         self._collected += 1
 
-        # 검색 결과에서 이미 조회수를 얻었으므로 바로 저장
+        # 검색 페이로드에 조회수가 없는 영상만 영상 페이지에서 보충
+        await self._fill_missing_views(results)
         views = [r['views'] for r in results if r.get('views')]
         if views:
             metrics = {
@@ -160,77 +258,43 @@ class YoutubeCollector(BaseCollector):
 
         return False
 
-    async def _search_youtube(self, title: str) -> List[Dict]:
-        """YouTube에서 PV 검색, 상위 결과 반환."""
-        page = self._page
-        if not page:
-            return []
-
+    async def _search_youtube(self, title: str) -> Optional[List[Dict]]:
+        """YouTube에서 PV 검색 → ytInitialData에서 상위 결과 추출. 오류면 None."""
         query = f'{title} PV 公式'
         search_url = f'https://www.youtube.com/results?search_query={_url_encode(query)}'
 
         try:
-            await page.goto(search_url, wait_until='domcontentloaded', timeout=15000)
-            await asyncio.sleep(3)
-
-            # 검색 결과에서 비디오 정보 추출
-            results = await page.evaluate('''() => {
-                const videos = [];
-                const items = document.querySelectorAll('ytd-video-renderer');
-                for (let i = 0; i < Math.min(items.length, 5); i++) {
-                    const item = items[i];
-                    const titleEl = item.querySelector('#video-title');
-                    const metaEl = item.querySelector('#metadata-line span');
-                    const linkEl = item.querySelector('a#video-title');
-
-                    let videoId = '';
-                    if (linkEl) {
-                        const href = linkEl.getAttribute('href') || '';
-                        const match = href.match(/v=([^&]+)/);
-                        if (match) videoId = match[1];
-                    }
-
-                    videos.push({
-                        title: titleEl ? titleEl.textContent.trim() : '',
-                        views_text: metaEl ? metaEl.textContent.trim() : '',
-                        id: videoId,
-                    });
-                }
-                return videos;
-            }''')
-
-            # 조회수 파싱
-            parsed = []
-            for r in results:
-                if not r.get('id'):
-                    continue
-                views = parse_view_count(r.get('views_text', ''))
-                parsed.append({
-                    'id': r['id'],
-                    'title': r.get('title', ''),
-                    'views': views,
-                })
-
-            return parsed
+            async with self._tab() as page:
+                self.search_pages += 1
+                await page.goto(search_url, wait_until='domcontentloaded', timeout=15000)
+                data = await page.evaluate('() => window.ytInitialData || null')
+            return extract_search_videos(data)
 
         except Exception as e:
             logger.warning(f"YouTube search error for '{title[:30]}': {e}")
-            return []
-
-    async def _get_stats_from_pages(self, video_ids: List[str]) -> List[Dict]:
-        """개별 비디오 페이지에서 조회수 수집 (캐시된 ID 재수집용)."""
-        page = self._page
-        if not page:
-            return []
-
-        stats = []
-        for vid in video_ids:
-            try:
-                url = f'https://www.youtube.com/watch?v={vid}'
+            return None
+
+    async def _fill_missing_views(self, videos: List[Dict]):
+        """views가 없는 영상만 영상 페이지에서 조회수 보충 (탭 풀에서 병렬)."""
+        missing = [v for v in videos if not v.get('views')]
+        if not missing:
+            return
+        counts = await asyncio.gather(*(self._get_video_views(v['id']) for v in missing))
+        for v, views in zip(missing, counts):
+            v['views'] = views
+
+    async def _get_video_views(self, video_id: str) -> Optional[int]:
+        """영상 페이지의 ytInitialPlayerResponse(없으면 화면 텍스트)에서 조회수."""
+        try:
+            async with self._tab() as page:
+                self.video_pages += 1
+                url = f'https://www.youtube.com/watch?v={video_id}'
                 await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-                await asyncio.sleep(2)
 
                 view_text = await page.evaluate('''() => {
+                    const details = (window.ytInitialPlayerResponse || {}).videoDetails;
+                    if (details && details.viewCount) return details.viewCount;
+
                     // 조회수 텍스트 찾기
                     const infoEl = document.querySelector(
                         '#count .ytd-video-primary-info-renderer, ' +
@@ -249,13 +313,9 @@ class YoutubeCollector(BaseCollector):
                     return '';
                 }''')
 
-                views = parse_view_count(view_text)
-                if views:
-                    stats.append({'viewCount': views})
-            except Exception:
-                continue
-
-        return stats
+            return parse_view_count(view_text)
+        except Exception:
+            return None
 
     def _save_metrics(self, title: str, stats: List[Dict]):
         total = sum(s.get('viewCount', 0) for s in stats)
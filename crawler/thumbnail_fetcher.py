@@ -0,0 +1,324 @@
+"""
+썸네일 일괄 수집기 (비동기, 크롤링 후처리 단계)
+
+works.thumbnail_url → 다운로드 → 표시 크기로 리사이즈/재인코딩 → blob 저장소
+(crawler/thumbnail_store.py) → works.thumbnail_hash 배치 커밋
+(postgres 저장소면 blob 행도 같은 배치 트랜잭션에서 함께 insert)
+
+- aiohttp 세션 1개 (keep-alive 커넥션 풀 공유)
+- 호스트(CDN)별 동시 요청 상한 (HOST_LIMITS, 기본 DEFAULT_PER_HOST)
+- 429/5xx/타임아웃은 지수 백오프 재시도 (Retry-After 존중)
+- 이미 받은 URL은 ETag/Last-Modified 조건부 요청 → 304면 재처리 생략
+- 리사이즈/재인코딩은 프로세스 풀에서 (이벤트 루프 블로킹 방지)
+- DB 반영은 BATCH_SIZE개씩 execute_values 한 번에
+
+사용 예:
+    from crawler.thumbnail_fetcher import run_thumbnail_fetcher
+    stats = asyncio.run(run_thumbnail_fetcher())
+"""
+
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import psycopg2.extras
+
+from crawler.db import get_db_connection
+from crawler.thumbnail_store import PostgresBlobBackend, content_hash, detect_mime, get_store
+
+# 대시보드 표시 크기(최대 100×140, title-hero)의 2배 — 고해상도 화면 대응
+DISPLAY_SIZE = (200, 280)
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+DEFAULT_PER_HOST = 4
+# 도메인 접미사 → 동시 요청 수 (기본값과 다르게 둘 CDN만)
+HOST_LIMITS: Dict[str, int] = {}
+TOTAL_CONNECTIONS = 32
+
+MAX_RETRIES = 3
+BATCH_SIZE = 100
+MIN_IMAGE_BYTES = 100  # 이보다 작으면 빈 응답/에러 페이지로 간주
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+}
+
+
+@dataclass
+class ThumbnailJob:
+    platform: str
+    title: str
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def normalize_image(data: bytes) -> bytes:
+    """
+    표시 크기로 축소 + WebP(미지원 시 JPEG) 재인코딩
+    (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+
+    재인코딩 결과가 원본보다 크면 원본 그대로 반환.
+    """
+    from PIL import Image, features
+
+    with Image.open(BytesIO(data)) as img:
+        img.load()
+        resized = img.width > DISPLAY_SIZE[0] or img.height > DISPLAY_SIZE[1]
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        img.thumbnail(DISPLAY_SIZE, Image.LANCZOS)
+
+        out = BytesIO()
+        if features.check('webp'):
+            img.save(out, 'WEBP', quality=WEBP_QUALITY, method=4)
+        else:
+            img.convert('RGB').save(out, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+
+    encoded = out.getvalue()
+    if not resized and len(encoded) >= len(data):
+        return data
+    return encoded
+
+
+def _host_limit(host: str) -> int:
+    for suffix, limit in HOST_LIMITS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return limit
+    return DEFAULT_PER_HOST
+
+
+def load_jobs(platform: Optional[str] = None, refresh: bool = False) -> List[ThumbnailJob]:
+    """
+    수집 대상 조회
+
+    - 썸네일 없음 → 신규 다운로드
+    - 받았던 URL과 현재 thumbnail_url이 다름 → 신규 다운로드 (조건부 헤더 없이)
+    - refresh=True면 검증자(ETag/Last-Modified)가 있는 작품도 조건부 재요청
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT platform, title, thumbnail_url,
+               thumbnail_hash IS NOT NULL AND thumbnail_fetched_url = thumbnail_url AS known,
+               thumbnail_etag, thumbnail_last_modified
+        FROM works
+        WHERE thumbnail_url IS NOT NULL AND thumbnail_url != ''
+          AND (%(platform)s IS NULL OR platform = %(platform)s)
+          AND (
+              thumbnail_hash IS NULL
+              OR (thumbnail_fetched_url IS NOT NULL AND thumbnail_fetched_url != thumbnail_url)
+              OR (%(refresh)s AND thumbnail_fetched_url = thumbnail_url
+                  AND (thumbnail_etag IS NOT NULL OR thumbnail_last_modified IS NOT NULL))
+          )
+        ORDER BY platform, title
+    ''', {'platform': platform, 'refresh': refresh})
+    jobs = [
+        ThumbnailJob(p, t, url, etag if known else None, lm if known else None)
+        for p, t, url, known, etag, lm in cursor.fetchall()
+    ]
+    conn.close()
+    return jobs
+
+
+class ThumbnailFetcher:
+    """
+    Args:
+        executor: 리사이즈/재인코딩 실행기 (None이면 이벤트 루프 기본 스레드 풀)
+        quiet: 진행 로그 생략 (대시보드 온디맨드 호출용)
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, quiet: bool = False):
+        self.executor = executor
+        self.quiet = quiet
+        self.store = get_store()
+        # postgres 저장소: 이미지마다 연결/커밋하지 않고 blob을 모아 flush 때 함께 저장
+        self._buffer_blobs = isinstance(self.store.backend, PostgresBlobBackend)
+        self._pending_blobs: Dict[str, tuple] = {}
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._pending: List[tuple] = []
+        self._flush_lock = asyncio.Lock()
+        self.stats = {'fetched': 0, 'not_modified': 0, 'failed': 0, 'errors': 0, 'retries': 0,
+                      'bytes_in': 0, 'bytes_out': 0}
+
+    def _log(self, msg: str):
+        if not self.quiet:
+            print(msg)
+
+    def _sem(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).hostname or ''
+        if host not in self._host_sems:
+            self._host_sems[host] = asyncio.Semaphore(_host_limit(host))
+        return self._host_sems[host]
+
+    async def _download(self, session: aiohttp.ClientSession, job: ThumbnailJob):
+        """
+        Returns:
+            (status, body, etag, last_modified) — status 304면 body None, 실패면 None
+        """
+        headers = {}
+        if job.etag:
+            headers['If-None-Match'] = job.etag
+        if job.last_modified:
+            headers['If-Modified-Since'] = job.last_modified
+
+        for attempt in range(MAX_RETRIES + 1):
+            delay = None
+            try:
+                async with self._sem(job.url):
+                    async with session.get(job.url, headers=headers) as resp:
+                        if resp.status == 304:
+                            return 304, None, job.etag, job.last_modified
+                        if resp.status == 200:
+                            body = await resp.read()
+                            if len(body) < MIN_IMAGE_BYTES:
+                                return None
+                            return (200, body, resp.headers.get('ETag'),
+                                    resp.headers.get('Last-Modified'))
+                        if resp.status != 429 and resp.status < 500:
+                            return None  # 404 등은 재시도해도 같음
+                        retry_after = resp.headers.get('Retry-After', '')
+                        if retry_after.isdigit():
+                            delay = min(int(retry_after), 60)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+            if attempt < MAX_RETRIES:
+                self.stats['retries'] += 1
+                await asyncio.sleep(delay if delay is not None
+                                    else 2 ** attempt + random.uniform(0, 0.5))
+        return None
+
+    async def _process(self, session: aiohttp.ClientSession, job: ThumbnailJob):
+        """작업 1개 — 저장소/DB 오류도 여기서 집계 (다른 작업은 계속 진행)"""
+        try:
+            await self._process_job(session, job)
+        except Exception as e:
+            self.stats['failed'] += 1
+            self.stats['errors'] += 1
+            if self.stats['errors'] <= 5:
+                self._log(f"   ❌ {job.platform} {job.title[:30]}: {e}")
+
+    async def _process_job(self, session: aiohttp.ClientSession, job: ThumbnailJob):
+        result = await self._download(session, job)
+        if result is None:
+            self.stats['failed'] += 1
+            return
+        status, body, etag, last_modified = result
+        if status == 304:
+            self.stats['not_modified'] += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            image = await loop.run_in_executor(self.executor, normalize_image, body)
+        except Exception:
+            image = body  # 디코드 불가 포맷은 원본 보관 (브라우저가 처리)
+        if self._buffer_blobs:
+            thumb_hash = content_hash(image)
+            self._pending_blobs[thumb_hash] = (thumb_hash, detect_mime(image), image)
+        else:
+            thumb_hash = await asyncio.to_thread(self.store.put, image)
+
+        self.stats['fetched'] += 1
+        self.stats['bytes_in'] += len(body)
+        self.stats['bytes_out'] += len(image)
+        self._pending.append((job.platform, job.title, thumb_hash, job.url, etag, last_modified))
+        if len(self._pending) >= BATCH_SIZE:
+            await self._flush()
+
+    async def _flush(self):
+        async with self._flush_lock:
+            rows, self._pending = self._pending, []
+            blobs = [self._pending_blobs.pop(r[2]) for r in rows if r[2] in self._pending_blobs]
+            if not rows:
+                return
+            try:
+                await asyncio.to_thread(self._write_batch, rows, blobs)
+            except Exception as e:
+                # 반영 못 한 행은 저장 성공에서 빼고 실패로 집계 (다음 실행에서 다시 대상)
+                self.stats['fetched'] -= len(rows)
+                self.stats['failed'] += len(rows)
+                self.stats['errors'] += 1
+                self._log(f"   ❌ {len(rows)}개 DB 반영 실패: {e}")
+                return
+            self._log(f"   💾 {len(rows)}개 반영 (누적 {self.stats['fetched']})")
+
+    @staticmethod
+    def _write_batch(rows: List[tuple], blobs: List[tuple]):
+        """blob insert + 해시 UPDATE를 한 트랜잭션으로 (연결/커밋 배치당 1회)"""
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            if blobs:
+                PostgresBlobBackend.insert_many(cursor, blobs)
+            psycopg2.extras.execute_values(cursor, '''
+                UPDATE works w SET
+                    thumbnail_hash = v.hash,
+                    thumbnail_fetched_url = v.url,
+                    thumbnail_etag = v.etag,
+                    thumbnail_last_modified = v.last_modified,
+                    updated_at = NOW()
+                FROM (VALUES %s) AS v(platform, title, hash, url, etag, last_modified)
+                WHERE w.platform = v.platform AND w.title = v.title
+            ''', rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+    async def run(self, jobs: List[ThumbnailJob]) -> Dict[str, int]:
+        if not jobs:
+            return self.stats
+        connector = aiohttp.TCPConnector(limit=TOTAL_CONNECTIONS, ssl=False)
+        timeout = aiohttp.ClientTimeout(total=30, sock_connect=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=HEADERS) as session:
+            await asyncio.gather(*(self._process(session, job) for job in jobs))
+        await self._flush()
+        return self.stats
+
+
+async def run_thumbnail_fetcher(platform: Optional[str] = None, refresh: bool = False,
+                                workers: Optional[int] = None,
+                                quiet: bool = False) -> Dict[str, int]:
+    """
+    썸네일 일괄 수집 (crawler/main.py 후처리 단계, scripts/download_thumbnails.py)
+
+    Args:
+        platform: 특정 플랫폼만 (None이면 전체)
+        refresh: 이미 받은 썸네일도 조건부 요청으로 변경 확인
+        workers: 리사이즈 프로세스 수 (None이면 CPU 수, 0이면 프로세스 풀 없이 스레드)
+        quiet: 진행 로그 생략
+    """
+    start = time.time()
+    jobs = await asyncio.to_thread(load_jobs, platform, refresh)
+    if not quiet:
+        print(f"🖼️  썸네일 수집 대상: {len(jobs)}개")
+    if not jobs:
+        return {'fetched': 0, 'not_modified': 0, 'failed': 0, 'errors': 0, 'retries': 0}
+
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    try:
+        fetcher = ThumbnailFetcher(executor=executor, quiet=quiet)
+        stats = await fetcher.run(jobs)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    if not quiet:
+        saved = (1 - stats['bytes_out'] / stats['bytes_in']) * 100 if stats['bytes_in'] else 0
+        print(f"   ✅ 저장 {stats['fetched']} / 변경 없음 {stats['not_modified']} / "
+              f"실패 {stats['failed']} (오류 {stats['errors']}건, 재시도 {stats['retries']}회, "
+              f"용량 -{saved:.0f}%, {time.time() - start:.1f}초)")
+    return stats
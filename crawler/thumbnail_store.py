@@ -0,0 +1,203 @@
+"""
+썸네일 blob 저장소 (콘텐츠 해시 주소 방식)
+
+works / unified_works 행에는 이미지 바이트의 SHA-256(hex)만 thumbnail_hash로 저장하고,
+이미지 자체는 해시를 키로 blob 저장소에 한 번만 보관한다 (플랫폼 간 같은 표지 중복 제거).
+
+백엔드 (환경변수 THUMBNAIL_STORE로 선택 — dashboard-next/app/api/thumbnail/route.ts와 같은 스위치):
+- 'postgres' (기본): thumbnail_blobs 테이블 (hash, mime, data BYTEA)
+  → 원격 대시보드(dashboard-next)도 DB만으로 이미지를 읽을 수 있음
+- 'local': THUMBNAIL_STORE_DIR (기본 data/thumbnails) 아래 <해시 앞 2자리>/<해시>
+  → 크롤러와 대시보드가 같은 디스크를 볼 때만 사용 (양쪽에 같은 값 설정)
+
+사용 예:
+    from crawler.thumbnail_store import get_store
+    h = get_store().put(image_bytes)
+    data, mime = get_store().get(h)
+"""
+
+import base64
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+project_root = Path(__file__).parent.parent
+load_dotenv(project_root / '.env')
+
+DEFAULT_KIND = 'postgres'
+DEFAULT_DIR = project_root / 'data' / 'thumbnails'
+
+
+def detect_mime(data: bytes) -> str:
+    """매직 바이트로 이미지 MIME 판별"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'image/png'
+    if data[:2] == b'\xff\xd8':
+        return 'image/jpeg'
+    if data[:4] == b'GIF8':
+        return 'image/gif'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'  # fallback
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def decode_data_uri(uri: str) -> Optional[bytes]:
+    """'data:image/...;base64,...' → 바이트 (형식이 아니면 None)"""
+    if not uri or not uri.startswith('data:') or ';base64,' not in uri:
+        return None
+    try:
+        return base64.b64decode(uri.split(';base64,', 1)[1])
+    except (ValueError, TypeError):
+        return None
+
+
+def to_data_uri(data: bytes, mime: Optional[str] = None) -> str:
+    return f"data:{mime or detect_mime(data)};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+class LocalBlobBackend:
+    """파일시스템 백엔드: <root>/<해시[:2]>/<해시>"""
+
+    def __init__(self, root: Path = DEFAULT_DIR):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def put(self, key: str, data: bytes, mime: str):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        return data, detect_mime(data)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[bytes, str]]:
+        result = {}
+        for key in keys:
+            blob = self.get(key)
+            if blob:
+                result[key] = blob
+        return result
+
+
+class PostgresBlobBackend:
+    """
+    DB 백엔드: thumbnail_blobs 테이블
+    (scripts/migrate_thumbnail_blobs.py가 생성)
+    """
+
+    def __init__(self, connect: Callable):
+        self.connect = connect
+
+    def exists(self, key: str) -> bool:
+        conn = self.connect()
+        try:
+            cur = conn.cursor()
+            cur.execute('SELECT 1 FROM thumbnail_blobs WHERE hash = %s', (key,))
+            return cur.fetchone() is not None
+        finally:
+            conn.close()
+
+    def put(self, key: str, data: bytes, mime: str):
+        import psycopg2
+
+        conn = self.connect()
+        try:
+            cur = conn.cursor()
+            cur.execute('''
+                INSERT INTO thumbnail_blobs (hash, mime, data, size)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (hash) DO NOTHING
+            ''', (key, mime, psycopg2.Binary(data), len(data)))
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def insert_many(cursor, rows: Iterable[Tuple[str, str, bytes]]):
+        """(hash, mime, data) 여러 개를 호출 측 트랜잭션 안에서 한 번에 저장 (이미 있으면 무시)"""
+        import psycopg2
+        import psycopg2.extras
+
+        psycopg2.extras.execute_values(cursor, '''
+            INSERT INTO thumbnail_blobs (hash, mime, data, size)
+            VALUES %s
+            ON CONFLICT (hash) DO NOTHING
+        ''', [(k, mime, psycopg2.Binary(data), len(data)) for k, mime, data in rows])
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[bytes, str]]:
+        keys = list(set(keys))
+        if not keys:
+            return {}
+        conn = self.connect()
+        try:
+            cur = conn.cursor()
+            cur.execute('SELECT hash, data, mime FROM thumbnail_blobs WHERE hash = ANY(%s)', (keys,))
+            return {h: (bytes(d), m) for h, d, m in cur.fetchall()}
+        finally:
+            conn.close()
+
+
+class ThumbnailStore:
+    """해시 계산 + 중복 제거 + 백엔드 위임"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def put(self, data: bytes, mime: Optional[str] = None) -> str:
+        """이미지 저장 → 콘텐츠 해시 (이미 있으면 쓰기 생략)"""
+        key = content_hash(data)
+        if not self.backend.exists(key):
+            self.backend.put(key, data, mime or detect_mime(data))
+        return key
+
+    def put_data_uri(self, uri: str) -> Optional[str]:
+        data = decode_data_uri(uri)
+        return self.put(data) if data else None
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        return self.backend.get(key) if key else None
+
+    def get_data_uris(self, keys: Iterable[str]) -> Dict[str, str]:
+        """해시 목록 → {해시: data URI} (HTML 임베드용)"""
+        return {k: to_data_uri(data, mime)
+                for k, (data, mime) in self.backend.get_many(k for k in keys if k).items()}
+
+
+_store: Optional[ThumbnailStore] = None
+
+
+def get_store() -> ThumbnailStore:
+    """환경변수 설정에 따른 프로세스 공용 저장소"""
+    global _store
+    if _store is None:
+        kind = os.environ.get('THUMBNAIL_STORE') or DEFAULT_KIND
+        if kind == 'postgres':
+            from crawler.db import get_db_connection
+            backend = PostgresBlobBackend(get_db_connection)
+        elif kind == 'local':
+            backend = LocalBlobBackend(Path(os.environ.get('THUMBNAIL_STORE_DIR') or DEFAULT_DIR))
+        else:
+            raise ValueError(f"unknown THUMBNAIL_STORE: {kind}")
+        _store = ThumbnailStore(backend)
+    return _store
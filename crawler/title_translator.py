@@ -0,0 +1,185 @@
+"""
+제목 번역 워커 풀 (fill_missing_title_kr 전용)
+
+- 스레드 풀로 GoogleTranslator 호출 병렬화 (스레드별 translator 인스턴스)
+- 토큰 버킷으로 전체 요청 속도 제한 (워커 수와 무관하게 초당 N건)
+- 번역 시도 결과를 디스크 캐시에 보관 (거부된 번역 포함)
+  → 다음 실행에서 같은 제목을 다시 번역하지 않음
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+project_root = Path(__file__).parent.parent
+
+CACHE_PATH = project_root / 'data' / 'cache' / 'translation_cache.json'
+
+# 기본 설정
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 3.0          # 초당 요청 수
+DEFAULT_BURST = 5           # 버킷 용량
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0      # 재시도 대기 (지수 증가)
+REJECT_RETRY_DAYS = 30      # 번역 불량(거부) 제목은 이 기간 지나면 재시도
+FAILED_RETRY_DAYS = 1       # 요청 실패(일시 오류) 제목은 다음 날 재시도
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate: 초당 토큰 보충량, capacity: 최대 버스트)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개 획득 (없으면 보충될 때까지 대기)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class TranslationCache:
+    """
+    번역 시도 캐시 (JSON 파일)
+
+    {원문: {"kr": 번역문, "status": "ok"|"rejected"|"failed", "at": ISO 시각}}
+    """
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = path
+        self._data: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            print(f"⚠️  {path.name} 파싱 실패. 빈 캐시 사용")
+
+    def should_skip(self, title: str) -> bool:
+        """이미 시도한 제목인지 (거부는 REJECT_RETRY_DAYS, 실패는 FAILED_RETRY_DAYS 경과 시 재시도)"""
+        entry = self._data.get(title)
+        if not entry:
+            return False
+        if entry.get('status') == 'ok':
+            return True
+        try:
+            at = datetime.fromisoformat(entry.get('at', ''))
+        except ValueError:
+            return False
+        days = FAILED_RETRY_DAYS if entry.get('status') == 'failed' else REJECT_RETRY_DAYS
+        return datetime.now() - at < timedelta(days=days)
+
+    def get(self, title: str) -> Optional[Dict[str, str]]:
+        return self._data.get(title)
+
+    def put(self, title: str, kr: str, status: str):
+        with self._lock:
+            self._data[title] = {
+                'kr': kr,
+                'status': status,
+                'at': datetime.now().isoformat(timespec='seconds'),
+            }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            snapshot = dict(sorted(self._data.items()))
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        tmp.replace(self.path)
+
+
+class TranslationPool:
+    """
+    rate-limited 번역 워커 풀
+
+    Args:
+        make_translator: 스레드별 translator 생성 함수 (translate(text) 메서드 보유)
+        validate: (kr, jp) → 검증 통과 시 kr, 불량이면 '' (validate_title_kr 시그니처)
+        workers: 동시 워커 수
+        rate: 초당 요청 수 (전 워커 합계)
+    """
+
+    def __init__(self, make_translator: Callable, validate: Callable[[str, str], str],
+                 cache: Optional[TranslationCache] = None,
+                 workers: int = DEFAULT_WORKERS, rate: float = DEFAULT_RATE,
+                 burst: int = DEFAULT_BURST):
+        self.make_translator = make_translator
+        self.validate = validate
+        self.cache = cache or TranslationCache()
+        self.workers = workers
+        self.bucket = TokenBucket(rate, burst)
+        self._local = threading.local()
+        self.stats = {'ok': 0, 'rejected': 0, 'failed': 0, 'cached': 0}
+        self._stats_lock = threading.Lock()
+
+    def _record(self, jp: str, kr: str, status: str):
+        self.cache.put(jp, kr, status)
+        with self._stats_lock:
+            self.stats[status] += 1
+
+    def _translator(self):
+        t = getattr(self._local, 'translator', None)
+        if t is None:
+            t = self.make_translator()
+            self._local.translator = t
+        return t
+
+    def _translate_one(self, jp: str) -> str:
+        """제목 1개 번역 (재시도 포함). 검증 통과한 번역문 또는 '' 반환."""
+        for retry in range(MAX_RETRIES):
+            self.bucket.acquire()
+            try:
+                kr = self._translator().translate(jp) or ''
+            except Exception as e:
+                print(f"  ⚠️  번역 오류 (재시도 {retry+1}/{MAX_RETRIES}): {jp[:30]} — {e}")
+                time.sleep(RETRY_BASE_DELAY * (2 ** retry))
+                continue
+
+            if kr and self.validate(kr, jp):
+                self._record(jp, kr, 'ok')
+                return kr
+            self._record(jp, kr, 'rejected')
+            if kr:
+                print(f"  ⚠️  번역 불량 스킵: {jp} → {kr[:30]}")
+            return ''
+
+        self._record(jp, '', 'failed')
+        return ''
+
+    def filter_uncached(self, titles: List[str]) -> List[str]:
+        """캐시에 이미 시도 기록이 있는 제목 제외"""
+        todo = [t for t in titles if not self.cache.should_skip(t)]
+        self.stats['cached'] += len(titles) - len(todo)
+        return todo
+
+    def translate(self, titles: List[str]) -> Dict[str, str]:
+        """제목 목록 병렬 번역 → {jp: kr} (검증 통과분만)"""
+        result = {}
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix='translate') as pool:
+            futures = {pool.submit(self._translate_one, jp): jp for jp in titles}
+            for fut in as_completed(futures):
+                kr = fut.result()
+                if kr:
+                    result[futures[fut]] = kr
+        return result
@@ -8,7 +8,7 @@
 import json
 import os
 import re
-import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -288,9 +288,27 @@ def is_riverse_title(jp_title: str) -> bool:
     return False
 
 
+# 장르 번역기 사전 컴파일 (GENRE_TRANSLATIONS는 모듈 로드 후 변경하지 않음)
+# 부분 매칭은 딕셔너리 선언 순서상 첫 매칭 우선 → 순서 보존 튜플로 고정
+_GENRE_PARTIAL = tuple(GENRE_TRANSLATIONS.items())
+
+
+@lru_cache(maxsize=4096)
+def _translate_genre_segment(genre: str) -> str:
+    """단일 장르 세그먼트 번역 (정확 → 부분 → 원문 유지)"""
+    kr = GENRE_TRANSLATIONS.get(genre)
+    if kr is not None:
+        return kr
+    for jp, kr in _GENRE_PARTIAL:
+        if jp in genre:
+            return kr
+    return genre
+
+
+@lru_cache(maxsize=4096)
 def translate_genre(jp_genre: str) -> str:
     """
-    일본어 장르 → 한국어 번역
+    일본어 장르 → 한국어 번역 (LRU 메모이제이션)
 
     Args:
         jp_genre: 일본어 장르 (예: "ファンタジー" 또는 "ファンタジー / アクション")
@@ -301,44 +319,34 @@ def translate_genre(jp_genre: str) -> str:
     if not jp_genre:
         return ""
 
-    # 복합 장르 처리 (예: "ファンタジー / アクション")
-    if ' / ' in jp_genre or '/' in jp_genre:
-        # "/" 또는 " / "로 분리
+    # 복합 장르 처리 (예: "ファンタジー / アクション") — " / " 우선, 없으면 "/"로 분리
+    if '/' in jp_genre:
         separator = ' / ' if ' / ' in jp_genre else '/'
-        genres = jp_genre.split(separator)
-        translated = []
-
-        for genre in genres:
-            genre = genre.strip()
-            if genre in GENRE_TRANSLATIONS:
-                translated.append(GENRE_TRANSLATIONS[genre])
-            else:
-                # 부분 매칭 시도
-                found = False
-                for jp, kr in GENRE_TRANSLATIONS.items():
-                    if jp in genre:
-                        translated.append(kr)
-                        found = True
-                        break
-                if not found:
-                    translated.append(genre)  # 원문 유지
-
-        return ' / '.join(translated)
+        return ' / '.join(
+            _translate_genre_segment(g.strip()) for g in jp_genre.split(separator)
+        )
 
     # 단일 장르
-    jp_genre = jp_genre.strip()
+    return _translate_genre_segment(jp_genre.strip())
 
-    # 정확한 매칭
-    if jp_genre in GENRE_TRANSLATIONS:
-        return GENRE_TRANSLATIONS[jp_genre]
 
-    # 부분 매칭
-    for jp, kr in GENRE_TRANSLATIONS.items():
-        if jp in jp_genre:
-            return kr
+def translate_genre_series(genres):
+    """
+    pandas Series 장르 컬럼 일괄 번역 (고유값만 번역 후 매핑)
+
+    Args:
+        genres: 일본어 장르 Series (NaN/None은 빈 문자열로 처리)
+
+    Returns:
+        같은 index의 한국어 장르 Series
+    """
+    import pandas as pd
 
-    # 매칭 실패 - 원문 그대로
-    return jp_genre
+    codes, uniques = pd.factorize(genres, use_na_sentinel=True)
+    translated = [translate_genre(g) if isinstance(g, str) else '' for g in uniques]
+    # NaN(-1 코드)은 마지막에 붙인 '' 로 매핑
+    lookup = pd.Series(translated + [''], dtype=object)
+    return pd.Series(lookup.values[codes], index=genres.index, dtype=object)
 
 
 def _extract_json(text: str) -> dict:
@@ -364,13 +372,48 @@ def _extract_json(text: str) -> dict:
     return {}
 
 
-def fill_missing_title_kr():
+def _apply_title_kr_batch(cur, translations: dict) -> tuple:
+    """
+    {jp: kr}를 works + rankings의 빈 title_kr에 한 번에 반영.
+    unnest 배열 조인 UPDATE 1문장 (제목별 UPDATE 반복 대신)
+
+    Returns:
+        (works 갱신 행 수, rankings 갱신 행 수)
+    """
+    if not translations:
+        return 0, 0
+    jps = list(translations.keys())
+    krs = [translations[jp] for jp in jps]
+    cur.execute("""
+        WITH v AS (
+            SELECT * FROM unnest(%s::text[], %s::text[]) AS v(title, title_kr)
+        ), w AS (
+            UPDATE works SET title_kr = v.title_kr
+            FROM v
+            WHERE works.title = v.title AND (works.title_kr IS NULL OR works.title_kr = '')
+            RETURNING 1
+        ), r AS (
+            UPDATE rankings SET title_kr = v.title_kr
+            FROM v
+            WHERE rankings.title = v.title AND (rankings.title_kr IS NULL OR rankings.title_kr = '')
+            RETURNING 1
+        )
+        SELECT (SELECT COUNT(*) FROM w), (SELECT COUNT(*) FROM r)
+    """, (jps, krs))
+    return cur.fetchone()
+
+
+def fill_missing_title_kr(workers: int = 4, rate: float = 3.0):
     """
     크롤링 후 title_kr 누락 작품 자동 번역.
     1. DB에서 title_kr 빈 고유 제목 수집
-    2. 기존 매핑으로 복구 가능한 것 먼저 적용
-    3. 나머지는 Claude API로 배치 번역
-    4. title_mappings.json + DB(works, rankings) 업데이트
+    2. 기존 매핑 / 번역 캐시로 복구 가능한 것 먼저 적용
+    3. 나머지는 Google Translate 워커 풀로 병렬 번역 (토큰 버킷 속도 제한)
+    4. title_mappings.json + DB(works, rankings) 배치 단위 업데이트
+
+    Args:
+        workers: 동시 번역 워커 수
+        rate: 초당 번역 요청 수 (전 워커 합계)
     """
     try:
         from deep_translator import GoogleTranslator
@@ -387,6 +430,7 @@ def fill_missing_title_kr():
         return
 
     import psycopg2
+    from crawler.title_translator import TranslationCache, TranslationPool
 
     # 1. DB에서 title_kr 누락 제목 수집
     conn = psycopg2.connect(db_url)
@@ -405,12 +449,16 @@ def fill_missing_title_kr():
 
     print(f"\n🔤 title_kr 누락: {len(missing)}개")
 
-    # 2. 기존 매핑으로 복구
-    mappings = load_title_mappings()
+    # 2. 기존 매핑 + 번역 캐시(이전 실행에서 통과한 번역)로 복구
+    cache = TranslationCache()
     already_mapped = {}
     still_missing = []
     for t in missing:
         kr = get_korean_title(t)
+        if not kr:
+            entry = cache.get(t)
+            if entry and entry.get('status') == 'ok':
+                kr = entry['kr']
         if kr:
             already_mapped[t] = kr
         else:
@@ -420,9 +468,7 @@ def fill_missing_title_kr():
         print(f"  🔄 기존 매핑 복구: {len(already_mapped)}개")
         conn = psycopg2.connect(db_url)
         cur = conn.cursor()
-        for jp, kr in already_mapped.items():
-            cur.execute("UPDATE works SET title_kr=%s WHERE title=%s AND (title_kr IS NULL OR title_kr='')", (kr, jp))
-            cur.execute("UPDATE rankings SET title_kr=%s WHERE title=%s AND (title_kr IS NULL OR title_kr='')", (kr, jp))
+        _apply_title_kr_batch(cur, already_mapped)
         conn.commit()
         conn.close()
 
@@ -430,52 +476,33 @@ def fill_missing_title_kr():
         print("✅ 모든 title_kr 복구 완료")
         return
 
-    print(f"  🌐 Google Translate 번역 필요: {len(still_missing)}개")
+    # 3. 워커 풀 병렬 번역 (매 배치 후 즉시 저장)
+    pool = TranslationPool(
+        make_translator=lambda: GoogleTranslator(source='ja', target='ko'),
+        validate=validate_title_kr,
+        cache=cache, workers=workers, rate=rate,
+    )
+    todo = pool.filter_uncached(still_missing)
+    if pool.stats['cached']:
+        print(f"  ⏭️  이전 시도 기록(거부/실패) 스킵: {pool.stats['cached']}개")
+    print(f"  🌐 Google Translate 번역 필요: {len(todo)}개 (워커 {workers}, {rate}/s)")
 
-    # 3. GoogleTranslator 개별 번역 (매 배치 후 즉시 저장)
-    translator = GoogleTranslator(source='ja', target='ko')
     BATCH = 50
     total_translated = 0
     mappings_path = project_root / 'data' / 'title_mappings.json'
 
-    for i in range(0, len(still_missing), BATCH):
-        batch = still_missing[i:i+BATCH]
-        result = {}
+    for i in range(0, len(todo), BATCH):
+        batch = todo[i:i+BATCH]
+        validated = pool.translate(batch)
 
-        for jp in batch:
-            for retry in range(3):
-                try:
-                    kr = translator.translate(jp)
-                    if kr:
-                        result[jp] = kr
-                    break
-                except Exception as e:
-                    print(f"  ⚠️  번역 오류 (재시도 {retry+1}/3): {jp[:30]} — {e}")
-                    time.sleep(2)
-
-        # 번역 결과 품질 검증
-        validated = {}
-        for jp, kr in result.items():
-            if not kr:
-                continue
-            if validate_title_kr(kr, jp):
-                validated[jp] = kr
-            else:
-                print(f"  ⚠️  번역 불량 스킵: {jp} → {kr[:30]}")
-
-        # 즉시 DB 저장
+        # 즉시 DB 저장 (배치당 UPDATE 1문장)
         conn = psycopg2.connect(db_url)
         cur = conn.cursor()
-        w_count = r_count = 0
-        for jp, kr in validated.items():
-            cur.execute("UPDATE works SET title_kr=%s WHERE title=%s AND (title_kr IS NULL OR title_kr='')", (kr, jp))
-            w_count += cur.rowcount
-            cur.execute("UPDATE rankings SET title_kr=%s WHERE title=%s AND (title_kr IS NULL OR title_kr='')", (kr, jp))
-            r_count += cur.rowcount
+        w_count, r_count = _apply_title_kr_batch(cur, validated)
         conn.commit()
         conn.close()
 
-        # 즉시 매핑 JSON 저장
+        # 즉시 매핑 JSON + 번역 캐시 저장
         with open(mappings_path, 'r', encoding='utf-8') as f:
             current_mappings = json.load(f)
         added = 0
@@ -486,15 +513,13 @@ def fill_missing_title_kr():
         sorted_m = dict(sorted(current_mappings.items()))
         with open(mappings_path, 'w', encoding='utf-8') as f:
             json.dump(sorted_m, f, ensure_ascii=False, indent=2)
+        cache.save()
 
         total_translated += len(validated)
-        skipped = len(result) - len(validated)
-        skip_msg = f" / 불량 스킵: {skipped}" if skipped else ""
+        skipped = len(batch) - len(validated)
+        skip_msg = f" / 불량·실패 스킵: {skipped}" if skipped else ""
         print(f"  ✅ 배치 {i//BATCH+1}: {len(validated)}개 번역 / DB: w{w_count} r{r_count} / 매핑: +{added}{skip_msg}")
 
-        if i + BATCH < len(still_missing):
-            time.sleep(1)
-
     # 매핑 캐시 무효화
     global _title_mappings
     _title_mappings = None
@@ -509,7 +534,8 @@ def fill_missing_title_kr():
             print(f"     ... 외 {len(bad_report) - 10}개")
     clear_bad_title_kr_report()
 
-    print(f"  📊 총 {total_translated}개 번역 완료")
+    st = pool.stats
+    print(f"  📊 총 {total_translated}개 번역 완료 (거부 {st['rejected']} / 실패 {st['failed']})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+"""
+작품 ID 리졸버 — 수집 단계에서 제목을 정수 작품 키(works.id)로 확정
+
+해석 순서:
+1. 정확 매칭 (works.title 그대로)
+2. 정규화 매칭 (NFKC + 소문자 + 기호/공백 제거)
+3. 미등록 제목은 works에 최소 행을 만들어 새 id 발급 (create=True)
+
+퍼지 매칭(문자 바이그램 역색인 → 유사도 비교)은 자동 병합하지 않는다.
+긴 일본어 제목은 부제/권차만 다른 별개 작품도 유사도가 높게 나오므로,
+걸린 쌍은 fuzzy_candidates에 모아 로그로만 남기고 검토 후 수동 병합한다.
+
+rankings/reviews 행에 work_id를 함께 저장해서 대시보드 조인을
+긴 일본어 제목 문자열 대신 정수 키로 처리하기 위함.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Optional, Tuple
+
+
+# 퍼지 후보 기준 (병합하지 않고 로그로만 남김)
+FUZZY_THRESHOLD = 0.92      # SequenceMatcher 유사도 하한
+FUZZY_MIN_LENGTH = 6        # 정규화 후 이 길이 미만이면 퍼지 매칭 안 함
+FUZZY_MAX_CANDIDATES = 8    # 바이그램 공유 수 상위 후보만 비교
+
+_NORM_STRIP_RE = re.compile(r'[\W_]+')
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def normalize_title(title: str) -> str:
+    """
+    제목 정규화 키 생성
+
+    Asura에서 쓰던 '소문자 + 영숫자만' 규칙을 일본어/한국어까지 확장:
+    NFKC(전각→반각) → 소문자 → 기호/공백/괄호 제거
+    """
+    if not title:
+        return ''
+    t = unicodedata.normalize('NFKC', title).lower()
+    return _NORM_STRIP_RE.sub('', t)
+
+
+def _bigrams(norm: str) -> set:
+    if len(norm) < 2:
+        return {norm} if norm else set()
+    return {norm[i:i + 2] for i in range(len(norm) - 1)}
+
+
+class WorkResolver:
+    """
+    플랫폼 단위 작품 ID 리졸버
+
+    works 테이블의 (id, title)을 한 번에 읽어서 정확/정규화/바이그램 인덱스를
+    메모리에 구성한다. 같은 프로세스 안에서는 get_resolver()로 재사용.
+
+    register()로 추가한 행은 호출 측 트랜잭션이 커밋돼야 실제로 존재하므로,
+    커밋 후 mark_committed()를 부르기 전까지는 dirty 상태로 남는다.
+    """
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self._by_title: Dict[str, int] = {}
+        self._by_norm: Dict[str, Tuple[str, int]] = {}   # {norm: (title, id)}
+        self._bigram_index: Dict[str, set] = defaultdict(set)  # {bigram: {norm}}
+        self.stats = {'exact': 0, 'normalized': 0, 'fuzzy_candidate': 0, 'created': 0, 'unresolved': 0}
+        self.fuzzy_candidates: Dict[str, Tuple[str, float]] = {}  # {수집 제목: (works 제목, 유사도)}
+        self.loaded = False
+        self.dirty = False
+
+    def load(self, cursor):
+        """works에서 플랫폼 작품 전체를 1회 쿼리로 로드 (id 오름차순 = 먼저 등록된 행 우선)"""
+        cursor.execute(
+            'SELECT id, title FROM works WHERE platform = %s ORDER BY id',
+            (self.platform,)
+        )
+        for work_id, title in cursor.fetchall():
+            self._add(title, work_id)
+        self.loaded = True
+
+    def register(self, title: str, work_id: int):
+        """신규 works 행 등록 (호출 측 트랜잭션 커밋 전까지 dirty)"""
+        if not title:
+            return
+        self._add(title, work_id)
+        self.dirty = True
+
+    def forget(self, title: str):
+        """register()한 행이 SAVEPOINT 롤백으로 사라졌을 때 인덱스에서 제거"""
+        work_id = self._by_title.pop(title, None)
+        norm = normalize_title(title)
+        if work_id is not None and self._by_norm.get(norm) == (title, work_id):
+            del self._by_norm[norm]
+            for bg in _bigrams(norm):
+                self._bigram_index[bg].discard(norm)
+
+    def mark_committed(self):
+        """호출 측 트랜잭션 커밋 완료 — register()한 행을 확정으로 본다"""
+        self.dirty = False
+
+    def _add(self, title: str, work_id: int):
+        if not title:
+            return
+        self._by_title.setdefault(title, work_id)
+        norm = normalize_title(title)
+        if norm and norm not in self._by_norm:
+            self._by_norm[norm] = (title, work_id)
+            for bg in _bigrams(norm):
+                self._bigram_index[bg].add(norm)
+
+    def _fuzzy_lookup(self, norm: str) -> Optional[Tuple[str, float]]:
+        """바이그램 공유 수로 후보를 좁힌 뒤 유사도 비교. 숫자(권/기/부)가 다르면 다른 작품으로 본다."""
+        if len(norm) < FUZZY_MIN_LENGTH:
+            return None
+
+        shared = defaultdict(int)
+        for bg in _bigrams(norm):
+            for cand in self._bigram_index.get(bg, ()):
+                shared[cand] += 1
+        if not shared:
+            return None
+
+        digits = _DIGITS_RE.findall(norm)
+        best, best_score = None, 0.0
+        candidates = sorted(shared.items(), key=lambda kv: -kv[1])[:FUZZY_MAX_CANDIDATES]
+        for cand, _ in candidates:
+            if _DIGITS_RE.findall(cand) != digits:
+                continue
+            score = SequenceMatcher(None, norm, cand).ratio()
+            if score > best_score:
+                best, best_score = cand, score
+
+        if best is not None and best_score >= FUZZY_THRESHOLD:
+            return self._by_norm[best][0], best_score
+        return None
+
+    def _log_fuzzy_candidate(self, title: str, norm: str):
+        """퍼지 후보는 병합하지 않고 기록만 (제목당 1회 출력)"""
+        if title in self.fuzzy_candidates:
+            return
+        match = self._fuzzy_lookup(norm)
+        if not match:
+            return
+        self.fuzzy_candidates[title] = match
+        self.stats['fuzzy_candidate'] += 1
+        print(f"🔎 [{self.platform}] 퍼지 후보 (병합 안 함): "
+              f"'{title[:40]}' ≈ '{match[0][:40]}' ({match[1]:.2f})")
+
+    def resolve(self, title: str, cursor=None, create: bool = False) -> Tuple[str, Optional[int]]:
+        """
+        제목 → (정식 works 제목, work_id)
+
+        Args:
+            title: 수집된 원본 제목
+            cursor: create=True일 때 신규 works 행 생성에 사용할 커서
+            create: 매칭 실패 시 works에 최소 행을 만들어 id 발급
+
+        Returns:
+            (canonical_title, work_id) — 매칭 실패 + create=False면 (title, None)
+            canonical_title은 정확/정규화 매칭일 때만 works 제목 (퍼지 후보는 병합 안 함)
+        """
+        if not title:
+            return title, None
+
+        if title in self._by_title:
+            self.stats['exact'] += 1
+            return title, self._by_title[title]
+
+        norm = normalize_title(title)
+        if norm in self._by_norm:
+            self.stats['normalized'] += 1
+            return self._by_norm[norm]
+
+        self._log_fuzzy_candidate(title, norm)
+
+        if create and cursor is not None:
+            cursor.execute('''
+                INSERT INTO works (platform, title, updated_at)
+                VALUES (%s, %s, NOW())
+                ON CONFLICT (platform, title) DO UPDATE SET title = EXCLUDED.title
+                RETURNING id
+            ''', (self.platform, title))
+            row = cursor.fetchone()
+            if row:
+                self.register(title, row[0])
+                self.stats['created'] += 1
+                return title, row[0]
+
+        self.stats['unresolved'] += 1
+        return title, None
+
+
+# 프로세스 내 플랫폼별 리졸버 캐시 (에이전트가 장르별로 save_rankings를 여러 번 호출)
+_resolvers: Dict[str, WorkResolver] = {}
+
+
+def get_resolver(platform: str, cursor) -> WorkResolver:
+    """
+    플랫폼 리졸버 반환 (최초 1회만 works 로드)
+
+    커밋 확인(mark_committed)이 안 된 등록분이 남아 있으면 이전 트랜잭션이
+    실패·롤백된 것이므로, 없는 id를 돌려주지 않도록 works에서 다시 로드한다.
+    """
+    resolver = _resolvers.get(platform)
+    if resolver is None or not resolver.loaded or resolver.dirty:
+        resolver = WorkResolver(platform)
+        resolver.load(cursor)
+        _resolvers[platform] = resolver
+    return resolver
+
+
+def clear_resolvers():
+    """리졸버 캐시 초기화 (마이그레이션/일괄 수정 후 재로드용)"""
+    _resolvers.clear()
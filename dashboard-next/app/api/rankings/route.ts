@@ -15,7 +15,7 @@ export async function GET(request: NextRequest) {
   const [rankings, prevDateRows] = await Promise.all([
     // 현재 랭킹
     sql`
-      SELECT rank, title, title_kr, genre, genre_kr, url, is_riverse
+      SELECT rank, title, title_kr, genre, genre_kr, url, is_riverse, work_id
       FROM rankings
       WHERE date = ${date} AND platform = ${platform} AND COALESCE(sub_category, '') = ${subCategory}
       ORDER BY rank
@@ -28,25 +28,28 @@ export async function GET(request: NextRequest) {
     `,
   ]);
 
-  // 랭킹 타이틀 목록으로 썸네일만 필터링 (전체 works 로드 대신)
-  const titles = rankings.map((r) => r.title);
+  // 조인/맵 키는 정수 작품 키(works.id) — 긴 일본어 제목 비교 회피
+  // work_id가 없는 행만 제목으로 폴백
+  const rowKey = (workId: number | null, title: string) =>
+    workId != null ? `id:${workId}` : `t:${title}`;
+  const workIds = rankings.filter((r) => r.work_id != null).map((r) => r.work_id);
+  const nullIdTitles = rankings.filter((r) => r.work_id == null).map((r) => r.title);
 
-  // 이전 랭킹 & 썸네일을 병렬로 (타이틀 기반 필터)
+  // 이전 랭킹 & 썸네일을 병렬로 (work_id 기반 필터, work_id 없는 행은 제목)
   const [prevRankings, thumbRows] = await Promise.all([
     prevDateRows.length > 0
       ? sql`
-          SELECT title, rank FROM rankings
+          SELECT title, rank, work_id FROM rankings
           WHERE date = ${prevDateRows[0].date} AND platform = ${platform}
             AND COALESCE(sub_category, '') = ${subCategory}
-            AND title = ANY(${titles})
+            AND (work_id = ANY(${workIds}) OR title = ANY(${nullIdTitles}))
         `
       : Promise.resolve([]),
-    titles.length > 0
+    workIds.length > 0
       ? sql`
-          SELECT title, thumbnail_url, unified_work_id, publisher
+          SELECT id, thumbnail_url, unified_work_id, publisher
           FROM works
-          WHERE platform = ${platform}
-            AND title = ANY(${titles})
+          WHERE id = ANY(${workIds})
         `
       : Promise.resolve([]),
   ]);
@@ -54,55 +57,68 @@ export async function GET(request: NextRequest) {
   // rank changes 계산
   const rankChanges: Record<string, number> = {};
   if (prevRankings.length > 0) {
-    const prevMap: Record<string, number> = {};
+    const prevById = new Map<number, number>();
+    const prevByTitle = new Map<string, number>();
     for (const r of prevRankings) {
-      prevMap[r.title] = r.rank;
+      if (r.work_id != null) prevById.set(r.work_id, r.rank);
+      prevByTitle.set(r.title, r.rank);
     }
+    const prevRank = (r: { work_id: number | null; title: string }) =>
+      r.work_id != null ? prevById.get(r.work_id) : prevByTitle.get(r.title);
 
     // 전날에 없는 작품들 → 과거 전체에서 한 번이라도 있었는지 확인
-    const newTitles = rankings
-      .filter((r) => !(r.title in prevMap))
-      .map((r) => r.title);
+    const newRows = rankings.filter((r) => prevRank(r) === undefined);
+    const newWorkIds = newRows.filter((r) => r.work_id != null).map((r) => r.work_id);
+    const newTitles = newRows.filter((r) => r.work_id == null).map((r) => r.title);
 
-    let everSeenSet = new Set<string>();
-    if (newTitles.length > 0) {
+    const everSeenSet = new Set<string>();
+    if (newRows.length > 0) {
       const everSeenRows = await sql`
-        SELECT DISTINCT title FROM rankings
-        WHERE platform = ${platform} AND title = ANY(${newTitles})
+        SELECT DISTINCT work_id, title FROM rankings
+        WHERE platform = ${platform}
+          AND (work_id = ANY(${newWorkIds}) OR title = ANY(${newTitles}))
           AND date < ${date}
       `;
-      everSeenSet = new Set(everSeenRows.map((r) => r.title));
+      for (const r of everSeenRows) {
+        everSeenSet.add(rowKey(r.work_id, r.title));
+      }
     }
 
     for (const r of rankings) {
-      if (r.title in prevMap) {
-        rankChanges[r.title] = prevMap[r.title] - r.rank;
-      } else if (everSeenSet.has(r.title)) {
-        rankChanges[r.title] = 998; // 재진입
+      const key = rowKey(r.work_id, r.title);
+      const prev = prevRank(r);
+      if (prev !== undefined) {
+        rankChanges[key] = prev - r.rank;
+      } else if (everSeenSet.has(key)) {
+        rankChanges[key] = 998; // 재진입
       } else {
-        rankChanges[r.title] = 999; // NEW (첫 등장)
+        rankChanges[key] = 999; // NEW (첫 등장)
       }
     }
   }
 
-  // thumbnails + unified_work_id map
+  // thumbnails + unified_work_id map (works.id 키)
   const thumbnails: Record<string, string> = {};
   const unifiedIds: Record<string, number> = {};
   const publishers: Record<string, string> = {};
   for (const t of thumbRows) {
+    const key = rowKey(t.id, "");
     if (t.thumbnail_url) {
-      thumbnails[t.title] = t.thumbnail_url;
+      thumbnails[key] = t.thumbnail_url;
     }
     if (t.unified_work_id) {
-      unifiedIds[t.title] = t.unified_work_id;
+      unifiedIds[key] = t.unified_work_id;
     }
     if (t.publisher) {
-      publishers[t.title] = t.publisher;
+      publishers[key] = t.publisher;
     }
   }
 
   // 매칭 안된 제목 → prefix LIKE + 정규화 매칭 (대소문자/하이픈/아포스트로피 차이 대응)
-  const missingTitles = titles.filter((t) => !thumbnails[t]);
+  // (work_id 없는 행 포함, 썸네일 못 찾은 행은 제목 키로 채움)
+  const missingTitles = rankings
+    .filter((r) => !thumbnails[rowKey(r.work_id, r.title)])
+    .map((r) => r.title);
   if (missingTitles.length > 0) {
     // normalize: 소문자 + 영숫자만
     const norm = (s: string) => s.toLowerCase().replace(/[^a-z0-9]/g, "");
@@ -128,29 +144,34 @@ export async function GET(request: NextRequest) {
           || nfb === norm(t) || nfb.slice(0, 20) === norm(t).slice(0, 20)
       );
       if (matchedShort) {
-        if (fb.thumbnail_url && !thumbnails[matchedShort]) {
-          thumbnails[matchedShort] = fb.thumbnail_url;
+        const key = rowKey(null, matchedShort);
+        if (fb.thumbnail_url && !thumbnails[key]) {
+          thumbnails[key] = fb.thumbnail_url;
         }
-        if (fb.unified_work_id && !unifiedIds[matchedShort]) {
-          unifiedIds[matchedShort] = fb.unified_work_id;
+        if (fb.unified_work_id && !unifiedIds[key]) {
+          unifiedIds[key] = fb.unified_work_id;
         }
       }
     }
   }
 
-  const result = rankings.map((r) => ({
-    rank: r.rank,
-    title: r.title,
-    title_kr: r.title_kr || null,
-    genre: r.genre || null,
-    genre_kr: r.genre_kr || null,
-    url: r.url,
-    is_riverse: r.is_riverse,
-    rank_change: rankChanges[r.title] ?? 0,
-    thumbnail_url: thumbnails[r.title] || null,
-    unified_work_id: unifiedIds[r.title] || null,
-    publisher: publishers[r.title] || null,
-  }));
+  const result = rankings.map((r) => {
+    const key = rowKey(r.work_id, r.title);
+    const titleKey = rowKey(null, r.title);
+    return {
+      rank: r.rank,
+      title: r.title,
+      title_kr: r.title_kr || null,
+      genre: r.genre || null,
+      genre_kr: r.genre_kr || null,
+      url: r.url,
+      is_riverse: r.is_riverse,
+      rank_change: rankChanges[key] ?? 0,
+      thumbnail_url: thumbnails[key] || thumbnails[titleKey] || null,
+      unified_work_id: unifiedIds[key] || unifiedIds[titleKey] || null,
+      publisher: publishers[key] || null,
+    };
+  });
 
   return NextResponse.json(result, {
     headers: {
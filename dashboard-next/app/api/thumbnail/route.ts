@@ -2,6 +2,37 @@ import { NextRequest, NextResponse } from "next/server";
 import { sql } from "@/lib/supabase";
 import https from "https";
 import http from "http";
+import { promises as fs } from "fs";
+import path from "path";
+
+// 썸네일 blob 저장소 (crawler/thumbnail_store.py와 같은 스위치)
+// THUMBNAIL_STORE: 'postgres'(기본) → thumbnail_blobs 테이블
+//                  'local' → THUMBNAIL_STORE_DIR (기본 <repo>/data/thumbnails)
+const THUMBNAIL_STORE = process.env.THUMBNAIL_STORE || "postgres";
+const THUMBNAIL_STORE_DIR =
+  process.env.THUMBNAIL_STORE_DIR || path.join(process.cwd(), "..", "data", "thumbnails");
+
+async function loadBlob(hash: string): Promise<{ buffer: Buffer; contentType: string } | null> {
+  if (THUMBNAIL_STORE === "local") {
+    const dir = THUMBNAIL_STORE_DIR;
+    try {
+      const buffer = await fs.readFile(path.join(dir, hash.slice(0, 2), hash));
+      return { buffer, contentType: detectMime(buffer) };
+    } catch {
+      return null;
+    }
+  }
+  const rows = await sql`SELECT data, mime FROM thumbnail_blobs WHERE hash = ${hash}`;
+  if (rows.length === 0) return null;
+  return { buffer: Buffer.from(rows[0].data), contentType: rows[0].mime };
+}
+
+function detectMime(buf: Buffer): string {
+  if (buf.subarray(0, 4).toString("hex") === "89504e47") return "image/png";
+  if (buf.subarray(0, 4).toString("ascii") === "GIF8") return "image/gif";
+  if (buf.subarray(8, 12).toString("ascii") === "WEBP") return "image/webp";
+  return "image/jpeg";
+}
 
 function downloadImage(url: string): Promise<{ buffer: Buffer; contentType: string }> {
   return new Promise((resolve, reject) => {
@@ -59,9 +90,9 @@ export async function GET(request: NextRequest) {
     return NextResponse.json({ error: "platform and title required" }, { status: 400 });
   }
 
-  // DB에서 base64 우선, 없으면 URL 가져오기 (잘린 제목 prefix 매칭 폴백)
+  // DB에서 저장된 썸네일 해시 우선, 없으면 URL 가져오기 (잘린 제목 prefix 매칭 폴백)
   let rows = await sql`
-    SELECT thumbnail_base64, thumbnail_url
+    SELECT thumbnail_hash, thumbnail_url
     FROM works
     WHERE platform = ${platform} AND title = ${title}
     LIMIT 1
@@ -70,7 +101,7 @@ export async function GET(request: NextRequest) {
   // 정확히 안 맞으면 prefix 매칭 시도 (Asura 잘린 제목 대응)
   if (rows.length === 0 && title.length >= 10) {
     rows = await sql`
-      SELECT thumbnail_base64, thumbnail_url
+      SELECT thumbnail_hash, thumbnail_url
       FROM works
       WHERE platform = ${platform} AND title LIKE ${title + '%'}
       LIMIT 1
@@ -81,19 +112,17 @@ export async function GET(request: NextRequest) {
     return new NextResponse(null, { status: 404 });
   }
 
-  const { thumbnail_base64, thumbnail_url } = rows[0];
+  const { thumbnail_hash, thumbnail_url } = rows[0];
 
-  // base64가 있으면 그대로 반환
-  if (thumbnail_base64) {
-    const match = thumbnail_base64.match(/^data:([^;]+);base64,(.+)$/);
-    if (match) {
-      const mimeType = match[1];
-      const base64Data = match[2];
-      const buffer = Buffer.from(base64Data, "base64");
-      return new NextResponse(new Uint8Array(buffer), {
+  // 저장소에 있으면 그대로 반환 (콘텐츠 해시 → 내용 불변)
+  if (thumbnail_hash) {
+    const blob = await loadBlob(thumbnail_hash);
+    if (blob) {
+      return new NextResponse(new Uint8Array(blob.buffer), {
         headers: {
-          "Content-Type": mimeType,
+          "Content-Type": blob.contentType,
           "Cache-Control": "public, max-age=86400",
+          ETag: `"${thumbnail_hash}"`,
         },
       });
     }
@@ -20,7 +20,7 @@ export async function GET(request: NextRequest) {
   const [metaRows, overallRows, genreRows, reviewRows] = await Promise.all([
     sql`
       SELECT platform, title, title_kr, genre, genre_kr, is_riverse, url,
-             thumbnail_url, thumbnail_base64,
+             thumbnail_url, thumbnail_hash,
              author, publisher, label, tags, description,
              hearts, favorites, rating, review_count,
              best_rank, first_seen_date, last_seen_date
@@ -68,7 +68,7 @@ export async function GET(request: NextRequest) {
     is_riverse: w.is_riverse ?? false,
     url: w.url || "",
     thumbnail_url: w.thumbnail_url || null,
-    thumbnail_base64: w.thumbnail_base64 || null,
+    thumbnail_hash: w.thumbnail_hash || null,
     author: w.author || "",
     publisher: w.publisher || "",
     label: w.label || "",
@@ -20,7 +20,7 @@ export async function GET(request: NextRequest) {
     sql`
       SELECT id, title_kr, title_canonical, author, artist, publisher,
              genre, genre_kr, tags, description, is_riverse,
-             thumbnail_url, thumbnail_base64
+             thumbnail_url, thumbnail_hash
       FROM unified_works
       WHERE id = ${id}
       LIMIT 1
@@ -45,44 +45,44 @@ export async function GET(request: NextRequest) {
     description: uw.description || "",
     is_riverse: uw.is_riverse ?? false,
     thumbnail_url: uw.thumbnail_url || null,
-    thumbnail_base64: uw.thumbnail_base64 || null,
+    thumbnail_hash: uw.thumbnail_hash || null,
   };
 
   // 2. 모든 플랫폼별 works 조회
   const worksRows = await sql`
-    SELECT platform, title, url, best_rank, rating, review_count,
+    SELECT id, platform, title, url, best_rank, rating, review_count,
            hearts, favorites, first_seen_date, last_seen_date,
-           genre, thumbnail_url, thumbnail_base64
+           genre, thumbnail_url, thumbnail_hash
     FROM works
     WHERE unified_work_id = ${id}
     ORDER BY platform
   `;
 
   // 3. 모든 플랫폼의 장르 + 랭킹 히스토리를 벌크 쿼리로 조회
-  const allTitles = worksRows.map((w) => w.title);
-  const allPlatforms = worksRows.map((w) => w.platform);
+  // rankings.work_id(정수 키)로 조인
+  const allWorkIds = worksRows.map((w) => w.id);
 
   const [genreBulk, rankBulk] = await Promise.all([
     sql`
-      SELECT title, platform, sub_category, COUNT(*)::int as cnt
+      SELECT work_id, platform, sub_category, COUNT(*)::int as cnt
       FROM rankings
-      WHERE title = ANY(${allTitles}) AND platform = ANY(${allPlatforms})
+      WHERE work_id = ANY(${allWorkIds})
         AND sub_category IS NOT NULL AND sub_category != ''
-      GROUP BY title, platform, sub_category
-      ORDER BY title, platform, cnt DESC
+      GROUP BY work_id, platform, sub_category
+      ORDER BY work_id, platform, cnt DESC
     `,
     sql`
-      SELECT title, platform, sub_category, date, rank::int as rank
+      SELECT work_id, platform, sub_category, date, rank::int as rank
       FROM rankings
-      WHERE title = ANY(${allTitles}) AND platform = ANY(${allPlatforms})
-      ORDER BY title, platform, date DESC
+      WHERE work_id = ANY(${allWorkIds})
+      ORDER BY work_id, platform, date DESC
     `,
   ]);
 
-  // 장르 벌크 데이터를 플랫폼별로 정리
-  const genreMap = new Map<string, { sub_category: string; cnt: number }[]>();
+  // 장르 벌크 데이터를 works.id별로 정리 (정규화 매칭된 랭킹 행은 제목 표기가 다를 수 있음)
+  const genreMap = new Map<number, { sub_category: string; cnt: number }[]>();
   for (const row of genreBulk) {
-    const key = `${row.platform}:${row.title}`;
+    const key = row.work_id;
     if (!genreMap.has(key)) genreMap.set(key, []);
     const pInfo = PLATFORMS.find((p) => p.id === row.platform);
     const overallKey = pInfo?.genres[0]?.key ?? "";
@@ -93,12 +93,12 @@ export async function GET(request: NextRequest) {
 
   // 랭킹 벌크 데이터를 플랫폼별로 분류
   type RankEntry = { date: string; rank: number };
-  const rankMap = new Map<string, { overall: RankEntry[]; genres: Map<string, RankEntry[]>; latest: RankEntry | null }>();
+  const rankMap = new Map<number, { overall: RankEntry[]; genres: Map<string, RankEntry[]>; latest: RankEntry | null }>();
 
   for (const w of worksRows) {
     const pInfo = PLATFORMS.find((p) => p.id === w.platform);
     const overallKey = pInfo?.genres[0]?.key ?? "";
-    const mapKey = `${w.platform}:${w.title}`;
+    const mapKey = w.id;
     const genreKeys = (genreMap.get(mapKey) || []).map((g) => g.sub_category);
 
     const overall: RankEntry[] = [];
@@ -107,7 +107,7 @@ export async function GET(request: NextRequest) {
     let latest: RankEntry | null = null;
 
     for (const r of rankBulk) {
-      if (r.title !== w.title || r.platform !== w.platform) continue;
+      if (r.work_id !== w.id) continue;
       const sc = r.sub_category || "";
       const entry = { date: String(r.date), rank: r.rank };
 
@@ -126,7 +126,7 @@ export async function GET(request: NextRequest) {
   // 플랫폼 데이터 조립
   const platforms = worksRows.map((w) => {
     const pInfo = PLATFORMS.find((p) => p.id === w.platform);
-    const mapKey = `${w.platform}:${w.title}`;
+    const mapKey = w.id;
     const genres = genreMap.get(mapKey) || [];
     const ranks = rankMap.get(mapKey) || { overall: [], genres: new Map(), latest: null };
 
@@ -167,7 +167,7 @@ export async function GET(request: NextRequest) {
           SELECT r.platform, r.work_title, r.reviewer_name, r.reviewer_info,
                  r.body, r.rating, r.likes_count, r.is_spoiler, r.reviewed_at
           FROM reviews r
-          INNER JOIN works w ON w.platform = r.platform AND w.title = r.work_title
+          INNER JOIN works w ON w.id = r.work_id
           WHERE w.unified_work_id = ${id}
           ORDER BY r.reviewed_at DESC NULLS LAST, r.collected_at DESC
           LIMIT 50
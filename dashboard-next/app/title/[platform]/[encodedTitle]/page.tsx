@@ -20,7 +20,7 @@ export default async function TitleDetailPage({ params }: PageProps) {
   const [metaRows, overallRows, genreRows, reviewRows, reviewCountRows] = await Promise.all([
     sql`
       SELECT platform, title, title_kr, genre, genre_kr, is_riverse, url,
-             thumbnail_url, thumbnail_base64,
+             thumbnail_url, thumbnail_hash,
              author, publisher, label, tags, description,
              hearts, favorites, rating, review_count,
              best_rank,
@@ -65,7 +65,7 @@ export default async function TitleDetailPage({ params }: PageProps) {
   if (metaRows.length === 0) {
     const fuzzyRows = await sql`
       SELECT platform, title, title_kr, genre, genre_kr, is_riverse, url,
-             thumbnail_url, thumbnail_base64,
+             thumbnail_url, thumbnail_hash,
              author, publisher, label, tags, description,
              hearts, favorites, rating, review_count,
              best_rank,
@@ -97,7 +97,7 @@ export default async function TitleDetailPage({ params }: PageProps) {
     is_riverse: Boolean(w.is_riverse ?? false),
     url: String(w.url || ""),
     thumbnail_url: w.thumbnail_url ? String(w.thumbnail_url) : null,
-    thumbnail_base64: w.thumbnail_base64 ? String(w.thumbnail_base64) : null,
+    thumbnail_hash: w.thumbnail_hash ? String(w.thumbnail_hash) : null,
     author: String(w.author || ""),
     publisher: String(w.publisher || ""),
     label: String(w.label || ""),
@@ -43,7 +43,7 @@ export default async function UnifiedWorkPage({ params }: Props) {
     sql`
       SELECT id, title_kr, title_en, title_canonical, author, artist, publisher,
              genre, genre_kr, tags, description, is_riverse,
-             thumbnail_url, thumbnail_base64
+             thumbnail_url, thumbnail_hash
       FROM unified_works
       WHERE id = ${numId}
       LIMIT 1
@@ -81,7 +81,7 @@ export default async function UnifiedWorkPage({ params }: Props) {
     description: uw.description || "",
     is_riverse: uw.is_riverse ?? false,
     thumbnail_url: uw.thumbnail_url || null,
-    thumbnail_base64: uw.thumbnail_base64 || null,
+    thumbnail_hash: uw.thumbnail_hash || null,
   };
 
   // thumbnail_url 보정: unified_works에 없으면 일본 플랫폼 works에서 우선 가져옴
@@ -30,7 +30,7 @@ interface TitleHeroProps {
 export function TitleHero({ metadata, platformColor, platformName }: TitleHeroProps) {
   // 항상 프록시를 우선 사용 (외부 CDN CORS/referrer 문제 방지)
   const proxyUrl = `/api/thumbnail?platform=${encodeURIComponent(metadata.platform)}&title=${encodeURIComponent(metadata.title)}`;
-  const hasThumbnail = !!(metadata.thumbnail_base64 || metadata.thumbnail_url);
+  const hasThumbnail = !!(metadata.thumbnail_hash || metadata.thumbnail_url);
   const [loadState, setLoadState] = useState<"proxy" | "cdn" | "fallback">(
     hasThumbnail ? "proxy" : "fallback"
   );
@@ -8,7 +8,7 @@ export interface Ranking {
   is_riverse: boolean;
   rank_change: number; // 양수=상승, 음수=하락, 999=NEW(첫등장), 998=재진입
   thumbnail_url?: string;
-  thumbnail_base64?: string;
+  thumbnail_hash?: string;
   unified_work_id?: number | null;
   publisher?: string | null;
 }
@@ -87,7 +87,7 @@ export interface TitleDetailMetadata extends WorkMetadata {
   is_riverse: boolean;
   url: string;
   thumbnail_url: string | null;
-  thumbnail_base64: string | null;
+  thumbnail_hash: string | null;
   best_rank: number | null;
   first_seen_date: string | null;
   last_seen_date: string | null;
@@ -135,7 +135,7 @@ export interface UnifiedWorkMetadata {
   description: string;
   is_riverse: boolean;
   thumbnail_url: string | null;
-  thumbnail_base64: string | null;
+  thumbnail_hash: string | null;
 }
 
 export interface PlatformWorkEntry {
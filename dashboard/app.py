@@ -5,6 +5,7 @@
     streamlit run dashboard/app.py
 """
 
+import asyncio
 import streamlit as st
 import streamlit.components.v1 as components
 import psycopg2
@@ -12,9 +13,7 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import base64
-import urllib.request
 import urllib.parse
-import ssl
 import html as html_module
 import json
 import subprocess
@@ -24,6 +23,7 @@ from dotenv import load_dotenv
 
 # 프로젝트 루트
 project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
 # 환경변수 로드
 load_dotenv(project_root / '.env')
@@ -183,13 +183,12 @@ def load_rankings(date: str, platform: str, sub_category: str = '') -> pd.DataFr
                 WHERE platform = %s AND genre IS NOT NULL AND genre != ''
             ''', conn, params=(platform,))
             if not genre_cache.empty:
-                from crawler.utils import translate_genre
+                from crawler.utils import translate_genre_series
                 genre_map = dict(zip(genre_cache['title'], genre_cache['genre']))
-                for idx in df[missing_genre].index:
-                    title = df.at[idx, 'title']
-                    if title in genre_map:
-                        df.at[idx, 'genre'] = genre_map[title]
-                        df.at[idx, 'genre_kr'] = translate_genre(genre_map[title])
+                filled = df.loc[missing_genre, 'title'].map(genre_map).dropna()
+                if not filled.empty:
+                    df.loc[filled.index, 'genre'] = filled
+                    df.loc[filled.index, 'genre_kr'] = translate_genre_series(filled)
         except Exception:
             pass  # works 테이블에 genre 컬럼이 아직 없을 수 있음
 
@@ -275,82 +274,22 @@ def get_platform_stats(date: str) -> dict:
 # 썸네일 Base64 캐싱
 # =============================================================================
 
-def _detect_image_type(data: bytes) -> str:
-    """magic bytes로 이미지 타입 감지"""
-    if data[:8] == b'\x89PNG\r\n\x1a\n':
-        return 'image/png'
-    if data[:2] == b'\xff\xd8':
-        return 'image/jpeg'
-    if data[:4] == b'GIF8':
-        return 'image/gif'
-    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
-        return 'image/webp'
-    return 'image/jpeg'  # fallback
-
-
-def _download_and_encode(url: str) -> str:
-    """URL에서 이미지 다운로드 → base64 data URI 반환"""
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-
-    req = urllib.request.Request(url, headers={
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'image/*,*/*',
-    })
-    with urllib.request.urlopen(req, timeout=10, context=ctx) as resp:
-        data = resp.read()
-
-    mime = _detect_image_type(data)
-    b64 = base64.b64encode(data).decode('ascii')
-    return f"data:{mime};base64,{b64}"
-
-
 @st.cache_data(ttl=3600, show_spinner=False)
 def ensure_thumbnails_cached(platform: str) -> dict:
     """
-    서버사이드에서 썸네일 다운로드 → base64 인코딩 → DB 캐싱
+    썸네일 로드 (blob 저장소) — 누락분은 비동기 수집기로 먼저 받아 저장
     반환: {title: "data:image/...;base64,..."}
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    from crawler.db import get_thumbnails_base64
+    from crawler.thumbnail_fetcher import run_thumbnail_fetcher
 
-    # 이미 base64가 있는 것 로드
-    cursor.execute('''
-        SELECT title, thumbnail_base64
-        FROM works
-        WHERE platform = %s AND thumbnail_base64 IS NOT NULL AND thumbnail_base64 != ''
-    ''', (platform,))
-    cached = {row[0]: row[1] for row in cursor.fetchall()}
-
-    # base64가 없지만 URL이 있는 것
-    cursor.execute('''
-        SELECT title, thumbnail_url
-        FROM works
-        WHERE platform = %s
-          AND thumbnail_url IS NOT NULL AND thumbnail_url != ''
-          AND (thumbnail_base64 IS NULL OR thumbnail_base64 = '')
-    ''', (platform,))
-    need_download = cursor.fetchall()
-    conn.close()
-
-    for title, url in need_download:
-        try:
-            data_uri = _download_and_encode(url)
-            # DB에 저장
-            conn2 = get_db_connection()
-            cur2 = conn2.cursor()
-            cur2.execute('''
-                UPDATE works SET thumbnail_base64 = %s, updated_at = NOW()
-                WHERE platform = %s AND title = %s
-            ''', (data_uri, platform, title))
-            conn2.commit()
-            conn2.close()
-            cached[title] = data_uri
-        except Exception:
-            pass  # 실패한 경우 썸네일 없이 표시
+    try:
+        # 크롤링 후처리에서 빠진 작품만 대상 (대개 0개), 프로세스 풀 없이 실행
+        asyncio.run(run_thumbnail_fetcher(platform=platform, workers=0, quiet=True))
+    except Exception:
+        pass  # 실패한 경우 썸네일 없이 표시
 
-    return cached
+    return get_thumbnails_base64(platform)
 
 
 # =============================================================================
@@ -8,6 +8,7 @@ title_kr 수정 사항 적용 스크립트
 import os
 import sys
 import json
+import argparse
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
@@ -18,6 +19,8 @@ load_dotenv(project_root / '.env')
 
 import psycopg2
 
+from crawler.bulk_title_kr import apply_title_kr_corrections, print_report
+
 DB_URL = os.environ.get('SUPABASE_DB_URL', '')
 MAPPINGS_PATH = project_root / 'data' / 'title_mappings.json'
 
@@ -533,6 +536,11 @@ CORRECTIONS = {
 
 
 def main():
+    parser = argparse.ArgumentParser(description='title_kr 수정 사항 적용')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='매핑/DB 변경 없이 변경 예정 diff만 출력')
+    args = parser.parse_args()
+
     # 매핑 로드
     with open(MAPPINGS_PATH, 'r', encoding='utf-8') as f:
         mappings = json.load(f)
@@ -552,40 +560,24 @@ def main():
             updated += 1
 
     # 정렬 후 저장
-    sorted_m = dict(sorted(mappings.items()))
-    with open(MAPPINGS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(sorted_m, f, ensure_ascii=False, indent=2)
-    print(f"💾 매핑 저장: {len(sorted_m)}개 (수정: {updated}개)")
+    if args.dry_run:
+        print(f"📝 매핑 변경 예정: {updated}개 (dry-run, 저장 안 함)")
+    else:
+        sorted_m = dict(sorted(mappings.items()))
+        with open(MAPPINGS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(sorted_m, f, ensure_ascii=False, indent=2)
+        print(f"💾 매핑 저장: {len(sorted_m)}개 (수정: {updated}개)")
 
-    # DB 업데이트
+    # DB 업데이트 (임시 테이블 조인 일괄 처리, 한 트랜잭션)
     if not DB_URL:
         print("⚠️ DB URL 없음")
         return
 
     conn = psycopg2.connect(DB_URL)
-    cur = conn.cursor()
-    w_total = r_total = 0
-
-    for jp, kr in CORRECTIONS.items():
-        if not kr:
-            continue
-        # works 업데이트 (빈값이거나 혼합 문자열 교체)
-        cur.execute("""
-            UPDATE works SET title_kr = %s
-            WHERE title = %s
-        """, (kr, jp))
-        w_total += cur.rowcount
-
-        # rankings 업데이트
-        cur.execute("""
-            UPDATE rankings SET title_kr = %s
-            WHERE title = %s
-        """, (kr, jp))
-        r_total += cur.rowcount
-
-    conn.commit()
+    report = apply_title_kr_corrections(conn, CORRECTIONS, mode='overwrite',
+                                        dry_run=args.dry_run)
     conn.close()
-    print(f"💾 DB: works {w_total}행, rankings {r_total}행 업데이트")
+    print_report(report)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@
 사용법:
     python3 scripts/audit_title_kr.py --audit     # 현황 보고만
     python3 scripts/audit_title_kr.py --fix        # 감사 + 클리닝 + DB 업데이트
+    python3 scripts/audit_title_kr.py --diff       # 매핑 → DB 변경 예정 diff (dry-run)
 """
 
 import os
@@ -29,6 +30,10 @@ load_dotenv(project_root / 'dashboard-next' / '.env.local', override=True)
 
 import psycopg2
 
+from crawler.bulk_title_kr import (
+    apply_title_kr_corrections, print_report, relink_unified_works_bulk,
+)
+
 DB_URL = os.environ.get('SUPABASE_DB_URL', '')
 API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
 MAPPINGS_PATH = project_root / 'data' / 'title_mappings.json'
@@ -208,84 +213,22 @@ def get_db_stats() -> dict:
 
 
 def update_db_title_kr(translations: dict[str, str]):
-    """DB의 works와 rankings 테이블에 title_kr 업데이트"""
+    """DB의 works와 rankings 테이블에 title_kr 업데이트 (임시 테이블 조인 일괄 처리)"""
     conn = psycopg2.connect(DB_URL)
-    cur = conn.cursor()
-    w_total = r_total = 0
-
-    for jp_title, kr_title in translations.items():
-        if not kr_title:
-            continue
-        cur.execute("""
-            UPDATE works SET title_kr = %s
-            WHERE title = %s AND (title_kr IS NULL OR title_kr = '' OR
-                  (title_kr ~ '[ぁ-んァ-ヶ一-龥]' AND title_kr ~ '[ㄱ-ㅣ가-힣]'))
-        """, (kr_title, jp_title))
-        w_total += cur.rowcount
-
-        cur.execute("""
-            UPDATE rankings SET title_kr = %s
-            WHERE title = %s AND (title_kr IS NULL OR title_kr = '' OR
-                  (title_kr ~ '[ぁ-んァ-ヶ一-龥]' AND title_kr ~ '[ㄱ-ㅣ가-힣]'))
-        """, (kr_title, jp_title))
-        r_total += cur.rowcount
-
-    conn.commit()
+    report = apply_title_kr_corrections(conn, translations, mode='fill_or_mixed')
     conn.close()
-    return w_total, r_total
+    return report['works']['rows'], report['rankings']['rows']
 
 
 def relink_unified_works():
     """title_kr이 있지만 unified_work_id가 없는 works를 unified_works에 연결"""
     conn = psycopg2.connect(DB_URL)
     cur = conn.cursor()
-
-    # title_kr이 있는데 unified_work_id가 NULL인 works 가져오기
-    cur.execute("""
-        SELECT DISTINCT ON (title_kr) title_kr, title, genre, genre_kr,
-               is_riverse, thumbnail_url, thumbnail_base64, author, publisher
-        FROM works
-        WHERE title_kr IS NOT NULL AND title_kr != ''
-          AND unified_work_id IS NULL
-        ORDER BY title_kr, last_seen_date DESC NULLS LAST
-    """)
-    orphans = cur.fetchall()
-
-    if not orphans:
-        print("  ✅ 고아 작품 없음")
-        conn.close()
-        return 0
-
-    linked = 0
-    for row in orphans:
-        title_kr, title, genre, genre_kr, is_riverse, thumb_url, thumb_b64, author, publisher = row
-
-        # unified_works에 upsert
-        cur.execute('''
-            INSERT INTO unified_works
-                (title_kr, title_canonical, author, publisher, genre, genre_kr,
-                 is_riverse, thumbnail_url, thumbnail_base64)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (title_kr) DO UPDATE SET
-                title_canonical = COALESCE(NULLIF(EXCLUDED.title_canonical, ''), unified_works.title_canonical),
-                author = COALESCE(NULLIF(EXCLUDED.author, ''), unified_works.author),
-                is_riverse = EXCLUDED.is_riverse OR unified_works.is_riverse,
-                thumbnail_url = COALESCE(NULLIF(EXCLUDED.thumbnail_url, ''), unified_works.thumbnail_url),
-                updated_at = NOW()
-            RETURNING id
-        ''', (title_kr, title, author or '', publisher or '', genre or '',
-              genre_kr or '', is_riverse or False, thumb_url or '', thumb_b64 or ''))
-        uid_row = cur.fetchone()
-        if uid_row:
-            uid = uid_row[0]
-            cur.execute("""
-                UPDATE works SET unified_work_id = %s
-                WHERE title_kr = %s AND unified_work_id IS NULL
-            """, (uid, title_kr))
-            linked += cur.rowcount
-
+    linked = relink_unified_works_bulk(cur)
     conn.commit()
     conn.close()
+    if not linked:
+        print("  ✅ 고아 작품 없음")
     return linked
 
 
@@ -434,19 +377,17 @@ def run_fix(mappings: dict, bad: dict, missing_titles: list[str]):
     # 5-1. 매핑으로 먼저 복구
     already_mapped = {}
     still_missing = []
+    lower_map = {}
+    for k, v in mappings.items():
+        lower_map.setdefault(k.lower(), v)
     for t in missing_titles:
         if t in mappings:
             already_mapped[t] = mappings[t]
-        else:
+        elif t.lower() in lower_map:
             # case-insensitive
-            found = False
-            for k, v in mappings.items():
-                if k.lower() == t.lower():
-                    already_mapped[t] = v
-                    found = True
-                    break
-            if not found:
-                still_missing.append(t)
+            already_mapped[t] = lower_map[t.lower()]
+        else:
+            still_missing.append(t)
 
     if already_mapped:
         print(f"  🔄 기존 매핑 복구: {len(already_mapped)}개")
@@ -515,18 +456,29 @@ def main():
     parser = argparse.ArgumentParser(description='한국어 제목 전수검사 및 클리닝')
     parser.add_argument('--audit', action='store_true', help='현황 보고만')
     parser.add_argument('--fix', action='store_true', help='클리닝 + 재번역 + DB 업데이트')
+    parser.add_argument('--diff', action='store_true',
+                        help='현재 매핑을 DB에 반영하면 바뀔 행 diff (dry-run, 변경 없음)')
     args = parser.parse_args()
 
-    if not args.audit and not args.fix:
+    if not args.audit and not args.fix and not args.diff:
         print("사용법:")
         print("  python3 scripts/audit_title_kr.py --audit   # 현황 보고")
         print("  python3 scripts/audit_title_kr.py --fix     # 클리닝 + 수정")
+        print("  python3 scripts/audit_title_kr.py --diff    # 매핑 → DB 변경 예정 diff")
         return
 
     # 매핑 로드
     with open(MAPPINGS_PATH, 'r', encoding='utf-8') as f:
         mappings = json.load(f)
 
+    if args.diff:
+        conn = psycopg2.connect(DB_URL)
+        report = apply_title_kr_corrections(conn, mappings, mode='fill_or_mixed', dry_run=True)
+        conn.close()
+        print_report(report)
+        if not args.audit and not args.fix:
+            return
+
     # 감사
     bad, stats, missing = run_audit(mappings)
 
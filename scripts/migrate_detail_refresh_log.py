@@ -0,0 +1,81 @@
+"""
+DB 마이그레이션: 상세 갱신 로그 테이블 (detail_refresh_log)
+
+상세 메타데이터 갱신 스케줄러(crawler/refresh_scheduler.py)가
+작품별 적중률(갱신 시 실제로 바뀐 비율)과 하트/평점/리뷰수 변화량을 계산하기 위해
+갱신 1건마다 (바뀐 필드, 선택 점수, 수치 스냅샷)을 남긴다.
+(테이블이 없으면 스케줄러는 순위/경과일만으로 동작)
+
+사용법:
+    python3 scripts/migrate_detail_refresh_log.py
+    python3 crawler/refresh_scheduler.py --report   # 점수 구간별 적중률
+"""
+
+import psycopg2
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+import os
+
+load_dotenv(project_root / '.env')
+DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
+
+
+def get_conn():
+    return psycopg2.connect(DATABASE_URL)
+
+
+def step1_create_table():
+    """detail_refresh_log 테이블 + 인덱스 생성"""
+    print("=" * 60)
+    print("Step 1: detail_refresh_log 테이블 생성")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS detail_refresh_log (
+            id BIGSERIAL PRIMARY KEY,
+            platform TEXT NOT NULL,
+            title TEXT NOT NULL,
+            refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            changed_fields TEXT[] NOT NULL DEFAULT '{}',
+            score DOUBLE PRECISION,          -- NULL = 스케줄러 외 수집 (리버스 전체 등)
+            hearts INTEGER,
+            rating NUMERIC,
+            review_count INTEGER
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_detail_refresh_log_work
+        ON detail_refresh_log (platform, title, refreshed_at DESC)
+    """)
+    conn.commit()
+    conn.close()
+    print("  ✅ detail_refresh_log")
+    print()
+
+
+def step2_verify():
+    """생성 확인"""
+    print("=" * 60)
+    print("Step 2: 검증")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM detail_refresh_log")
+    print(f"  detail_refresh_log: {cursor.fetchone()[0]}행")
+    conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    print("\n🔄 DB 마이그레이션: 상세 갱신 로그\n")
+    step1_create_table()
+    step2_verify()
+    print("✅ 마이그레이션 완료!")
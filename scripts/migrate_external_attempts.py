@@ -0,0 +1,72 @@
+"""
+DB 마이그레이션: 외부 데이터 수집 시도 기록 (external_attempts)
+
+external_data에는 매칭에 성공한 타이틀만 행이 생기므로, 한 번도 매칭되지 않는
+타이틀은 매 실행 '미수집'으로 대상 맨 앞에 다시 올라와 매칭된 타이틀의 갱신을 밀어낸다.
+(title, source)별 마지막 시도 날짜를 남겨 신선도 계산에 함께 쓴다 (external_data 날짜와 큰 쪽).
+(crawler/sns/external_db.py get_works_for_external 참고 — 테이블이 없으면 기존처럼 external_data만 사용)
+
+사용법:
+    python3 scripts/migrate_external_attempts.py
+"""
+
+import psycopg2
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+import os
+
+load_dotenv(project_root / '.env')
+DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
+
+
+def get_conn():
+    return psycopg2.connect(DATABASE_URL)
+
+
+def step1_create_table():
+    """external_attempts 테이블 생성"""
+    print("=" * 60)
+    print("Step 1: external_attempts 테이블 생성")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS external_attempts (
+            title TEXT NOT NULL,
+            source TEXT NOT NULL,
+            last_attempted DATE NOT NULL,
+            PRIMARY KEY (title, source)
+        )
+    """)
+    conn.commit()
+    conn.close()
+    print("  ✅ external_attempts")
+    print()
+
+
+def step2_verify():
+    """생성 확인"""
+    print("=" * 60)
+    print("Step 2: 검증")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("SELECT source, COUNT(*) FROM external_attempts GROUP BY source ORDER BY source")
+    for source, n in cursor.fetchall():
+        print(f"  {source}: {n}행")
+    conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    print("\n🔄 DB 마이그레이션: 외부 데이터 수집 시도 기록\n")
+    step1_create_table()
+    step2_verify()
+    print("✅ 마이그레이션 완료!")
@@ -0,0 +1,75 @@
+"""
+DB 마이그레이션: 랭킹 배치 지문 테이블 (ranking_batches)
+
+하루 3회 크롤링에서 변경 없는 랭킹/작품 메타데이터 재쓰기를 생략하기 위해
+(date, platform, sub_category, kind)별 지문과 항목 해시를 저장한다.
+(crawler/batch_fingerprint.py 참고 — 테이블이 없으면 기존처럼 전체 쓰기)
+
+사용법:
+    python3 scripts/migrate_ranking_batches.py
+"""
+
+import psycopg2
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+import os
+
+load_dotenv(project_root / '.env')
+DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
+
+
+def get_conn():
+    return psycopg2.connect(DATABASE_URL)
+
+
+def step1_create_table():
+    """ranking_batches 테이블 생성"""
+    print("=" * 60)
+    print("Step 1: ranking_batches 테이블 생성")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ranking_batches (
+            date DATE NOT NULL,
+            platform TEXT NOT NULL,
+            sub_category TEXT NOT NULL DEFAULT '',
+            kind TEXT NOT NULL,              -- 'rankings' | 'works'
+            fingerprint TEXT NOT NULL,
+            item_hashes JSONB NOT NULL DEFAULT '{}'::jsonb,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ DEFAULT NOW(),
+            PRIMARY KEY (date, platform, sub_category, kind)
+        )
+    """)
+    conn.commit()
+    conn.close()
+    print("  ✅ ranking_batches")
+    print()
+
+
+def step2_verify():
+    """생성 확인"""
+    print("=" * 60)
+    print("Step 2: 검증")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM ranking_batches")
+    print(f"  ranking_batches: {cursor.fetchone()[0]}행")
+    conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    print("\n🔄 DB 마이그레이션: 랭킹 배치 지문\n")
+    step1_create_table()
+    step2_verify()
+    print("✅ 마이그레이션 완료!")
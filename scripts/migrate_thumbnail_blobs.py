@@ -0,0 +1,179 @@
+"""
+DB 마이그레이션: 썸네일 base64 → 콘텐츠 해시 blob 저장소
+
+works / unified_works 행마다 들고 있던 thumbnail_base64(data URI)를
+blob 저장소(crawler/thumbnail_store.py)로 옮기고 행에는 thumbnail_hash만 남긴다.
+같은 표지는 해시가 같으므로 한 번만 저장된다.
+
+저장소 선택: 환경변수 THUMBNAIL_STORE ('postgres' 기본 | 'local')
+- 크롤러(crawler/thumbnail_store.py)와 dashboard-next(app/api/thumbnail/route.ts)가
+  같은 변수·같은 기본값을 읽는다. 기본을 'postgres'로 둔 이유: 원격 대시보드는
+  DB만 볼 수 있으므로, 어느 쪽도 설정하지 않았을 때 양쪽이 같은 곳을 보게 하려고.
+- 'local'은 크롤러와 대시보드가 같은 디스크를 공유할 때만, 양쪽에
+  THUMBNAIL_STORE=local (+ 필요하면 THUMBNAIL_STORE_DIR)을 같이 설정해서 실행
+
+사용법:
+    python3 scripts/migrate_thumbnail_blobs.py
+"""
+
+import psycopg2
+import psycopg2.extras
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+import os
+
+load_dotenv(project_root / '.env')
+DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
+
+from crawler.thumbnail_store import decode_data_uri, get_store
+
+BATCH_SIZE = 200
+
+
+def get_conn():
+    return psycopg2.connect(DATABASE_URL)
+
+
+def step1_add_columns():
+    """thumbnail_hash 컬럼 + thumbnail_blobs 테이블 생성"""
+    print("=" * 60)
+    print("Step 1: thumbnail_hash 컬럼 / thumbnail_blobs 테이블")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    for table in ('works', 'unified_works'):
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS thumbnail_hash TEXT")
+        print(f"  ✅ {table}.thumbnail_hash")
+    # 썸네일 수집기(crawler/thumbnail_fetcher.py) 조건부 요청용 검증자
+    for col in ('thumbnail_fetched_url', 'thumbnail_etag', 'thumbnail_last_modified'):
+        cursor.execute(f"ALTER TABLE works ADD COLUMN IF NOT EXISTS {col} TEXT")
+        print(f"  ✅ works.{col}")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS thumbnail_blobs (
+            hash TEXT PRIMARY KEY,           -- SHA-256 hex
+            mime TEXT NOT NULL,
+            data BYTEA NOT NULL,
+            size INTEGER NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT NOW()
+        )
+    """)
+    print("  ✅ thumbnail_blobs")
+    conn.commit()
+    conn.close()
+    print()
+
+
+def _migrate_table(table: str, key_cols: str) -> tuple:
+    """
+    table의 thumbnail_base64를 배치 단위로 저장소에 옮기고 해시로 교체
+    반환: (이동 행 수, 디코드 실패 행 수)
+    """
+    store = get_store()
+    conn = get_conn()
+    cursor = conn.cursor()
+    moved = 0
+    broken = 0
+
+    while True:
+        cursor.execute(f"""
+            SELECT {key_cols}, thumbnail_base64 FROM {table}
+            WHERE thumbnail_base64 IS NOT NULL AND thumbnail_base64 != ''
+            LIMIT %s
+        """, (BATCH_SIZE,))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for *key, b64 in rows:
+            data = decode_data_uri(b64)
+            if data:
+                updates.append((store.put(data), *key))
+            else:
+                updates.append((None, *key))  # 깨진 값은 비우고 재다운로드 대상으로
+                broken += 1
+
+        where = ' AND '.join(f"t.{c} = v.{c}" for c in key_cols.split(', '))
+        psycopg2.extras.execute_values(cursor, f"""
+            UPDATE {table} t
+            SET thumbnail_hash = COALESCE(v.hash, t.thumbnail_hash), thumbnail_base64 = NULL
+            FROM (VALUES %s) AS v(hash, {key_cols})
+            WHERE {where}
+        """, updates)
+        conn.commit()
+        moved += len(rows)
+        print(f"  {table}: {moved}행 이동...")
+
+    conn.close()
+    return moved, broken
+
+
+def step2_move_blobs():
+    """기존 base64 → blob 저장소"""
+    print("=" * 60)
+    print("Step 2: thumbnail_base64 → blob 저장소")
+    print("=" * 60)
+
+    for table, key_cols in (('works', 'platform, title'), ('unified_works', 'id')):
+        moved, broken = _migrate_table(table, key_cols)
+        print(f"  ✅ {table}: {moved}행 (디코드 실패 {broken})")
+    print()
+
+
+def step3_create_index():
+    """thumbnail_hash 인덱스"""
+    print("=" * 60)
+    print("Step 3: 인덱스 생성")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_works_thumbnail_hash ON works(thumbnail_hash)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_unified_works_thumbnail_hash ON unified_works(thumbnail_hash)")
+    conn.commit()
+    conn.close()
+    print("  ✅ idx_works_thumbnail_hash, idx_unified_works_thumbnail_hash")
+    print()
+
+
+def step4_verify():
+    """이동 결과 + 중복 제거 통계"""
+    print("=" * 60)
+    print("Step 4: 검증")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    for table in ('works', 'unified_works'):
+        cursor.execute(f"""
+            SELECT COUNT(thumbnail_hash), COUNT(DISTINCT thumbnail_hash),
+                   COUNT(*) FILTER (WHERE thumbnail_base64 IS NOT NULL AND thumbnail_base64 != '')
+            FROM {table}
+        """)
+        refs, distinct, leftover = cursor.fetchone()
+        print(f"  {table}: 해시 {refs}행 / 고유 이미지 {distinct}개 / 남은 base64 {leftover}행")
+    cursor.execute("""
+        SELECT COUNT(DISTINCT h) FROM (
+            SELECT thumbnail_hash AS h FROM works WHERE thumbnail_hash IS NOT NULL
+            UNION ALL
+            SELECT thumbnail_hash FROM unified_works WHERE thumbnail_hash IS NOT NULL
+        ) s
+    """)
+    print(f"  전체 고유 이미지: {cursor.fetchone()[0]}개")
+    conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    print("\n🔄 DB 마이그레이션: 썸네일 blob 저장소\n")
+    step1_add_columns()
+    step2_move_blobs()
+    step3_create_index()
+    step4_verify()
+    print("✅ 마이그레이션 완료!")
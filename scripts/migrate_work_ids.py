@@ -0,0 +1,200 @@
+"""
+DB 마이그레이션: rankings/reviews에 정수 작품 키(work_id) 추가 + 백필
+
+1. rankings.work_id, reviews.work_id 컬럼 추가 (works.id FK)
+2. rankings에만 있고 works에 없는 (platform, title) → works 최소 행 생성
+3. rankings.work_id 백필 (platform + title 정확 조인)
+4. reviews.work_id 백필 (정확 조인 → 남은 행은 WorkResolver 정규화 매칭, 퍼지는 후보 로그만)
+5. 인덱스 생성 (대시보드 핫 쿼리용)
+6. 검증
+
+사용법:
+    python3 scripts/migrate_work_ids.py
+"""
+
+import psycopg2
+import psycopg2.extras
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+import os
+
+from crawler.work_resolver import WorkResolver
+
+load_dotenv(project_root / '.env')
+DATABASE_URL = os.environ.get('SUPABASE_DB_URL', '')
+
+
+def get_conn():
+    return psycopg2.connect(DATABASE_URL)
+
+
+def step1_add_columns():
+    """rankings / reviews에 work_id 컬럼 추가"""
+    print("=" * 60)
+    print("Step 1: work_id 컬럼 추가")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+
+    for table in ('rankings', 'reviews'):
+        try:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN work_id INTEGER REFERENCES works(id)")
+            conn.commit()
+            print(f"  + {table}.work_id")
+        except psycopg2.errors.DuplicateColumn:
+            conn.rollback()
+            print(f"  - {table}.work_id (이미 존재)")
+
+    conn.close()
+    print()
+
+
+def step2_create_missing_works():
+    """rankings에만 있는 작품을 works에 등록 (id 발급용)"""
+    print("=" * 60)
+    print("Step 2: 누락 works 행 생성")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO works (platform, title, url, genre, updated_at)
+        SELECT DISTINCT ON (r.platform, r.title)
+            r.platform, r.title, r.url, r.genre, NOW()
+        FROM rankings r
+        LEFT JOIN works w ON r.platform = w.platform AND r.title = w.title
+        WHERE w.title IS NULL
+        ORDER BY r.platform, r.title, r.date DESC
+        ON CONFLICT (platform, title) DO NOTHING
+    """)
+    print(f"  ✅ 신규 works {cursor.rowcount}개 생성")
+    conn.commit()
+    conn.close()
+    print()
+
+
+def step3_backfill_rankings():
+    """rankings.work_id 백필"""
+    print("=" * 60)
+    print("Step 3: rankings.work_id 백필")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE rankings r
+        SET work_id = w.id
+        FROM works w
+        WHERE w.platform = r.platform AND w.title = r.title
+          AND r.work_id IS NULL
+    """)
+    print(f"  ✅ rankings {cursor.rowcount}행 연결")
+    conn.commit()
+    conn.close()
+    print()
+
+
+def step4_backfill_reviews():
+    """reviews.work_id 백필 (정확 조인 + 리졸버 보정)"""
+    print("=" * 60)
+    print("Step 4: reviews.work_id 백필")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE reviews r
+        SET work_id = w.id
+        FROM works w
+        WHERE w.platform = r.platform AND w.title = r.work_title
+          AND r.work_id IS NULL
+    """)
+    print(f"  ✅ 정확 매칭: {cursor.rowcount}행")
+
+    # 제목 표기가 다른 리뷰는 플랫폼별 리졸버로 매칭
+    cursor.execute("""
+        SELECT DISTINCT platform, work_title FROM reviews
+        WHERE work_id IS NULL
+    """)
+    by_platform = defaultdict(list)
+    for platform, work_title in cursor.fetchall():
+        by_platform[platform].append(work_title)
+
+    pairs = []
+    for platform, titles in by_platform.items():
+        resolver = WorkResolver(platform)
+        resolver.load(cursor)
+        for t in titles:
+            _, work_id = resolver.resolve(t)
+            if work_id is not None:
+                pairs.append((platform, t, work_id))
+
+    if pairs:
+        psycopg2.extras.execute_values(cursor, """
+            UPDATE reviews r
+            SET work_id = v.work_id
+            FROM (VALUES %s) AS v(platform, work_title, work_id)
+            WHERE r.platform = v.platform AND r.work_title = v.work_title
+              AND r.work_id IS NULL
+        """, pairs)
+        print(f"  ✅ 리졸버 매칭: {len(pairs)}개 제목 ({cursor.rowcount}행)")
+
+    unresolved = sum(len(t) for t in by_platform.values()) - len(pairs)
+    if unresolved:
+        print(f"  ⚠️  미해결 제목: {unresolved}개 (works에 없는 작품)")
+
+    conn.commit()
+    conn.close()
+    print()
+
+
+def step5_create_indexes():
+    """정수 키 인덱스 생성"""
+    print("=" * 60)
+    print("Step 5: 인덱스 생성")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_rankings_work_date ON rankings(work_id, date)")
+    print("  + idx_rankings_work_date")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_work ON reviews(work_id)")
+    print("  + idx_reviews_work")
+    conn.commit()
+    conn.close()
+    print()
+
+
+def step6_verify():
+    """마이그레이션 결과 검증"""
+    print("=" * 60)
+    print("Step 6: 검증")
+    print("=" * 60)
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    for table in ('rankings', 'reviews'):
+        cursor.execute(f"SELECT COUNT(*), COUNT(work_id) FROM {table}")
+        total, linked = cursor.fetchone()
+        pct = linked * 100 / total if total else 100
+        print(f"  {table}: {linked}/{total}행 연결 ({pct:.1f}%)")
+    conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    print("\n🔄 DB 마이그레이션: 정수 작품 키(work_id)\n")
+    step1_add_columns()
+    step2_create_missing_works()
+    step3_backfill_rankings()
+    step4_backfill_reviews()
+    step5_create_indexes()
+    step6_verify()
+    print("✅ 마이그레이션 완료!")
@@ -0,0 +1,130 @@
+"""장르 번역 메모이제이션/벡터화 결과 동일성 테스트
+
+data/backup/*/*.json 에 등장한 모든 장르 + GENRE_TRANSLATIONS 키 조합에 대해
+기존 선형 탐색 구현과 translate_genre / translate_genre_series 결과를 비교한다.
+
+백업이 하나도 없으면 실제 장르를 검증하지 못하므로 실패 처리한다.
+(합성 케이스만 돌리려면 --synthetic-only)
+
+실행:
+    python3 scripts/test_genre_translation.py
+    python3 scripts/test_genre_translation.py --synthetic-only
+"""
+import argparse
+import json
+import sys
+from itertools import permutations
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from crawler.utils import GENRE_TRANSLATIONS, translate_genre, translate_genre_series
+
+
+def legacy_translate_genre(jp_genre: str) -> str:
+    """변경 전 translate_genre (기준 구현)"""
+    if not jp_genre:
+        return ""
+
+    if ' / ' in jp_genre or '/' in jp_genre:
+        separator = ' / ' if ' / ' in jp_genre else '/'
+        genres = jp_genre.split(separator)
+        translated = []
+
+        for genre in genres:
+            genre = genre.strip()
+            if genre in GENRE_TRANSLATIONS:
+                translated.append(GENRE_TRANSLATIONS[genre])
+            else:
+                found = False
+                for jp, kr in GENRE_TRANSLATIONS.items():
+                    if jp in genre:
+                        translated.append(kr)
+                        found = True
+                        break
+                if not found:
+                    translated.append(genre)
+
+        return ' / '.join(translated)
+
+    jp_genre = jp_genre.strip()
+    if jp_genre in GENRE_TRANSLATIONS:
+        return GENRE_TRANSLATIONS[jp_genre]
+    for jp, kr in GENRE_TRANSLATIONS.items():
+        if jp in jp_genre:
+            return kr
+    return jp_genre
+
+
+def collect_backup_genres() -> set:
+    """JSON 백업에 등장한 장르 문자열 전체"""
+    genres = set()
+    for path in (project_root / 'data' / 'backup').glob('*/*.json'):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            continue
+        for item in items if isinstance(items, list) else []:
+            for key in ('genre', 'genres'):
+                g = item.get(key) if isinstance(item, dict) else None
+                if isinstance(g, str):
+                    genres.add(g)
+    return genres
+
+
+def synthetic_genres() -> set:
+    """사전 키 + 복합/부분/공백 변형"""
+    keys = list(GENRE_TRANSLATIONS.keys())
+    genres = set(keys)
+    genres.update(f' {k} ' for k in keys)
+    genres.update(f'{k}系' for k in keys)
+    for a, b in permutations(keys[:12], 2):
+        genres.add(f'{a} / {b}')
+        genres.add(f'{a}/{b}')
+        genres.add(f'{a}/ {b}')
+    genres.update(['', ' ', '/', ' / ', '알 수 없는 장르', 'ヒューマンドラマ系', '異世界ファンタジー'])
+    return genres
+
+
+def main():
+    parser = argparse.ArgumentParser(description='장르 번역 결과 동일성 테스트')
+    parser.add_argument('--synthetic-only', action='store_true',
+                        help='백업 없이 합성 케이스만 비교')
+    args = parser.parse_args()
+
+    backup = collect_backup_genres()
+    if not backup:
+        if not args.synthetic_only:
+            print("❌ data/backup/*/*.json 에서 장르를 찾지 못함 — 실제 장르 미검증")
+            print("   (백업 위치 확인, 또는 합성 케이스만 돌리려면 --synthetic-only)")
+            sys.exit(1)
+        print("⚠️  ⏭️  백업 장르 없음 — 실제 장르 비교 스킵, 합성 케이스만 검증")
+    genres = sorted(backup | synthetic_genres())
+    print(f"백업 장르 {len(backup)}개 + 합성 케이스 → 총 {len(genres)}개 비교")
+
+    mismatches = [(g, legacy_translate_genre(g), translate_genre(g))
+                  for g in genres if legacy_translate_genre(g) != translate_genre(g)]
+    for g, old, new in mismatches[:20]:
+        print(f"  ❌ {g!r}: {old!r} != {new!r}")
+
+    try:
+        import pandas as pd
+        series = pd.Series(genres + [None, float('nan')] + genres[:50])
+        expected = [legacy_translate_genre(g) if isinstance(g, str) else '' for g in series]
+        vec = translate_genre_series(series).tolist()
+        vec_bad = sum(1 for a, b in zip(expected, vec) if a != b)
+        print(f"  translate_genre_series 불일치: {vec_bad}개")
+    except ImportError:
+        vec_bad = 0
+        print("  ⏭️  pandas 없음 — 벡터화 비교 스킵")
+
+    if mismatches or vec_bad:
+        print(f"❌ 불일치 {len(mismatches) + vec_bad}개")
+        sys.exit(1)
+    print("✅ 기존 구현과 결과 동일")
+
+
+if __name__ == "__main__":
+    main()